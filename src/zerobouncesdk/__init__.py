@@ -10,13 +10,36 @@ from .zb_validate_status import ZBValidateStatus
 from .zb_validate_sub_status import ZBValidateSubStatus
 from .zb_validate_response import ZBValidateResponse
 from .zb_validate_batch_element import ZBValidateBatchElement
+from .zb_compact_validate_response import ZBCompactValidateResponse, ZBCompactValidateBatchEmail
+from .zb_lazy_validate_response import ZBLazyValidateResponse, ZBLazyValidateBatchEmail
 from .zb_validate_batch_response import ZBValidateBatchResponse, ZBValidateBatchEmail, ZBValidateBatchError
+from .zb_validate_batch_columns import ZBValidateBatchColumns
 from .zb_send_file_response import ZBSendFileResponse
+from .zb_sharded_send_file_response import ZBShardedSendFileResponse
 from .zb_file_status_response import ZBFileStatusResponse
 from .zb_get_file_response import ZBGetFileResponse
+from .zb_file_result_row import ZBFileResultRow
 from .zb_delete_file_response import ZBDeleteFileResponse
 from .zb_guess_format_response import ZBGuessFormatResponse
 from .zb_find_email_format_response import ZBFindEmailFormatResponse
 from .zb_find_domain_response import ZBFindDomainResponse
+from .zb_validate_cache import (
+    ZBCacheBackend,
+    ZBMemoryCacheBackend,
+    ZBSqliteCacheBackend,
+    ZBValidateCache,
+)
+from .zb_result_store import ZBResultStore
+from .zb_domain_format_cache import ZBDomainFormatCache
+from .zb_rate_limiter import ZBRateLimiter
+from .zb_retry_policy import ZBRetryPolicy
+from .zb_mx_pre_screen import ZBMxPreScreen
+from .zb_email_normalizer import ZBEmailNormalizer
+from .zb_deduplicator import ZBDeduplicator
+from .zb_pre_filter import ZBPreFilter
+from .zb_region_failover import ZBRegionFailover
 
 from .zerobouncesdk import ZeroBounce
+from .zb_validate_dispatcher import ZBValidateDispatcher
+from .zb_bulk_job_runner import ZBBulkJob, ZBBulkJobRunner
+from .zerobouncesdk_async import AsyncZeroBounce
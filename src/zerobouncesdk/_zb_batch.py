@@ -0,0 +1,153 @@
+"""Helpers for splitting addresses into validatebatch requests and merging the results."""
+
+from collections import Counter, deque
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Union
+
+from .zb_validate_batch_element import ZBValidateBatchElement
+from .zb_validate_batch_response import (
+    ZBValidateBatchEmail,
+    ZBValidateBatchError,
+    ZBValidateBatchResponse,
+)
+
+if TYPE_CHECKING:
+    from .zb_deduplicator import ZBDeduplicator
+
+VALIDATE_BATCH_MAX_SIZE = 100
+"""The maximum number of addresses the API accepts in one validatebatch call."""
+
+MISSING_RESULT_ERROR = "No result returned for this email address"
+EXPIRED_DUPLICATE_ERROR = "Duplicate of an address whose result is no longer kept"
+
+
+def to_batch_element(item: Union[str, ZBValidateBatchElement]) -> ZBValidateBatchElement:
+    if isinstance(item, ZBValidateBatchElement):
+        return item
+    return ZBValidateBatchElement(item)
+
+
+def chunk_batch_elements(
+    items: Iterable[Union[str, ZBValidateBatchElement]],
+    size: int = VALIDATE_BATCH_MAX_SIZE,
+) -> Iterator[List[ZBValidateBatchElement]]:
+    """Lazily groups addresses into lists of at most `size` batch elements."""
+    iterator = iter(items)
+    while True:
+        chunk = [to_batch_element(item) for item in islice(iterator, size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def match_batch_results(
+    elements: List[ZBValidateBatchElement],
+    response: ZBValidateBatchResponse,
+) -> List[Union[ZBValidateBatchEmail, ZBValidateBatchError]]:
+    """Returns one result per element, in the order the elements were sent.
+
+    Results are matched on the case-insensitive address. An error whose
+    email_address is ``all`` (e.g. an invalid API key) applies to every element
+    without a result; anything still unmatched gets a synthetic error.
+    Addresses repeated in one batch share the result if the API answers once.
+    """
+    by_address = {}
+    for result in response.email_batch:
+        by_address.setdefault((result.address or "").strip().lower(), []).append(result)
+    blanket_error = None
+    for error in response.errors:
+        address = (error.email_address or "").strip().lower()
+        if address == "all":
+            blanket_error = error
+        else:
+            by_address.setdefault(address, []).append(error)
+
+    matched = []
+    for element in elements:
+        candidates = by_address.get(element.email_address.strip().lower())
+        if candidates:
+            # The API may answer a repeated address once; share the last result
+            matched.append(candidates.pop(0) if len(candidates) > 1 else candidates[0])
+        elif blanket_error is not None:
+            matched.append(blanket_error)
+        else:
+            matched.append(ZBValidateBatchError({
+                "email_address": element.email_address,
+                "error": MISSING_RESULT_ERROR,
+            }))
+    return matched
+
+
+def with_local_results(
+    response_class: Callable[[dict], ZBValidateBatchResponse],
+    local_results: List[dict],
+) -> Callable[[dict], ZBValidateBatchResponse]:
+    """Wraps a response class so the results decided locally join the email_batch the API sent."""
+    def build(data: dict) -> ZBValidateBatchResponse:
+        data["email_batch"] = list(data.get("email_batch") or []) + local_results
+        return response_class(data)
+    return build
+
+
+class DuplicateFanOut:
+    """Sends only the first occurrence of each address and gives its result to the duplicates.
+
+    `unique` filters the input stream, logging every address as it goes;
+    results of the unique addresses are passed to `add` in order, and `drain`
+    returns every result that can be given out in input order so far. The
+    results are kept on the deduplicator, so they outlive one call.
+
+    A Bloom filter hit with no result kept and no earlier occurrence awaiting
+    its result may be a false positive, so that address is sent as well.
+    """
+
+    def __init__(self, deduplicator: "ZBDeduplicator"):
+        self._deduplicator = deduplicator
+        self._order = deque()
+        self._ready = deque()
+        self._pending = Counter()  # keys of the sent addresses still awaiting their result
+
+    def unique(
+        self, items: Iterable[Union[str, ZBValidateBatchElement]]
+    ) -> Iterator[ZBValidateBatchElement]:
+        deduplicator = self._deduplicator
+        for item in items:
+            element = to_batch_element(item)
+            key = deduplicator.key(element.email_address)
+            is_new = deduplicator.add_key(key)
+            result = None
+            if not is_new and not self._pending[key]:
+                result = deduplicator.result_for(key)
+                if result is None and deduplicator.mode == deduplicator.BLOOM:
+                    deduplicator.recount_as_unique()
+                    is_new = True
+            self._order.append((key, element, is_new, result))
+            if is_new:
+                self._pending[key] += 1
+                yield element
+
+    def add(self, result: Union[ZBValidateBatchEmail, ZBValidateBatchError]):
+        self._ready.append(result)
+
+    def drain(self) -> List[Union[ZBValidateBatchEmail, ZBValidateBatchError]]:
+        drained = []
+        while self._order:
+            key, element, is_new, result = self._order[0]
+            if is_new:
+                if not self._ready:
+                    break
+                result = self._ready.popleft()
+                self._deduplicator.remember_result(key, result)
+                self._pending[key] -= 1
+                if not self._pending[key]:
+                    del self._pending[key]
+            elif result is None:
+                result = self._deduplicator.result_for(key)
+                if result is None:
+                    result = ZBValidateBatchError({
+                        "email_address": element.email_address,
+                        "error": EXPIRED_DUPLICATE_ERROR,
+                    })
+            self._order.popleft()
+            drained.append(result)
+        return drained
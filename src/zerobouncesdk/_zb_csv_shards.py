@@ -0,0 +1,154 @@
+"""Splits a CSV into shards for parallel sendfile jobs and merges their results."""
+
+import csv
+import io
+import os
+import shutil
+import tempfile
+from typing import BinaryIO, Iterator, List, Union
+
+from ._zb_download import part_path_for
+from ._zb_multipart import _remaining_size
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def iter_csv_records(stream: BinaryIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[bytes]:
+    """Yields the raw bytes of each CSV record, line break included.
+
+    A record ends at a ``\\n`` outside of a quoted field, so quoted fields that
+    span several lines stay in one record.
+    """
+    record = bytearray()
+    quotes = 0
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            record += line + b"\n"
+            quotes += line.count(b'"')
+            if quotes % 2:
+                continue  # a quoted field spans this line break
+            yield bytes(record)
+            record, quotes = bytearray(), 0
+    record += pending
+    if record:
+        # the last record may lack its line break
+        yield bytes(record) if record.endswith(b"\n") else bytes(record) + b"\n"
+
+
+def is_blank(record: bytes) -> bool:
+    return not record.strip(b" \t\r\n,")
+
+
+def record_field(record: bytes, column: int) -> str:
+    """The stripped value of the 1-based `column` of a CSV record, or "" when it is missing."""
+    fields = next(csv.reader(io.StringIO(record.decode("utf-8", errors="replace"))), [])
+    return fields[column - 1].strip() if len(fields) >= column else ""
+
+
+class CsvShards:
+    """Splits a CSV file or stream into at most `count` shard files of similar size.
+
+    The records keep their order: the first shard holds the first records, and
+    so on. With `has_header_row`, the header row is repeated at the top of every
+    shard so the column mapping is the same for each one. Blank records are
+    dropped. The shards live in a temporary directory removed by `close`.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, BinaryIO],
+        count: int,
+        has_header_row: bool,
+        file_name: str,
+    ):
+        self._directory = tempfile.mkdtemp(prefix="zb-shards-")
+        try:
+            if isinstance(source, (str, os.PathLike)):
+                with open(source, "rb") as stream:
+                    self.paths = self._split(stream, count, has_header_row, file_name)
+            else:
+                self.paths = self._split(source, count, has_header_row, file_name)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _split(self, stream: BinaryIO, count: int, has_header_row: bool, file_name: str) -> List[str]:
+        size = _remaining_size(stream)
+        if size is not None:
+            return self._write_shards(stream, size, count, has_header_row, file_name)
+        # not seekable: spool it first so the shard size can be computed
+        with open(os.path.join(self._directory, "source"), "w+b") as spooled:
+            shutil.copyfileobj(stream, spooled, _CHUNK_SIZE)
+            size = spooled.tell()
+            spooled.seek(0)
+            return self._write_shards(spooled, size, count, has_header_row, file_name)
+
+    def _write_shards(
+        self, stream: BinaryIO, size: int, count: int, has_header_row: bool, file_name: str
+    ) -> List[str]:
+        stem, extension = os.path.splitext(os.path.basename(file_name))
+        records = iter_csv_records(stream)
+        header = next(records, b"") if has_header_row else b""
+        target = max(1, -(-(size - len(header)) // count))
+        paths, shard, written = [], None, 0
+        try:
+            for record in records:
+                if is_blank(record):
+                    continue
+                if shard is None or (written >= target and len(paths) < count):
+                    if shard is not None:
+                        shard.close()
+                    paths.append(os.path.join(self._directory, f"{stem}.part{len(paths) + 1}{extension}"))
+                    shard = open(paths[-1], "wb")
+                    shard.write(header)
+                    written = 0
+                shard.write(record)
+                written += len(record)
+        finally:
+            if shard is not None:
+                shard.close()
+        return paths
+
+
+def merge_result_files(paths: List[str], download_path: str):
+    """Concatenates shard result files into ``download_path``, keeping one header row.
+
+    Every results file starts with a header row; only the first one is kept.
+    The merged file is written next to ``download_path`` and renamed over it
+    once complete.
+    """
+    dirname = os.path.dirname(download_path)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
+    part_path = part_path_for(download_path)
+    try:
+        with open(part_path, "wb") as merged:
+            for index, path in enumerate(paths):
+                with open(path, "rb") as results:
+                    records = iter_csv_records(results)
+                    if index:
+                        next(records, None)
+                    for record in records:
+                        merged.write(record)
+        os.replace(part_path, download_path)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except FileNotFoundError:
+            pass
+        raise
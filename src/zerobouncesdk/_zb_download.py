@@ -0,0 +1,150 @@
+"""Streams a getfile response body to disk without holding it in memory."""
+
+import os
+import re
+from typing import Callable, Mapping, Optional, Tuple
+
+from .zb_exceptions import ZBApiException
+
+_WHITESPACE = b" \t\r\n"
+_CONTENT_RANGE = re.compile(r"^\s*bytes\s+(\d+)-(\d+)/(\d+|\*)\s*$", re.IGNORECASE)
+
+
+def may_be_error_body(status_code: int, content_type: str, head: bytes) -> bool:
+    """Whether a getfile body has to be read whole and checked for a JSON error.
+
+    `head` must hold at least one non-whitespace byte of the body.
+    """
+    return (
+        status_code > 299
+        or "application/json" in content_type.lower()
+        or head.lstrip(_WHITESPACE).startswith(b"{")
+    )
+
+
+def part_path_for(download_path: str) -> str:
+    return download_path + ".part"
+
+
+def resume_request_headers(download_path: str) -> Tuple[dict, int]:
+    """The headers resuming from an existing part file, and the offset they ask for.
+
+    Compression is turned off so that byte offsets match what is on disk.
+    """
+    headers = {"Accept-Encoding": "identity"}
+    try:
+        offset = os.path.getsize(part_path_for(download_path))
+    except OSError:
+        offset = 0
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    return headers, offset
+
+
+def resume_plan(
+    status_code: int, headers: Mapping[str, str], requested_offset: int
+) -> Tuple[Optional[int], Optional[int]]:
+    """Decides how to write a getfile response given the offset that was requested.
+
+    Returns the offset to append the body at (0 to start over) and the expected
+    final size when the headers tell it. An offset of None means the server could
+    not serve the requested range and the download must be restarted without one.
+    """
+    if status_code == 416 and requested_offset:
+        return None, None
+    if status_code == 206:
+        match = _CONTENT_RANGE.match(headers.get("Content-Range") or "")
+        if not match or int(match.group(1)) != requested_offset:
+            return None, None
+        total = match.group(3)
+        return requested_offset, None if total == "*" else int(total)
+    encoding = (headers.get("Content-Encoding") or "identity").lower()
+    length = headers.get("Content-Length")
+    if encoding == "identity" and length and length.isdigit():
+        return 0, int(length)
+    return 0, None
+
+
+class GetFileDownload:
+    """Writes a getfile body to ``download_path`` through a ``.part`` file.
+
+    Feed it the body chunk by chunk. Only a body that may be a JSON error payload
+    (error status, JSON Content-Type or a leading ``{``) is kept in memory so
+    `check_body` can inspect it; anything else goes straight to disk. `finish`
+    renames the part file over ``download_path`` once the body is complete.
+
+    With a `resume_offset`, the body continues an existing part file. With an
+    `expected_size`, `finish` raises if the file on disk does not have that size.
+    With `keep_part`, `abort` leaves the part file in place for a later resume.
+    """
+
+    def __init__(
+        self,
+        download_path: str,
+        status_code: int,
+        content_type: str,
+        check_body: Callable[[int, bytes, str], None],
+        resume_offset: int = 0,
+        expected_size: Optional[int] = None,
+        keep_part: bool = False,
+    ):
+        self.download_path = download_path
+        self.part_path = part_path_for(download_path)
+        self._status_code = status_code
+        self._content_type = content_type
+        self._check_body = check_body
+        self._resume_offset = resume_offset
+        self._expected_size = expected_size
+        self._keep_part = keep_part
+        self._head = bytearray()
+        # a resumed body starts mid-file, so there is nothing to sniff
+        self._buffering = False if resume_offset else None
+        self._file = None
+
+    def feed(self, chunk: bytes):
+        if not chunk:
+            return
+        if self._file is not None:
+            self._file.write(chunk)
+            return
+        self._head += chunk
+        if self._buffering is None:
+            if not bytes(self._head).strip(_WHITESPACE):
+                return
+            self._buffering = may_be_error_body(
+                self._status_code, self._content_type, bytes(self._head)
+            )
+        if not self._buffering:
+            self._open().write(self._head)
+            self._head = bytearray()
+
+    def finish(self):
+        if self._file is None:
+            if not self._resume_offset:
+                self._check_body(self._status_code, bytes(self._head), self._content_type)
+            self._open().write(self._head)
+        self._file.close()
+        if self._expected_size is not None:
+            size = os.path.getsize(self.part_path)
+            if size != self._expected_size:
+                raise ZBApiException(
+                    f"Incomplete getfile download: received {size} of {self._expected_size} bytes"
+                )
+        os.replace(self.part_path, self.download_path)
+
+    def abort(self):
+        if self._file is not None:
+            self._file.close()
+            if self._keep_part:
+                return
+            try:
+                os.remove(self.part_path)
+            except FileNotFoundError:
+                pass
+
+    def _open(self):
+        dirname = os.path.dirname(self.download_path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        self._file = open(self.part_path, "ab" if self._resume_offset else "wb")
+        return self._file
@@ -0,0 +1,109 @@
+"""Incremental parsing of a getfile results body into `ZBFileResultRow` objects."""
+
+import codecs
+import csv
+from typing import Callable, List, Optional
+
+from ._zb_download import may_be_error_body
+from .zb_file_result_row import ZBFileResultRow
+
+_WHITESPACE = b" \t\r\n"
+
+
+class FileResultRowParser:
+    """Turns getfile body chunks into rows as soon as each CSV record is complete.
+
+    The first record is the header row. The email address is read from the
+    1-based `email_address_column`, or else from the "Email Address" column, or
+    else from the first column. Bodies that may be a JSON error payload are read
+    whole and handed to `check_body` before anything is parsed.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        content_type: str,
+        check_body: Callable[[int, bytes, str], None],
+        email_address_column: Optional[int] = None,
+    ):
+        self._status_code = status_code
+        self._content_type = content_type
+        self._check_body = check_body
+        self._email_address_column = email_address_column
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        self._head = bytearray()
+        self._buffering = None
+        self._text = ""
+        self._record = []
+        self._quotes = 0
+        self._header = None
+        self._email_index = 0
+
+    def feed(self, chunk: bytes) -> List[ZBFileResultRow]:
+        if not chunk:
+            return []
+        if self._buffering is not False:
+            self._head += chunk
+            if self._buffering is None:
+                if not bytes(self._head).strip(_WHITESPACE):
+                    return []
+                self._buffering = may_be_error_body(
+                    self._status_code, self._content_type, bytes(self._head)
+                )
+            if self._buffering:
+                return []
+            chunk, self._head = bytes(self._head), bytearray()
+        return self._parse_text(self._decoder.decode(chunk))
+
+    def finish(self) -> List[ZBFileResultRow]:
+        rows = []
+        if self._buffering is not False:
+            self._check_body(self._status_code, bytes(self._head), self._content_type)
+            rows = self._parse_text(self._decoder.decode(bytes(self._head)))
+        rows += self._parse_text(self._decoder.decode(b"", final=True), final=True)
+        return rows
+
+    def _parse_text(self, text: str, final: bool = False) -> List[ZBFileResultRow]:
+        self._text += text
+        # records end at "\n" (or "\r\n") only, like iter_csv_records and the csv
+        # module: str.splitlines would also break on \x0b, \x1c, \u2028 and others
+        *lines, rest = self._text.split("\n")
+        lines = [line + "\n" for line in lines]
+        # keep an unterminated last line until more text arrives
+        if final and rest:
+            lines.append(rest)
+        self._text = "" if final else rest
+        rows = []
+        for line in lines:
+            self._record.append(line)
+            self._quotes += line.count('"')
+            if self._quotes % 2:
+                continue  # a quoted field spans this line break
+            row = self._parse_record(self._record)
+            self._record, self._quotes = [], 0
+            if row is not None:
+                rows.append(row)
+        if final and self._record:
+            row = self._parse_record(self._record)
+            self._record, self._quotes = [], 0
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def _parse_record(self, lines: List[str]) -> Optional[ZBFileResultRow]:
+        values = next(csv.reader(lines), None)
+        if not values or not any(value.strip() for value in values):
+            return None
+        if self._header is None:
+            self._header = values
+            self._email_index = self._find_email_index(values)
+            return None
+        return ZBFileResultRow(self._header, values, self._email_index)
+
+    def _find_email_index(self, header: List[str]) -> int:
+        if self._email_address_column is not None:
+            return self._email_address_column - 1
+        for index, name in enumerate(header):
+            if name.strip().lower() == "email address":
+                return index
+        return 0
@@ -0,0 +1,55 @@
+"""The JSON decoder used for API responses.
+
+orjson, or else ujson, is used when it is installed: both parse several times
+faster than the standard library. Every backend raises a ValueError (or a
+subclass of it) on invalid input.
+"""
+
+import json
+import re
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the environment
+    ujson = None
+
+JsonLoads = Callable[[Union[bytes, str]], Any]
+
+if orjson is not None:
+    loads: JsonLoads = orjson.loads
+    BACKEND = "orjson"
+elif ujson is not None:  # pragma: no cover - depends on the environment
+    loads = ujson.loads
+    BACKEND = "ujson"
+else:  # pragma: no cover - depends on the environment
+    loads = json.loads
+    BACKEND = "json"
+
+_FIRST_BYTE = re.compile(rb"[^ \t\r\n]")
+_FIRST_CHAR = re.compile(r"[^ \t\r\n]")
+
+
+def starts_like_object(body: Union[bytes, str]) -> bool:
+    """Whether the first non-whitespace character of `body` is ``{``, without copying it."""
+    match = (_FIRST_BYTE if isinstance(body, (bytes, bytearray)) else _FIRST_CHAR).search(body)
+    return match is not None and match.group() in (b"{", "{")
+
+
+def loads_object(body: Union[bytes, str], json_loads: Optional[JsonLoads] = None) -> Optional[dict]:
+    """The JSON object in `body`, or None when it is not one.
+
+    The body is only decoded when it starts like a JSON object.
+    """
+    if not starts_like_object(body):
+        return None
+    try:
+        decoded = (json_loads or loads)(body)
+    except ValueError:
+        return None
+    return decoded if isinstance(decoded, dict) else None
@@ -0,0 +1,131 @@
+"""A multipart/form-data request body that streams its file part in chunks."""
+
+import io
+import os
+import uuid
+from typing import BinaryIO, Callable, Iterator, Optional
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+"""Called with the number of body bytes sent so far and the total, if known."""
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _remaining_size(stream: BinaryIO) -> Optional[int]:
+    try:
+        if not stream.seekable():
+            return None
+        position = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class MultipartFileStream:
+    """The body of a sendfile request: form fields followed by one file part.
+
+    The fields are encoded like requests does it (``str(value)``), while the file
+    is read `chunk_size` bytes at a time, so memory use does not depend on the file
+    size. The body can be read with `read` (requests), or iterated with ``for`` or
+    through `aiter_chunks` (httpx). When the size of `file_stream` can be determined the
+    body length is available as `len`, otherwise it is None and the body is sent
+    with chunked transfer encoding.
+    """
+
+    def __init__(
+        self,
+        fields: dict,
+        file_field: str,
+        file_name: str,
+        file_stream: BinaryIO,
+        file_content_type: str = "text/csv",
+        chunk_size: int = 64 * 1024,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        self.fields = dict(fields)
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._file_stream = file_stream
+        self._chunk_size = chunk_size
+        self._progress = progress
+        self._sent = 0
+
+        head = io.BytesIO()
+        for name, value in self.fields.items():
+            head.write(
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(str(name))}"\r\n\r\n'.encode()
+            )
+            head.write(value if isinstance(value, bytes) else str(value).encode())
+            head.write(b"\r\n")
+        head.write(
+            f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(file_field)}"; '
+            f'filename="{_quote(file_name)}"\r\nContent-Type: {file_content_type}\r\n\r\n'.encode()
+        )
+        self._head = head.getvalue()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+
+        file_size = _remaining_size(file_stream)
+        self.len = None if file_size is None else len(self._head) + file_size + len(self._tail)
+        self._start = None if file_size is None else file_stream.tell()
+        self._parts = self._iter_parts()
+        self._pending = b""
+
+    def rewind(self) -> bool:
+        """Starts the body over, if the file stream can seek back. Returns whether it did."""
+        if self._start is None:
+            return False
+        self._file_stream.seek(self._start)
+        self._parts = self._iter_parts()
+        self._pending = b""
+        self._sent = 0
+        return True
+
+    @property
+    def headers(self) -> dict:
+        headers = {"Content-Type": self.content_type}
+        if self.len is not None:
+            headers["Content-Length"] = str(self.len)
+        return headers
+
+    def _iter_parts(self) -> Iterator[bytes]:
+        yield self._head
+        while True:
+            chunk = self._file_stream.read(self._chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        yield self._tail
+
+    def _next_part(self) -> bytes:
+        part = next(self._parts, b"")
+        if part:
+            self._sent += len(part)
+            if self._progress is not None:
+                self._progress(self._sent, self.len)
+        return part
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return self._pending + b"".join(iter(self._next_part, b""))
+        while len(self._pending) < size:
+            part = self._next_part()
+            if not part:
+                break
+            self._pending += part
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self._pending:
+            data, self._pending = self._pending, b""
+            yield data
+        yield from iter(self._next_part, b"")
+
+    async def aiter_chunks(self):
+        """The body as an async iterator, which httpx needs for an AsyncClient."""
+        for part in self:
+            yield part
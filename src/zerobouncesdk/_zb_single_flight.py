@@ -0,0 +1,56 @@
+"""Collapses concurrent identical calls into one (a.k.a. request coalescing)."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads.
+
+    Callers arriving while a call for the same key is in flight wait for it and
+    receive its result or exception instead of starting their own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+    def __len__(self):
+        return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """The asyncio version of `SingleFlight`, for coroutines of one event loop."""
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, coroutine_fn):
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(coroutine_fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # a cancelled waiter must not cancel the call the others are waiting on
+        return await asyncio.shield(task)
+
+    def __len__(self):
+        return len(self._calls)
@@ -1,6 +1,39 @@
 """Utility functions for ZeroBounce SDK."""
 
 import warnings
+from datetime import datetime
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _enum_values(enum_class) -> dict:
+    return {member.value: member for member in enum_class}
+
+
+_ISO_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def parse_datetime(value: str, fmt: str) -> datetime:
+    """Same as ``datetime.strptime(value, fmt)``, but faster for the API's timestamps.
+
+    Values shaped like `fmt` when it is ``%Y-%m-%d %H:%M:%S.%f`` are parsed in C by
+    ``datetime.fromisoformat``; anything else, or anything it reads as timezone-aware,
+    goes through strptime so the result does not change.
+    """
+    if (
+        fmt == _ISO_FORMAT
+        and isinstance(value, str)
+        and 20 < len(value) <= 26
+        and value[10] == " "
+        and value[19] == "."
+    ):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            parsed = None
+        if parsed is not None and parsed.tzinfo is None:
+            return parsed
+    return datetime.strptime(value, fmt)
 
 
 def safe_enum_convert(enum_class, value, field_name="field", lowercase=False):
@@ -28,7 +61,10 @@ def safe_enum_convert(enum_class, value, field_name="field", lowercase=False):
     # Handle case-insensitive conversion if requested
     if lowercase and isinstance(value, str):
         value = value.lower()
-    
+
+    member = _enum_values(enum_class).get(value) if isinstance(value, str) else None
+    if member is not None:
+        return member
     try:
         return enum_class(value)
     except ValueError:
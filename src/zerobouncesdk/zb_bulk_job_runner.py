@@ -0,0 +1,358 @@
+import heapq
+import itertools
+import os
+import threading
+import time
+import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import BinaryIO, Callable, List, Optional, Union
+
+from . import (
+    ZBApiException,
+    ZBClientException,
+    ZBDownloadType,
+    ZBFileStatusResponse,
+    ZBGetFileOptions,
+)
+
+_FAILED_STATUSES = ("failed", "error", "deleted")
+# a missing phase 2 status means the status response is partial: keep polling
+_PHASE_2_DONE_STATUSES = ("complete", "n/a")
+
+
+def _parse_percentage(value) -> Optional[float]:
+    try:
+        return float(str(value).strip().rstrip("%"))
+    except ValueError:
+        return None
+
+
+class ZBBulkJob(Future):
+    """A bulk or scoring file job followed by `ZBBulkJobRunner`.
+
+    The future resolves to the `ZBGetFileResponse` of the downloaded results, or to
+    the exception that stopped the job. `file_id` is set once the file is accepted
+    and `status` holds the latest `ZBFileStatusResponse`.
+    """
+
+    def __init__(self, scoring: bool, download_path: str, options: Optional[ZBGetFileOptions]):
+        super().__init__()
+        self.scoring = scoring
+        self.download_path = download_path
+        self.options = options
+        self.file_id: Optional[str] = None
+        self.status: Optional[ZBFileStatusResponse] = None
+        self._interval_s: Optional[float] = None
+        self._poll_errors = 0  # polls failed in a row
+        self._progress = None  # (monotonic time, complete percentage) of the last progress seen
+
+
+class ZBBulkJobRunner:
+    """Shepherds many bulk and scoring file jobs from upload to downloaded results.
+
+    Each job is polled with `file_status` on its own schedule: the next poll is
+    planned from the progress rate seen in `complete_percentage`, so a job is
+    checked again around half way to its estimated completion, and the interval
+    doubles while no progress is reported. Polls always stay between
+    `min_poll_interval` and `max_poll_interval`. A poll that fails, e.g. on a
+    timeout, is tried again after the same doubling interval: a job only fails
+    when more than `max_poll_errors` polls fail in a row, or when the server
+    reports its file as failed, errored or deleted. Results are downloaded as
+    soon as a job is complete, including phase 2 when the options ask for
+    `ZBDownloadType.PHASE_2` or `ZBDownloadType.COMBINED`, and the file is then
+    deleted from the server when `delete_files` is set.
+
+    The jobs that are due at the same time are polled together with
+    `file_status_many`. Polls and downloads run on a pool of `concurrency`
+    threads, and a single scheduler thread sleeps until the next poll is due.
+
+    Example
+    -------
+    with ZBBulkJobRunner(zero_bounce) as runner:
+        job = runner.submit_file("emails.csv", 1, "results.csv", has_header_row=True)
+        job.add_done_callback(lambda job: print(job.file_id, "done"))
+    """
+
+    def __init__(
+        self,
+        client,
+        min_poll_interval: timedelta = timedelta(seconds=5),
+        max_poll_interval: timedelta = timedelta(minutes=5),
+        concurrency: int = 8,
+        delete_files: bool = False,
+        on_status: Optional[Callable[[ZBBulkJob], None]] = None,
+        max_status_requests_per_second: Optional[float] = None,
+        max_poll_errors: int = 10,
+    ):
+        """
+        Parameters
+        ----------
+        client: ZeroBounce
+            The client used to send, poll, download and delete the files
+        min_poll_interval: timedelta, default 5 seconds
+            The shortest wait between two polls of the same job
+        max_poll_interval: timedelta, default 5 minutes
+            The longest wait between two polls of the same job
+        concurrency: int, default 8
+            How many uploads, polls and downloads may run at the same time
+        delete_files: bool, default False
+            Delete each file from the server once its results are downloaded
+        on_status: Callable[[ZBBulkJob], None] or None
+            Called from a worker thread after every poll, with `status` updated
+        max_status_requests_per_second: float or None
+            Spaces out the filestatus requests of a sweep to stay under this rate
+        max_poll_errors: int, default 10
+            How many polls of a job may fail in a row before the job fails
+        """
+        if concurrency < 1:
+            raise ZBClientException("Invalid parameter: concurrency must be at least 1")
+        if max_poll_errors < 0:
+            raise ZBClientException("Invalid parameter: max_poll_errors must not be negative")
+        if not timedelta(0) < min_poll_interval <= max_poll_interval:
+            raise ZBClientException(
+                "Invalid parameter: min_poll_interval must be positive and at most max_poll_interval"
+            )
+        self._client = client
+        self._min_interval_s = min_poll_interval.total_seconds()
+        self._max_interval_s = max_poll_interval.total_seconds()
+        self._delete_files = delete_files
+        self._on_status = on_status
+        self._concurrency = concurrency
+        self._max_status_requests_per_second = max_status_requests_per_second
+        self._max_poll_errors = max_poll_errors
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._condition = threading.Condition()
+        self._schedule_heap = []
+        self._sequence = itertools.count()
+        self._active = 0
+        self._closed = False
+        self._scheduler = threading.Thread(target=self._run, name="ZBBulkJobRunner", daemon=True)
+        self._scheduler.start()
+
+    def submit_file(
+        self,
+        source: Union[str, BinaryIO],
+        email_address_column: int,
+        download_path: str,
+        scoring: bool = False,
+        options: Optional[ZBGetFileOptions] = None,
+        file_name: Optional[str] = None,
+        **send_file_kwargs,
+    ) -> ZBBulkJob:
+        """Uploads a file, then follows it until its results are downloaded.
+
+        Parameters
+        ----------
+        source: str or BinaryIO
+            The path of the csv or txt file, or a file-like object opened in binary mode.
+        email_address_column: int
+            The column index of the email address in the file. Index starts from 1.
+        download_path: str
+            The local path where the results will be downloaded.
+        scoring: bool
+            Send the file for AI scoring instead of validation.
+        options: ZBGetFileOptions or None
+            The getfile options used to download the results.
+        file_name: str or None
+            The file name to use for the upload of a stream.
+        **send_file_kwargs
+            Passed on to `send_file` (or `scoring_send_file`), e.g. has_header_row.
+
+        Returns
+        -------
+        job: ZBBulkJob
+        """
+        job = self._add_job(scoring, download_path, options)
+        self._executor.submit(
+            self._send, job, source, email_address_column, file_name, send_file_kwargs
+        )
+        return job
+
+    def track(
+        self,
+        file_id: str,
+        download_path: str,
+        scoring: bool = False,
+        options: Optional[ZBGetFileOptions] = None,
+    ) -> ZBBulkJob:
+        """Follows a file that was already sent until its results are downloaded.
+
+        Returns
+        -------
+        job: ZBBulkJob
+        """
+        if not file_id.strip():
+            raise ZBClientException("Empty parameter: file_id")
+        job = self._add_job(scoring, download_path, options)
+        job.file_id = file_id
+        self._schedule(job, 0)
+        return job
+
+    def close(self):
+        """Stops accepting jobs and waits until every job is resolved."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._scheduler.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _add_job(self, scoring: bool, download_path: str, options: Optional[ZBGetFileOptions]) -> ZBBulkJob:
+        job = ZBBulkJob(scoring, download_path, options)
+        with self._condition:
+            if self._closed:
+                raise ZBClientException("ZBBulkJobRunner is closed")
+            self._active += 1
+        job.add_done_callback(self._job_done)
+        return job
+
+    def _job_done(self, job: ZBBulkJob):
+        with self._condition:
+            self._active -= 1
+            self._condition.notify()
+
+    def _schedule(self, job: ZBBulkJob, delay_s: float):
+        with self._condition:
+            heapq.heappush(self._schedule_heap, (time.monotonic() + delay_s, next(self._sequence), job))
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed and not self._active:
+                        return
+                    now = time.monotonic()
+                    if self._schedule_heap and self._schedule_heap[0][0] <= now:
+                        break
+                    timeout = self._schedule_heap[0][0] - now if self._schedule_heap else None
+                    self._condition.wait(timeout)
+                due = []
+                while self._schedule_heap and self._schedule_heap[0][0] <= now:
+                    due.append(heapq.heappop(self._schedule_heap)[2])
+            self._executor.submit(self._poll, due)
+
+    def _send(self, job: ZBBulkJob, source, email_address_column, file_name, send_file_kwargs):
+        if not job.set_running_or_notify_cancel():
+            return
+        try:
+            if isinstance(source, (str, os.PathLike)):
+                send = self._client.scoring_send_file if job.scoring else self._client.send_file
+                response = send(source, email_address_column, **send_file_kwargs)
+            else:
+                send = self._client.scoring_send_file_stream if job.scoring else self._client.send_file_stream
+                name = file_name or os.path.basename(getattr(source, "name", "") or "") or "emails.csv"
+                response = send(source, name, email_address_column, **send_file_kwargs)
+            if not response.success:
+                raise ZBApiException(response.message or "The file was not accepted")
+        except BaseException as e:
+            job.set_exception(e)
+            return
+        job.file_id = response.file_id
+        self._schedule(job, self._min_interval_s)
+
+    def _poll(self, due: List[ZBBulkJob]):
+        jobs = [job for job in due if job.running() or job.set_running_or_notify_cancel()]
+        for scoring in (False, True):
+            group = [job for job in jobs if job.scoring == scoring]
+            if not group:
+                continue
+            file_status_many = (
+                self._client.scoring_file_status_many if scoring else self._client.file_status_many
+            )
+            try:
+                statuses = file_status_many(
+                    [job.file_id for job in group],
+                    concurrency=self._concurrency,
+                    max_requests_per_second=self._max_status_requests_per_second,
+                )
+            except Exception as e:
+                for job in group:
+                    self._poll_failed(job, e)
+                continue
+            except BaseException as e:
+                for job in group:
+                    job.set_exception(e)
+                continue
+            for job in group:
+                try:
+                    status = statuses[job.file_id]
+                    self._update(job, status)
+                    if not status.success:
+                        self._poll_failed(
+                            job, ZBApiException(status.message or f"Cannot get the status of file {job.file_id}")
+                        )
+                    elif self._is_complete(job, status):
+                        self._executor.submit(self._download, job)
+                    else:
+                        self._schedule(job, self._next_interval(job, status))
+                except BaseException as e:
+                    job.set_exception(e)
+
+    def _update(self, job: ZBBulkJob, status: ZBFileStatusResponse):
+        job.status = status
+        if self._on_status is not None:
+            self._on_status(job)
+        if not status.success:
+            return
+        job._poll_errors = 0
+        if (status.file_status or "").lower() in _FAILED_STATUSES:
+            raise ZBApiException(status.error_reason or f"File {job.file_id} is {status.file_status}")
+
+    def _poll_failed(self, job: ZBBulkJob, error: BaseException):
+        job._poll_errors += 1
+        if job._poll_errors > self._max_poll_errors:
+            job.set_exception(error)
+        else:
+            self._schedule(job, self._back_off(job))
+
+    @staticmethod
+    def _is_complete(job: ZBBulkJob, status: ZBFileStatusResponse) -> bool:
+        if (status.file_status or "").lower() != "complete":
+            return False
+        download_type = job.options.download_type if job.options is not None else None
+        if download_type in (ZBDownloadType.PHASE_2, ZBDownloadType.COMBINED):
+            return (status.file_phase_2_status or "").lower() in _PHASE_2_DONE_STATUSES
+        return True
+
+    def _next_interval(self, job: ZBBulkJob, status: ZBFileStatusResponse) -> float:
+        now = time.monotonic()
+        percentage = _parse_percentage(status.complete_percentage)
+        interval = self._doubled_interval(job)
+        if percentage is not None and job._progress is not None:
+            then, before = job._progress
+            if percentage > before and now > then:
+                rate = (percentage - before) / (now - then)
+                interval = (100 - percentage) / rate / 2
+        if percentage is not None and (job._progress is None or percentage > job._progress[1]):
+            job._progress = (now, percentage)
+        job._interval_s = min(max(interval, self._min_interval_s), self._max_interval_s)
+        return job._interval_s
+
+    def _doubled_interval(self, job: ZBBulkJob) -> float:
+        return job._interval_s * 2 if job._interval_s else self._min_interval_s
+
+    def _back_off(self, job: ZBBulkJob) -> float:
+        job._interval_s = min(self._doubled_interval(job), self._max_interval_s)
+        return job._interval_s
+
+    def _download(self, job: ZBBulkJob):
+        get_file = self._client.scoring_get_file if job.scoring else self._client.get_file
+        try:
+            response = get_file(job.file_id, job.download_path, job.options)
+        except BaseException as e:
+            job.set_exception(e)
+            return
+        if self._delete_files:
+            delete_file = self._client.scoring_delete_file if job.scoring else self._client.delete_file
+            try:
+                delete_file(job.file_id)
+            except Exception as e:
+                warnings.warn(f"Could not delete file {job.file_id} after downloading it: {e}")
+        job.set_result(response)
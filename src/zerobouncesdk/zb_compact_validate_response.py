@@ -0,0 +1,42 @@
+from typing import Tuple
+
+from . import ZBValidateStatus, ZBValidateSubStatus
+from ._zb_utils import parse_datetime, safe_enum_convert
+from .zb_validate_response import ZBValidateResponse
+
+_FIELDS: Tuple[str, ...] = tuple(ZBValidateResponse.__annotations__)
+_DEFAULTS = tuple(getattr(ZBValidateResponse, name) for name in _FIELDS)
+
+
+class ZBCompactValidateResponse:
+    """A validate result with the attributes of `ZBValidateResponse` held in slots.
+
+    Objects of this class have no ``__dict__``, which makes them several times
+    smaller, and they are built without going through the generic response
+    constructor. Keys of the API response that are not attributes of
+    `ZBValidateResponse` are dropped. Use `validate_batch(..., compact=True)` or
+    `validate_many(..., compact=True)` to get them.
+    """
+
+    __slots__ = _FIELDS
+
+    def __init__(self, data: dict):
+        get = data.get
+        for name, default in zip(_FIELDS, _DEFAULTS):
+            setattr(self, name, get(name, default))
+        self.status = safe_enum_convert(ZBValidateStatus, self.status, "status")
+        self.sub_status = safe_enum_convert(ZBValidateSubStatus, self.sub_status, "sub_status")
+        if self.processed_at is not None:
+            self.processed_at = parse_datetime(self.processed_at, ZBValidateResponse.PROCESSED_AT_FORMAT)
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in _FIELDS}
+
+    def __str__(self) -> str:
+        return str(self.__class__.__name__) + "=" + str(self.to_dict())
+
+
+class ZBCompactValidateBatchEmail(ZBCompactValidateResponse):
+    """The compact counterpart of `ZBValidateBatchEmail`."""
+
+    __slots__ = ()
@@ -0,0 +1,197 @@
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from . import ZBClientException
+from ._zb_csv_shards import is_blank, iter_csv_records, record_field
+from .zb_email_normalizer import ZBEmailNormalizer
+
+
+class _BloomFilter:
+    """A fixed-size Bloom filter: a bit array set by `hash_count` positions per key."""
+
+    def __init__(self, expected_items: int, false_positive_rate: float):
+        self.size = max(8, math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, key: str) -> bool:
+        """Sets the bits of `key`; whether any of them was not set yet."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        # double hashing (Kirsch and Mitzenmacher): the i-th position is h1 + i * h2
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits = self.bits
+        added = False
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % self.size
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+        return added
+
+
+class ZBDeduplicator:
+    """Remembers the addresses seen in a stream so that each is validated once.
+
+    Addresses are compared in the form `normalizer` gives them, a default
+    `ZBEmailNormalizer` when none is given. In ``"exact"`` mode the normalized
+    addresses are kept in a set. For feeds too large for that, ``"bloom"`` mode
+    keeps a Bloom filter sized for `expected_items` instead, about 1.8 bytes per
+    address at the default `false_positive_rate`. `filter_file` leaves out an
+    address the filter wrongly takes for a duplicate, with that probability;
+    `validate_many` sends any duplicate it has no result for, so such an address
+    is validated.
+
+    Pass it to `validate_many(..., deduplicator=...)`, which sends only the first
+    occurrence of each address and yields its result again for the duplicates, or
+    use `filter_file` to drop duplicate rows from a file before `send_file`.
+    One deduplicator spans every stream it is used for: the results it keeps
+    answer duplicates in later `validate_many` calls too, but addresses seen by
+    `filter_file` or `add` have no result to give.
+    """
+
+    EXACT = "exact"
+    BLOOM = "bloom"
+
+    def __init__(
+        self,
+        normalizer: Optional[Callable[[str], str]] = None,
+        mode: str = EXACT,
+        expected_items: int = 10_000_000,
+        false_positive_rate: float = 0.001,
+        max_results: int = 100_000,
+    ):
+        """
+        Parameters
+        ----------
+        normalizer: Callable[[str], str] or None
+            Gives the form under which addresses are compared
+        mode: str, default "exact"
+            ``"exact"`` or ``"bloom"``
+        expected_items: int, default 10000000
+            How many distinct addresses the Bloom filter is sized for
+        false_positive_rate: float, default 0.001
+            The chance that the Bloom filter takes a new address for a duplicate
+        max_results: int, default 100000
+            How many of the latest results are kept for the duplicates still to
+            come, across every `validate_many` call. A duplicate of an address
+            validated earlier than that gets a ZBValidateBatchError instead, or
+            is validated again in ``"bloom"`` mode.
+        """
+        if mode not in (self.EXACT, self.BLOOM):
+            raise ZBClientException(f"Invalid parameter: mode must be {self.EXACT!r} or {self.BLOOM!r}")
+        if expected_items < 1:
+            raise ZBClientException("Invalid parameter: expected_items must be at least 1")
+        if not 0 < false_positive_rate < 1:
+            raise ZBClientException("Invalid parameter: false_positive_rate must be between 0 and 1")
+        if max_results < 0:
+            raise ZBClientException("Invalid parameter: max_results must not be negative")
+        self._normalizer = normalizer or ZBEmailNormalizer()
+        self.mode = mode
+        self.max_results = max_results
+        self._seen = set() if mode == self.EXACT else _BloomFilter(expected_items, false_positive_rate)
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.unique = 0
+        """How many distinct addresses were seen"""
+        self.duplicates = 0
+        """How many addresses were recognised as duplicates"""
+
+    def key(self, email: str) -> str:
+        """The normalized form `email` is compared under."""
+        return self._normalizer(email)
+
+    def add_key(self, key: str) -> bool:
+        """Records an address already in `key` form; whether it was not seen before."""
+        with self._lock:
+            if self.mode == self.EXACT:
+                added = key not in self._seen
+                self._seen.add(key)
+            else:
+                added = self._seen.add(key)
+            if added:
+                self.unique += 1
+            else:
+                self.duplicates += 1
+            return added
+
+    def recount_as_unique(self):
+        """Counts the last address `add_key` took for a duplicate as unique instead."""
+        with self._lock:
+            self.duplicates -= 1
+            self.unique += 1
+
+    def add(self, email: str) -> bool:
+        """Records `email`; whether it was not seen before."""
+        return self.add_key(self.key(email))
+
+    def remember_result(self, key: str, result: Any):
+        """Keeps the result of the address with `key` for its duplicates, up to `max_results` results."""
+        if not self.max_results:
+            return
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+    def result_for(self, key: str) -> Optional[Any]:
+        """The kept result of the address with `key`, or None when it is not kept."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    def filter_file(
+        self,
+        source: str,
+        destination: str,
+        email_address_column: int,
+        has_header_row: bool = False,
+    ) -> int:
+        """Copies a CSV or txt file for sendfile with only the first row of each address.
+
+        The kept records, and the header row, are copied byte for byte. The
+        results the API returns for the copy cover every duplicate: match them on
+        `key`.
+
+        Parameters
+        ----------
+        source: str
+            The path of the csv or txt file to filter
+        destination: str
+            The path of the filtered file
+        email_address_column: int
+            The column index of the email address in the file. Index starts from 1.
+        has_header_row: bool
+            If the first row from the submitted file is a header row.
+
+        Returns
+        -------
+        removed: int
+            How many duplicate rows were left out
+        """
+        if email_address_column < 1:
+            raise ZBClientException("Invalid parameter: email_address_column must be at least 1")
+
+        removed = 0
+        with open(source, "rb") as stream, open(destination, "wb") as filtered:
+            records = iter_csv_records(stream)
+            if has_header_row:
+                filtered.write(next(records, b""))
+            for record in records:
+                if is_blank(record):
+                    continue
+                if self.add(record_field(record, email_address_column)):
+                    filtered.write(record)
+                else:
+                    removed += 1
+        return removed
+
+    def __len__(self) -> int:
+        return self.unique
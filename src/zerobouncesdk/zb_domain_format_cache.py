@@ -0,0 +1,180 @@
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional
+
+from . import ZBClientException, ZBConfidence
+from .zb_find_domain_response import ZBFindDomainResponse
+from .zb_find_email_format_response import ZBFindEmailFormatResponse
+
+_CONFIDENCE_RANKS = {ZBConfidence.low: 1, ZBConfidence.medium: 2, ZBConfidence.high: 3}
+
+# "first" and "last" before "f" and "l", so "flast" reads as f + last
+_FORMAT_TOKEN = re.compile(r"first|middle|last|[fml]|[._-]")
+_NAME_NOISE = re.compile(r"[^a-z0-9]")
+
+
+def _name_part(name: str) -> str:
+    """The name as it appears in an address: lowercase ASCII letters and digits only."""
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    ascii_name = decomposed.encode("ascii", errors="ignore").decode("ascii")
+    return _NAME_NOISE.sub("", ascii_name.lower())
+
+
+def _render_format(email_format: str, first_name: str, middle_name: str, last_name: str) -> Optional[str]:
+    """The local part `email_format` gives for the names, or None when it cannot be built."""
+    tokens = _FORMAT_TOKEN.findall(email_format or "")
+    if not tokens or "".join(tokens) != email_format:
+        return None
+    names = {"f": _name_part(first_name), "m": _name_part(middle_name), "l": _name_part(last_name)}
+    parts = []
+    for token in tokens:
+        if token in "._-":
+            parts.append(token)
+            continue
+        name = names[token[0]]
+        if not name:
+            return None
+        parts.append(name if len(token) > 1 else name[0])
+    return "".join(parts)
+
+
+class ZBDomainFormatCache:
+    """Caches find_domain results per domain and company name.
+
+    With it, `find_domain` asks guessformat once per domain or company until the
+    entry expires, and `find_email_format` builds the address itself from the
+    cached format when the format's confidence is at least `min_confidence`,
+    using the best `other_domain_formats` entry when the main format needs a name
+    that was not given. Addresses built this way have `decided_locally` set.
+
+    A find_email_format call for a domain not cached yet fetches its format with
+    find_domain first. When that format cannot be used, the find_email_format
+    request is still sent, so such a first call costs two guessformat requests;
+    later calls for the domain cost at most one. When the find_domain request
+    fails, find_email_format is sent as if there were no cache.
+
+    Results without a format, such as failures, are kept for `failure_ttl` only.
+    Cached responses are shared by every caller and should not be modified.
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta = timedelta(days=7),
+        failure_ttl: timedelta = timedelta(hours=1),
+        max_size: int = 10000,
+        min_confidence: ZBConfidence = ZBConfidence.high,
+    ):
+        """
+        Parameters
+        ----------
+        ttl: timedelta, default 7 days
+            How long a domain's format is cached
+        failure_ttl: timedelta, default 1 hour
+            How long a result without a format is cached
+        max_size: int, default 10000
+            How many domains and company names are cached at most
+        min_confidence: ZBConfidence, default ZBConfidence.high
+            The lowest format confidence find_email_format answers locally with
+        """
+        if max_size < 1:
+            raise ZBClientException("Invalid parameter: max_size must be at least 1")
+        if min_confidence not in _CONFIDENCE_RANKS:
+            raise ZBClientException("Invalid parameter: min_confidence must be high, medium or low")
+        self._ttl_s = ttl.total_seconds()
+        self._failure_ttl_s = failure_ttl.total_seconds()
+        self._max_size = max_size
+        self._min_rank = _CONFIDENCE_RANKS[min_confidence]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        """Number of lookups answered from the cache."""
+        self.misses = 0
+        """Number of lookups that had to call the API."""
+        self.local_answers = 0
+        """Number of find_email_format calls answered from a cached format."""
+
+    @staticmethod
+    def key(domain: str = '', company_name: str = '') -> str:
+        if domain:
+            return "domain:" + domain.strip().rstrip(".").lower()
+        return "company:" + " ".join(company_name.lower().split())
+
+    def get(self, domain: str = '', company_name: str = '') -> Optional[ZBFindDomainResponse]:
+        """The cached find_domain result for the domain or company name, or None."""
+        key = self.key(domain, company_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, domain: str, company_name: str, response: ZBFindDomainResponse):
+        """Caches a find_domain result, also under the domain found for a company name."""
+        ttl_s = self._ttl_s if response.format and not response.failure_reason else self._failure_ttl_s
+        if ttl_s <= 0:
+            return
+        keys = {self.key(domain, company_name)}
+        if company_name and response.domain and ttl_s == self._ttl_s:
+            keys.add(self.key(response.domain))
+        expires_at = time.monotonic() + ttl_s
+        with self._lock:
+            for key in keys:
+                self._entries[key] = (expires_at, response)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def format_email(
+        self,
+        domain_format: ZBFindDomainResponse,
+        first_name: str,
+        middle_name: str = '',
+        last_name: str = '',
+    ) -> Optional[ZBFindEmailFormatResponse]:
+        """The find_email_format result built from a domain's formats, or None.
+
+        None is returned when no format of at least `min_confidence` can be
+        built from the given names.
+        """
+        if not domain_format.domain:
+            return None
+        candidates = [(domain_format.format, domain_format.confidence)]
+        candidates += sorted(
+            ((other.format, other.confidence) for other in domain_format.other_domain_formats),
+            key=lambda candidate: -_CONFIDENCE_RANKS.get(candidate[1], 0),
+        )
+        for email_format, confidence in candidates:
+            if _CONFIDENCE_RANKS.get(confidence, 0) < self._min_rank:
+                continue
+            local_part = _render_format(email_format, first_name, middle_name, last_name)
+            if local_part is None:
+                continue
+            with self._lock:
+                self.local_answers += 1
+            return ZBFindEmailFormatResponse({
+                "email": f"{local_part}@{domain_format.domain}",
+                "email_confidence": confidence.value,
+                "domain": domain_format.domain,
+                "company_name": domain_format.company_name or "",
+                "did_you_mean": "",
+                "failure_reason": "",
+                "decided_locally": True,
+            })
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
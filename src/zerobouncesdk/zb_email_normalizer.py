@@ -0,0 +1,83 @@
+from typing import Dict, Tuple
+
+_GMAIL = "gmail.com"
+
+# domain: (dots in the local part are ignored, text after "+" is a tag)
+_PROVIDER_RULES: Dict[str, Tuple[bool, bool]] = {
+    "gmail.com": (True, True),
+    "googlemail.com": (True, True),
+    "outlook.com": (False, True),
+    "hotmail.com": (False, True),
+    "live.com": (False, True),
+    "msn.com": (False, True),
+    "icloud.com": (False, True),
+    "me.com": (False, True),
+    "mac.com": (False, True),
+    "fastmail.com": (False, True),
+    "protonmail.com": (False, True),
+    "proton.me": (False, True),
+}
+
+
+def _fold_domain(domain: str) -> str:
+    domain = domain.strip().rstrip(".").lower()
+    if domain.isascii():
+        return domain
+    try:
+        return domain.encode("idna").decode("ascii")
+    except UnicodeError:
+        return domain
+
+
+class ZBEmailNormalizer:
+    """Reduces an address to the form under which duplicates are recognised.
+
+    Surrounding whitespace is trimmed and the domain is lowercased, non-ASCII
+    domains in their IDNA (``xn--``) form. The local part is kept as is: most
+    mail servers ignore its case, but RFC 5321 lets them not to, so it is only
+    lowercased with `fold_local_part`.
+
+    With `provider_rules`, the rules of the large mailbox providers are applied
+    as well: their local parts are lowercased, plus-tags (``jane+news``) are
+    dropped, and for Gmail the dots are removed and ``googlemail.com`` becomes
+    ``gmail.com``. `PROVIDER_RULES` lists the providers.
+
+    The normalized form is only used to recognise duplicates; the address sent to
+    the API is the one that was given.
+    """
+
+    PROVIDER_RULES = _PROVIDER_RULES
+    """The providers `provider_rules` applies to: whether dots are ignored, and whether plus-tags are"""
+
+    def __init__(self, provider_rules: bool = False, fold_local_part: bool = False):
+        """
+        Parameters
+        ----------
+        provider_rules: bool, default False
+            Apply the plus-tag and dot rules of the providers in `PROVIDER_RULES`
+        fold_local_part: bool, default False
+            Lowercase the local part of every address
+        """
+        self._provider_rules = provider_rules
+        self._fold_local_part = fold_local_part
+
+    def normalize(self, email: str) -> str:
+        """The normalized form of `email`; text without an ``@`` is only trimmed."""
+        local_part, at, domain = email.strip().rpartition("@")
+        if not at:
+            return email.strip()
+        domain = _fold_domain(domain)
+        if self._fold_local_part:
+            local_part = local_part.lower()
+        rules = self._provider_rules and _PROVIDER_RULES.get(domain)
+        if rules:
+            ignores_dots, has_tags = rules
+            local_part = local_part.lower()
+            if has_tags:
+                local_part = local_part.partition("+")[0]
+            if ignores_dots:
+                local_part = local_part.replace(".", "")
+                domain = _GMAIL
+        return local_part + "@" + domain
+
+    __call__ = normalize
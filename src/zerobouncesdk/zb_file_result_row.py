@@ -0,0 +1,77 @@
+from typing import Dict, List
+
+from . import ZBValidateStatus, ZBValidateSubStatus
+from ._zb_response import ZBResponse
+from ._zb_utils import safe_enum_convert
+
+
+class ZBFileResultRow(ZBResponse):
+    """One row of a bulk validation results file, as yielded by `iter_file_results`."""
+
+    email_address: str = None
+    """The email address of the row."""
+
+    status: ZBValidateStatus = None
+    """The "ZB Status" column."""
+
+    sub_status: ZBValidateSubStatus = None
+    """The "ZB Sub Status" column."""
+
+    account: str = None
+
+    domain: str = None
+
+    firstname: str = None
+
+    lastname: str = None
+
+    gender: str = None
+
+    free_email: bool = None
+
+    mx_found: bool = None
+
+    mx_record: str = None
+
+    smtp_provider: str = None
+
+    did_you_mean: str = None
+
+    domain_age_days: str = None
+
+    columns: Dict[str, str] = None
+    """Every column of the row keyed by its header, including the columns of the submitted file."""
+
+    HEADER_FIELDS = {
+        "zb status": "status",
+        "zb sub status": "sub_status",
+        "zb account": "account",
+        "zb domain": "domain",
+        "zb first name": "firstname",
+        "zb last name": "lastname",
+        "zb gender": "gender",
+        "zb free email": "free_email",
+        "zb mx found": "mx_found",
+        "zb mx record": "mx_record",
+        "zb smtp provider": "smtp_provider",
+        "zb did you mean": "did_you_mean",
+        "zb domain age days": "domain_age_days",
+    }
+    """Maps the lower-cased "ZB ..." headers of a results file to attribute names."""
+
+    BOOLEAN_FIELDS = ("free_email", "mx_found")
+
+    def __init__(self, header: List[str], values: List[str], email_index: int):
+        data = {"columns": dict(zip(header, values))}
+        data["email_address"] = values[email_index] if email_index < len(values) else None
+        for name, value in zip(header, values):
+            field = self.HEADER_FIELDS.get(name.strip().lower())
+            if field is not None:
+                data[field] = value
+        super().__init__(data)
+        self.status = safe_enum_convert(ZBValidateStatus, self.status, "status", lowercase=True)
+        self.sub_status = safe_enum_convert(ZBValidateSubStatus, self.sub_status, "sub_status", lowercase=True)
+        for field in self.BOOLEAN_FIELDS:
+            value = data.get(field)
+            if isinstance(value, str):
+                setattr(self, field, value.strip().lower() == "true" if value.strip() else None)
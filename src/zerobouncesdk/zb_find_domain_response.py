@@ -32,7 +32,7 @@ class ZBFindDomainResponse(ZBResponse):
     def __init__(self, data):
         super().__init__(data)
         if "Message" in data or "message" in data:
-            message = data.get("message", data["Message"])
+            message = data.get("message", data.get("Message"))
             raise ZBApiException(message)
 
         if self.confidence and isinstance(self.confidence, str):
@@ -23,6 +23,9 @@ class ZBFindEmailFormatResponse(ZBResponse):
     failure_reason: str = None
     """Reason for failure if the operation was unsuccessful."""
 
+    decided_locally: bool = False
+    """True when the email was built from the client's ZBDomainFormatCache and no request was made."""
+
     def __init__(self, data):
         super().__init__(data)
         if self.email_confidence and isinstance(self.email_confidence, str):
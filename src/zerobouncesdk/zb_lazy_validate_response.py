@@ -0,0 +1,103 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Callable, List
+
+from . import ZBValidateStatus, ZBValidateSubStatus
+from ._zb_response import ZBResponse
+from ._zb_utils import parse_datetime, safe_enum_convert
+from .zb_validate_response import ZBValidateResponse
+
+
+def _decode_processed_at(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    return parse_datetime(value, ZBValidateResponse.PROCESSED_AT_FORMAT)
+
+
+class _LazyField:
+    """An attribute kept as the raw API value until it is first read."""
+
+    def __init__(self, decode: Callable):
+        self._decode = decode
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        values = obj.__dict__
+        if self._name in obj._undecoded:
+            values[self._name] = self._decode(values[self._name])
+            obj._undecoded.discard(self._name)
+        return values.get(self._name)
+
+    def __set__(self, obj, value):
+        obj.__dict__[self._name] = value
+        obj._undecoded.discard(self._name)
+
+
+class ZBLazyValidateResponse(ZBValidateResponse):
+    """A `ZBValidateResponse` whose `status`, `sub_status` and `processed_at` are
+    decoded on first access instead of when the response is built.
+
+    The other attributes are read as is from the API response. A `processed_at`
+    that cannot be parsed raises when it is read. Use `validate(..., lazy=True)`
+    to get one.
+    """
+
+    __slots__ = ("_undecoded",)
+
+    status = _LazyField(lambda value: safe_enum_convert(ZBValidateStatus, value, "status"))
+    sub_status = _LazyField(lambda value: safe_enum_convert(ZBValidateSubStatus, value, "sub_status"))
+    processed_at = _LazyField(_decode_processed_at)
+
+    def __init__(self, data):
+        ZBResponse.__init__(self, data)
+        self._undecoded = {name for name in ("status", "sub_status", "processed_at") if name in self.__dict__}
+
+    def decode(self):
+        """Decodes every field that was not read yet."""
+        self.status, self.sub_status, self.processed_at
+
+    def __str__(self) -> str:
+        self.decode()
+        return super().__str__()
+
+
+class ZBLazyValidateBatchEmail(ZBLazyValidateResponse):
+    """The lazy counterpart of `ZBValidateBatchEmail`."""
+
+    __slots__ = ()
+
+
+class _LazyList(Sequence):
+    """A read-only list whose items are built from the raw API values on first access."""
+
+    def __init__(self, values: list, factory: Callable):
+        self._values = values
+        self._factory = factory
+        self._items: List = [None] * len(values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._factory(self._values[index])
+        return item
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, _LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
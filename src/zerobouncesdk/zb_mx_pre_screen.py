@@ -0,0 +1,186 @@
+import socket
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import dns.resolver
+except ImportError:  # pragma: no cover - exercised only without the dns extra
+    dns = None
+
+from . import ZBClientException
+from ._zb_single_flight import SingleFlight
+
+MxResolver = Callable[[str], Tuple[List[str], Optional[float]]]
+"""Takes a domain and returns its mail hosts (none when it cannot receive mail)
+with the TTL of the answer in seconds, or None when unknown. Raises on lookup failures."""
+
+
+def _dnspython_resolver(domain: str) -> Tuple[List[str], Optional[float]]:
+    try:
+        answer = dns.resolver.resolve(domain, "MX")
+    except dns.resolver.NXDOMAIN:
+        return [], None
+    except dns.resolver.NoAnswer:
+        # no MX record: the address record is the implicit mail host (RFC 5321, 5.1)
+        for record_type in ("A", "AAAA"):
+            try:
+                answer = dns.resolver.resolve(domain, record_type)
+            except dns.resolver.NoAnswer:
+                continue
+            except dns.resolver.NXDOMAIN:
+                return [], None
+            return [domain], answer.rrset.ttl
+        return [], None
+    # a "." exchange is a null MX (RFC 7505): the domain accepts no mail
+    hosts = [str(record.exchange).rstrip(".") for record in answer]
+    return [host for host in hosts if host], answer.rrset.ttl
+
+
+def _socket_resolver(domain: str) -> Tuple[List[str], Optional[float]]:
+    # Without dnspython only address records can be looked up. An address record
+    # is an implicit mail host, but a domain without one may still have MX records,
+    # so a failed lookup is reported as unknown (by raising), never as "no mail".
+    try:
+        socket.getaddrinfo(domain, None)
+    except socket.gaierror as e:
+        raise LookupError(f"{domain} has no address record, and its MX records cannot be checked") from e
+    return [domain], None
+
+
+class ZBMxPreScreen:
+    """Looks up, once per domain, whether a domain can receive mail.
+
+    Answers are cached for the TTL the resolver reports, kept between `min_ttl`
+    and `max_ttl` (`default_ttl` when the resolver gives none). A failed lookup
+    counts as unknown, so those addresses are still sent, and is tried again after
+    `error_ttl`. Lookups of
+    many domains run on up to `concurrency` threads, and concurrent lookups of the
+    same domain share one query.
+
+    The default resolver uses dnspython when installed (``pip install
+    zerobouncesdk[dns]``), following RFC 5321 implicit MX and RFC 7505 null MX
+    rules. Without it only address records can be looked up, so a domain is never
+    found to lack a mail server: a domain without address records may still have
+    MX records, and counts as unknown. Pass `resolver` to use another one, e.g. a
+    stub in tests.
+
+    Use it through `ZBPreFilter(mx_screen=...)` so that addresses at domains
+    without mail servers are answered locally as ``invalid``/``no_dns_entries``.
+    """
+
+    def __init__(
+        self,
+        resolver: Optional[MxResolver] = None,
+        concurrency: int = 16,
+        min_ttl: timedelta = timedelta(minutes=1),
+        max_ttl: timedelta = timedelta(days=1),
+        default_ttl: timedelta = timedelta(hours=1),
+        error_ttl: timedelta = timedelta(seconds=30),
+        max_size: int = 100000,
+    ):
+        """
+        Parameters
+        ----------
+        resolver: Callable[[str], Tuple[List[str], Optional[float]]] or None
+            Returns the mail hosts of a domain and the TTL of the answer in seconds
+        concurrency: int, default 16
+            How many lookups may run at the same time
+        min_ttl: timedelta, default 1 minute
+            The shortest time an answer is cached
+        max_ttl: timedelta, default 1 day
+            The longest time an answer is cached
+        default_ttl: timedelta, default 1 hour
+            How long an answer without a TTL is cached
+        error_ttl: timedelta, default 30 seconds
+            How long a failed lookup is remembered
+        max_size: int, default 100000
+            How many domains are cached at most
+        """
+        if concurrency < 1:
+            raise ZBClientException("Invalid parameter: concurrency must be at least 1")
+        if max_size < 1:
+            raise ZBClientException("Invalid parameter: max_size must be at least 1")
+        self._resolver = resolver or (_dnspython_resolver if dns is not None else _socket_resolver)
+        self._concurrency = concurrency
+        self._min_ttl_s = min_ttl.total_seconds()
+        self._max_ttl_s = max_ttl.total_seconds()
+        self._default_ttl_s = default_ttl.total_seconds()
+        self._error_ttl_s = error_ttl.total_seconds()
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        self.stats: Dict[str, int] = Counter()
+        """Counts of "hits" (cached answers), "lookups" (resolver calls) and "errors" (failed lookups)"""
+
+    def _cached(self, domain: str) -> Tuple[bool, Optional[bool]]:
+        """Whether `domain` is cached, and its cached answer."""
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry is None:
+                return False, None
+            expires_at, has_mail = entry
+            if expires_at <= time.monotonic():
+                del self._entries[domain]
+                return False, None
+            self._entries.move_to_end(domain)
+            self.stats["hits"] += 1
+            return True, has_mail
+
+    def _store(self, domain: str, has_mail: Optional[bool], ttl_s: float):
+        with self._lock:
+            self._entries[domain] = (time.monotonic() + ttl_s, has_mail)
+            self._entries.move_to_end(domain)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def _lookup(self, domain: str) -> Optional[bool]:
+        with self._lock:
+            self.stats["lookups"] += 1
+        try:
+            hosts, ttl_s = self._resolver(domain)
+        except Exception:
+            with self._lock:
+                self.stats["errors"] += 1
+            self._store(domain, None, self._error_ttl_s)
+            return None
+        ttl_s = self._default_ttl_s if ttl_s is None else ttl_s
+        self._store(domain, bool(hosts), min(max(ttl_s, self._min_ttl_s), self._max_ttl_s))
+        return bool(hosts)
+
+    def has_mail_server(self, domain: str) -> Optional[bool]:
+        """Whether `domain` can receive mail, or None when the lookup failed."""
+        domain = domain.strip().rstrip(".").lower()
+        found, has_mail = self._cached(domain)
+        if found:
+            return has_mail
+        return self._flight.do(domain, lambda: self._lookup(domain))
+
+    def has_mail_servers(self, domains: Iterable[str]) -> Dict[str, Optional[bool]]:
+        """`has_mail_server` for many domains, with the uncached ones looked up concurrently."""
+        results = {}
+        missing = []
+        for domain in dict.fromkeys(domain.strip().rstrip(".").lower() for domain in domains):
+            found, has_mail = self._cached(domain)
+            if found:
+                results[domain] = has_mail
+            else:
+                missing.append(domain)
+        if len(missing) == 1:
+            results[missing[0]] = self.has_mail_server(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(self._concurrency, len(missing))) as executor:
+                results.update(zip(missing, executor.map(self.has_mail_server, missing)))
+        return results
+
+    def clear(self):
+        """Forgets every cached answer."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,265 @@
+import ipaddress
+import re
+import threading
+from collections import Counter
+from typing import Container, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import (
+    ZBClientException,
+    ZBValidateBatchElement,
+    ZBValidateResponse,
+    ZBValidateStatus,
+    ZBValidateSubStatus,
+)
+from ._zb_csv_shards import is_blank, iter_csv_records, record_field
+from .zb_mx_pre_screen import ZBMxPreScreen
+
+_ATEXT = "A-Za-z0-9!#$%&'*+/=?^_`{|}~-"
+_ASCII_DOT_ATOM = re.compile(rf"[{_ATEXT}]+(?:\.[{_ATEXT}]+)*\Z")
+# RFC 6531 lets any non-ASCII character appear in the local part as well
+_UTF8_DOT_ATOM = re.compile(rf"[\u0080-\U0010FFFF{_ATEXT}]+(?:\.[\u0080-\U0010FFFF{_ATEXT}]+)*\Z")
+_QUOTED_STRING = re.compile(r'"(?:[\x20\x21\x23-\x5b\x5d-\x7e]|\\[\x20-\x7e])*"\Z')
+_LABEL = re.compile(r"(?!-)[a-z0-9-]{1,63}(?<!-)\Z")
+
+_MAX_LOCAL_PART_OCTETS = 64
+_MAX_DOMAIN_OCTETS = 253
+_MAX_ADDRESS_OCTETS = 254
+
+
+def _normalize_domain(domain: str) -> Optional[str]:
+    """The lowercase ASCII (IDNA) form of a host name, or None when it is not a valid one."""
+    try:
+        ascii_domain = domain.encode("idna").decode("ascii").lower()
+    except UnicodeError:
+        return None
+    if len(ascii_domain) > _MAX_DOMAIN_OCTETS:
+        return None
+    labels = ascii_domain.split(".")
+    if len(labels) < 2 or labels[-1].isdigit():
+        return None
+    if not all(_LABEL.match(label) for label in labels):
+        return None
+    return ascii_domain
+
+
+def _is_domain_literal(domain: str) -> bool:
+    if not (domain.startswith("[") and domain.endswith("]")):
+        return False
+    literal = domain[1:-1]
+    try:
+        if literal[:5].lower() == "ipv6:":
+            ipaddress.IPv6Address(literal[5:])
+        else:
+            ipaddress.IPv4Address(literal)
+    except ValueError:
+        return False
+    return True
+
+
+def _domain_set(domains: Union[Iterable[str], Container[str]]) -> Container[str]:
+    if isinstance(domains, Container) and not isinstance(domains, (set, frozenset, list, tuple, dict, str)):
+        return domains
+    normalized = set()
+    for domain in domains:
+        ascii_domain = _normalize_domain(domain.strip().rstrip("."))
+        normalized.add(ascii_domain if ascii_domain is not None else domain.strip().lower())
+    return frozenset(normalized)
+
+
+class ZBPreFilter:
+    """Decides locally on addresses that the API would reject anyway.
+
+    An address is checked before any request is made:
+
+    - its syntax, after RFC 5321/5322 (dot-atom or quoted local part of at most
+      64 octets, host name of at most 253 octets with valid labels, 254 octets in
+      all), with UTF-8 local parts (RFC 6531) unless `allow_smtputf8` is off;
+    - its domain, converted to its IDNA (``xn--``) form and lowercased, against
+      `invalid_domains` and `disposable_domains`. A subdomain matches its parents;
+    - with an `mx_screen`, whether its domain has a mail server.
+
+    Rejected addresses get a synthetic result, with `decided_locally` set, and no
+    credit is spent on them: ``invalid``/``failed_syntax_check``,
+    ``invalid``/``no_dns_entries`` for an invalid domain or one without a mail server, or
+    ``do_not_mail``/``disposable``. The other addresses are sent unchanged.
+
+    The domain sets may be any iterable of domains, or any object supporting
+    ``in`` (e.g. backed by a database), which then receives lowercase IDNA domains.
+
+    Example
+    -------
+    pre_filter = ZBPreFilter(disposable_domains=open("disposable.txt").read().split())
+    zero_bounce = ZeroBounce("<YOUR_API_KEY>", pre_filter=pre_filter)
+    """
+
+    def __init__(
+        self,
+        disposable_domains: Union[Iterable[str], Container[str]] = (),
+        invalid_domains: Union[Iterable[str], Container[str]] = (),
+        allow_smtputf8: bool = True,
+        allow_domain_literals: bool = False,
+        mx_screen: Optional[ZBMxPreScreen] = None,
+    ):
+        """
+        Parameters
+        ----------
+        disposable_domains: Iterable[str] or Container[str]
+            Domains of disposable mailbox providers
+        invalid_domains: Iterable[str] or Container[str]
+            Domains known not to receive mail, e.g. without MX records
+        allow_smtputf8: bool, default True
+            Accept non-ASCII characters in the local part
+        allow_domain_literals: bool, default False
+            Accept addresses at an IP address, such as ``user@[192.0.2.1]``
+        mx_screen: ZBMxPreScreen or None
+            Also reject the domains it finds without a mail server
+        """
+        self._disposable_domains = _domain_set(disposable_domains)
+        self._invalid_domains = _domain_set(invalid_domains)
+        self._dot_atom = _UTF8_DOT_ATOM if allow_smtputf8 else _ASCII_DOT_ATOM
+        self._allow_domain_literals = allow_domain_literals
+        self._mx_screen = mx_screen
+        self._lock = threading.Lock()
+        self.rejected: Dict[str, int] = Counter()
+        """How many addresses were decided locally, by sub-status"""
+
+    def normalize(self, email: str) -> Optional[str]:
+        """The address with its domain in lowercase IDNA form, or None when its syntax is invalid."""
+        parts = self._split(email)
+        return None if parts is None else parts[0] + "@" + parts[1]
+
+    def _split(self, email: str) -> Optional[Tuple[str, str]]:
+        local_part, at, domain = email.strip().rpartition("@")
+        if not at or not local_part or not domain:
+            return None
+        if len(local_part.encode("utf-8")) > _MAX_LOCAL_PART_OCTETS:
+            return None
+        if not (self._dot_atom.match(local_part) or _QUOTED_STRING.match(local_part)):
+            return None
+        if self._allow_domain_literals and _is_domain_literal(domain):
+            ascii_domain = domain
+        else:
+            ascii_domain = _normalize_domain(domain)
+            if ascii_domain is None:
+                return None
+        if len(local_part.encode("utf-8")) + 1 + len(ascii_domain) > _MAX_ADDRESS_OCTETS:
+            return None
+        return local_part, ascii_domain
+
+    def _listed(self, domains: Container[str], domain: str) -> bool:
+        labels = domain.split(".")
+        return any(".".join(labels[i:]) in domains for i in range(len(labels) - 1))
+
+    def local_result(self, email: str) -> Optional[dict]:
+        """The synthetic validate result of a rejected address, as the API would send it, or None."""
+        parts = self._split(email)
+        if parts is None:
+            local_part, _, domain = email.strip().rpartition("@")
+            status, sub_status = ZBValidateStatus.invalid, ZBValidateSubStatus.failed_syntax_check
+        else:
+            local_part, domain = parts
+            if self._listed(self._invalid_domains, domain):
+                status, sub_status = ZBValidateStatus.invalid, ZBValidateSubStatus.no_dns_entries
+            elif self._listed(self._disposable_domains, domain):
+                status, sub_status = ZBValidateStatus.do_not_mail, ZBValidateSubStatus.disposable
+            elif self._lacks_mail_server(domain):
+                status, sub_status = ZBValidateStatus.invalid, ZBValidateSubStatus.no_dns_entries
+            else:
+                return None
+        with self._lock:
+            self.rejected[sub_status.value] += 1
+        return {
+            "address": email,
+            "status": status.value,
+            "sub_status": sub_status.value,
+            "account": local_part or None,
+            "domain": domain or None,
+            "decided_locally": True,
+        }
+
+    def _lacks_mail_server(self, domain: str) -> bool:
+        if self._mx_screen is None or domain.startswith("["):
+            return False
+        return self._mx_screen.has_mail_server(domain) is False
+
+    def _prefetch(self, emails: Iterable[str]):
+        """Looks up the MX records of the domains of `emails` concurrently, ahead of `local_result`."""
+        if self._mx_screen is None:
+            return
+        domains = set()
+        for email in emails:
+            parts = self._split(email)
+            if parts is not None and not parts[1].startswith("["):
+                domains.add(parts[1])
+        self._mx_screen.has_mail_servers(domains)
+
+    def check(self, email: str) -> Optional[ZBValidateResponse]:
+        """The synthetic result of a rejected address, or None when it should be sent to the API."""
+        result = self.local_result(email)
+        return None if result is None else ZBValidateResponse(result)
+
+    def split(
+        self, elements: Iterable[ZBValidateBatchElement]
+    ) -> Tuple[List[ZBValidateBatchElement], List[dict]]:
+        """The batch elements to send, and the synthetic results of the rejected ones."""
+        elements = list(elements)
+        self._prefetch(element.email_address for element in elements)
+        to_send, local_results = [], []
+        for element in elements:
+            result = self.local_result(element.email_address)
+            if result is None:
+                to_send.append(element)
+            else:
+                local_results.append(result)
+        return to_send, local_results
+
+    def filter_file(
+        self,
+        source: str,
+        destination: str,
+        email_address_column: int,
+        has_header_row: bool = False,
+    ) -> List[dict]:
+        """Copies a CSV or txt file for sendfile without the rows this filter rejects.
+
+        The kept records, and the header row, are copied byte for byte.
+
+        Parameters
+        ----------
+        source: str
+            The path of the csv or txt file to filter
+        destination: str
+            The path of the filtered file
+        email_address_column: int
+            The column index of the email address in the file. Index starts from 1.
+        has_header_row: bool
+            If the first row from the submitted file is a header row.
+
+        Returns
+        -------
+        results: List[dict]
+            The synthetic validate results of the rejected rows, in file order
+        """
+        if email_address_column < 1:
+            raise ZBClientException("Invalid parameter: email_address_column must be at least 1")
+
+        with open(source, "rb") as stream:
+            records = iter_csv_records(stream)
+            if has_header_row:
+                next(records, None)
+            self._prefetch(record_field(record, email_address_column) for record in records)
+
+        rejected = []
+        with open(source, "rb") as stream, open(destination, "wb") as filtered:
+            records = iter_csv_records(stream)
+            if has_header_row:
+                filtered.write(next(records, b""))
+            for record in records:
+                if is_blank(record):
+                    continue
+                result = self.local_result(record_field(record, email_address_column))
+                if result is None:
+                    filtered.write(record)
+                else:
+                    rejected.append(result)
+        return rejected
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import Dict, Optional
+
+from . import ZBClientException
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Takes a token, possibly one that is not there yet, and returns the wait for it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class ZBRateLimiter:
+    """Token buckets that cap the request rate of each endpoint family.
+
+    Every family has its own rate in requests per second, or no limit when the
+    rate is None. A bucket holds up to `burst` worth of requests, so an idle client
+    may briefly send faster before settling at the configured rate. Waiting
+    callers are served in the order they asked, whether they are threads
+    (`acquire`) or asyncio tasks (`acquire_async`), and one limiter may be shared
+    by several `ZeroBounce` and `AsyncZeroBounce` clients.
+
+    Example
+    -------
+    limiter = ZBRateLimiter(validate=50, validatebatch=5)
+    zero_bounce = ZeroBounce("<YOUR_API_KEY>", rate_limiter=limiter)
+    """
+
+    VALIDATE = "validate"
+    VALIDATEBATCH = "validatebatch"
+    BULK = "bulk"
+    GUESSFORMAT = "guessformat"
+    DEFAULT = "default"
+
+    _ENDPOINT_FAMILIES = {
+        "validate": VALIDATE,
+        "validatebatch": VALIDATEBATCH,
+        "sendfile": BULK,
+        "filestatus": BULK,
+        "getfile": BULK,
+        "deletefile": BULK,
+        "guessformat": GUESSFORMAT,
+    }
+
+    def __init__(
+        self,
+        validate: Optional[float] = None,
+        validatebatch: Optional[float] = None,
+        bulk: Optional[float] = None,
+        guessformat: Optional[float] = None,
+        default: Optional[float] = None,
+        burst: timedelta = timedelta(seconds=1),
+    ):
+        """
+        Parameters
+        ----------
+        validate: float or None
+            Requests per second to /validate
+        validatebatch: float or None
+            Requests per second to /validatebatch
+        bulk: float or None
+            Requests per second to the bulk and scoring file endpoints
+        guessformat: float or None
+            Requests per second to /guessformat (find_email_format, find_domain)
+        default: float or None
+            Requests per second to every other endpoint
+        burst: timedelta, default 1 second
+            How many seconds worth of requests an idle bucket can hold, at least one request
+        """
+        rates = {
+            self.VALIDATE: validate,
+            self.VALIDATEBATCH: validatebatch,
+            self.BULK: bulk,
+            self.GUESSFORMAT: guessformat,
+            self.DEFAULT: default,
+        }
+        burst_s = burst.total_seconds()
+        if burst_s < 0:
+            raise ZBClientException("Invalid parameter: burst must not be negative")
+        self._buckets: Dict[str, _TokenBucket] = {}
+        for family, rate in rates.items():
+            if rate is None:
+                continue
+            if rate <= 0:
+                raise ZBClientException(f"Invalid parameter: {family} rate must be positive")
+            self._buckets[family] = _TokenBucket(rate, max(1.0, rate * burst_s))
+        self._lock = threading.Lock()
+        self._waiting = Counter()
+
+    @classmethod
+    def family_for(cls, url: str) -> str:
+        """The endpoint family of a request URL."""
+        endpoint = url.split("?", 1)[0].rstrip("/").rsplit("/", 1)[-1]
+        return cls._ENDPOINT_FAMILIES.get(endpoint, cls.DEFAULT)
+
+    def _reserve(self, family: str) -> float:
+        bucket = self._buckets.get(family)
+        if bucket is None:
+            return 0.0
+        with self._lock:
+            delay = bucket.reserve()
+            if delay:
+                self._waiting[family] += 1
+        return delay
+
+    def _done_waiting(self, family: str):
+        with self._lock:
+            self._waiting[family] -= 1
+
+    def acquire(self, family: str):
+        """Blocks until a request of `family` may be sent."""
+        delay = self._reserve(family)
+        if delay:
+            try:
+                time.sleep(delay)
+            finally:
+                self._done_waiting(family)
+
+    async def acquire_async(self, family: str):
+        """Waits, without blocking the event loop, until a request of `family` may be sent."""
+        delay = self._reserve(family)
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._done_waiting(family)
+
+    def queue_depth(self, family: Optional[str] = None) -> int:
+        """How many callers are waiting for `family`, or for any family when None."""
+        with self._lock:
+            if family is not None:
+                return self._waiting[family]
+            return sum(self._waiting.values())
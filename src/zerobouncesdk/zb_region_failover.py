@@ -0,0 +1,182 @@
+import threading
+import time
+from collections import deque
+from datetime import timedelta
+from typing import Dict, List, Optional, Sequence, Union
+
+from . import ZBApiUrl, ZBClientException
+
+_MIN_HEDGE_SAMPLES = 20
+
+
+def _region_url(region: Union[ZBApiUrl, str]) -> str:
+    url = region.value if isinstance(region, ZBApiUrl) else region
+    if not isinstance(url, str) or not url.lower().startswith("https://"):
+        raise ZBClientException("Invalid parameter: regions must be ZBApiUrl values or https:// URLs")
+    return url.rstrip("/")
+
+
+class _RegionHealth:
+    """The circuit breaker and recent latencies of one region."""
+
+    def __init__(self, latency_window: int):
+        self.consecutive_failures = 0
+        self.open_until: Optional[float] = None
+        self.probing = False  # a request is testing the half-open circuit
+        self.latencies = deque(maxlen=latency_window)
+
+
+class ZBRegionFailover:
+    """Spreads the requests of a client over several API regions.
+
+    Requests go to the first healthy region of `regions`. Each region has a
+    circuit breaker: after `failure_threshold` consecutive failures (connection
+    errors, timeouts, 5xx responses, and calls slower than `slow_call` when it is
+    set) the region is skipped for `reset_timeout`. Then a single request probes
+    it while the others keep skipping it: a success closes the circuit, a failure
+    opens it again. A request that fails on one region is sent to the next one
+    right away, so a caller only sees the error when every region failed. When
+    every breaker is open the regions are still tried in order.
+
+    With `hedge_validate`, a validate call that has not been answered after the
+    95th percentile of the region's recent latencies (or `hedge_after` until
+    enough calls were seen) is also sent to the next healthy region, and the
+    first answer wins. A hedged call may be charged twice.
+
+    Only the regional API endpoints fail over; the bulk and scoring file
+    endpoints have a single host.
+
+    Example
+    -------
+    failover = ZBRegionFailover([ZBApiUrl.API_USA_URL, ZBApiUrl.API_EU_URL], hedge_validate=True)
+    zero_bounce = ZeroBounce("<YOUR_API_KEY>", failover=failover)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        regions: Sequence[Union[ZBApiUrl, str]] = (ZBApiUrl.API_USA_URL, ZBApiUrl.API_EU_URL),
+        failure_threshold: int = 5,
+        reset_timeout: timedelta = timedelta(seconds=30),
+        slow_call: Optional[timedelta] = None,
+        hedge_validate: bool = False,
+        hedge_after: timedelta = timedelta(seconds=1),
+        latency_window: int = 200,
+    ):
+        """
+        Parameters
+        ----------
+        regions: Sequence[Union[ZBApiUrl, str]], default USA then EU
+            The base URLs to use, in order of preference
+        failure_threshold: int, default 5
+            How many consecutive failures open a region's circuit
+        reset_timeout: timedelta, default 30 seconds
+            How long an open region is skipped before it is tried again
+        slow_call: timedelta or None
+            Calls slower than this count as failures
+        hedge_validate: bool, default False
+            Send a slow validate call to a second region as well
+        hedge_after: timedelta, default 1 second
+            The hedging delay used until a region has enough latency samples
+        latency_window: int, default 200
+            How many recent latencies are kept per region
+        """
+        self.regions: List[str] = list(dict.fromkeys(_region_url(region) for region in regions))
+        if not self.regions:
+            raise ZBClientException("Empty parameter: regions")
+        if failure_threshold < 1:
+            raise ZBClientException("Invalid parameter: failure_threshold must be at least 1")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_s = reset_timeout.total_seconds()
+        self._slow_call_s = slow_call.total_seconds() if slow_call is not None else None
+        self.hedge_validate = hedge_validate
+        self._hedge_after_s = hedge_after.total_seconds()
+        self._health: Dict[str, _RegionHealth] = {r: _RegionHealth(latency_window) for r in self.regions}
+        self._lock = threading.Lock()
+        self.failovers = 0
+        """How many requests were sent again to another region after a failure"""
+        self.hedges = 0
+        """How many validate calls were hedged"""
+
+    def state(self, region: str) -> str:
+        """The circuit state of a region: CLOSED, OPEN or HALF_OPEN."""
+        health = self._health[region]
+        with self._lock:
+            if health.open_until is None:
+                return self.CLOSED
+            return self.OPEN if time.monotonic() < health.open_until else self.HALF_OPEN
+
+    def candidates(self) -> List[str]:
+        """The regions to try for a request, healthy ones first, in preference order.
+
+        A half-open region counts as healthy until a request starts probing it.
+        """
+        now = time.monotonic()
+        with self._lock:
+            healthy = [
+                r for r in self.regions
+                if self._health[r].open_until is None
+                or (self._health[r].open_until <= now and not self._health[r].probing)
+            ]
+        return healthy + [r for r in self.regions if r not in healthy]
+
+    def begin_call(self, region: str) -> bool:
+        """Whether a request may go to `region` now.
+
+        A request to a half-open region becomes its probe; False while another
+        request is probing it. Closed regions, and open ones tried as a last
+        resort, always take requests.
+        """
+        health = self._health[region]
+        with self._lock:
+            if health.open_until is None or time.monotonic() < health.open_until:
+                return True
+            if health.probing:
+                return False
+            health.probing = True
+            return True
+
+    def abandon_call(self, region: str):
+        """Ends a request to `region` that neither succeeded nor failed, e.g. a cancelled one."""
+        with self._lock:
+            self._health[region].probing = False
+
+    def record_success(self, region: str, latency_s: float):
+        health = self._health[region]
+        with self._lock:
+            health.latencies.append(latency_s)
+        if self._slow_call_s is not None and latency_s > self._slow_call_s:
+            self.record_failure(region)
+            return
+        with self._lock:
+            health.consecutive_failures = 0
+            health.open_until = None
+            health.probing = False
+
+    def record_failure(self, region: str):
+        health = self._health[region]
+        with self._lock:
+            health.consecutive_failures += 1
+            health.probing = False
+            half_open = health.open_until is not None
+            if half_open or health.consecutive_failures >= self._failure_threshold:
+                health.open_until = time.monotonic() + self._reset_timeout_s
+
+    def record_failover(self):
+        with self._lock:
+            self.failovers += 1
+
+    def record_hedge(self):
+        with self._lock:
+            self.hedges += 1
+
+    def hedge_delay_s(self, region: str) -> float:
+        """How long to wait for a region before hedging a validate call."""
+        with self._lock:
+            latencies = sorted(self._health[region].latencies)
+        if len(latencies) < _MIN_HEDGE_SAMPLES:
+            return self._hedge_after_s
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
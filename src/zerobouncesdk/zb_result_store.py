@@ -0,0 +1,247 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+from . import ZBClientException, ZBValidateResponse, ZBValidateStatus
+from . import _zb_json
+from ._zb_utils import parse_datetime
+from .zb_compact_validate_response import ZBCompactValidateResponse
+from .zb_lazy_validate_response import ZBLazyValidateResponse
+from .zb_validate_batch_response import ZBValidateBatchError
+
+if TYPE_CHECKING:
+    from .zerobouncesdk import ZeroBounce
+
+_StoredResult = Union[ZBValidateResponse, ZBCompactValidateResponse, dict]
+
+# SQLite builds before 3.32 accept at most 999 parameters per statement
+_QUERY_CHUNK_SIZE = 500
+
+
+def _raw_values(result: _StoredResult) -> dict:
+    """The result as the JSON values the API sends."""
+    if isinstance(result, dict):
+        values = dict(result)
+    elif isinstance(result, ZBCompactValidateResponse):
+        values = result.to_dict()
+    else:
+        if isinstance(result, ZBLazyValidateResponse):
+            result.decode()
+        values = dict(vars(result))
+    for name, value in values.items():
+        if isinstance(value, Enum):
+            values[name] = value.value
+        elif isinstance(value, datetime):
+            values[name] = value.strftime(ZBValidateResponse.PROCESSED_AT_FORMAT)
+    return values
+
+
+def _checked_at(values: dict) -> float:
+    """When the result was produced, as a UNIX timestamp: its processed_at, or now."""
+    processed_at = values.get("processed_at")
+    if processed_at:
+        try:
+            parsed = parse_datetime(processed_at, ZBValidateResponse.PROCESSED_AT_FORMAT)
+        except (TypeError, ValueError):
+            pass
+        else:
+            # the API sends processed_at in UTC, without an offset
+            return parsed.replace(tzinfo=parsed.tzinfo or timezone.utc).timestamp()
+    return time.time()
+
+
+class ZBResultStore:
+    """Keeps the latest validate result of every address in a local SQLite file.
+
+    Each result is dated by its `processed_at`, or by when it was stored when it
+    has none, and counts as stale once it is older than the maximum age of its
+    status. `stale` picks out the addresses of a list that need validating again,
+    and `refresh` validates just those and stores the results, which turns the
+    re-validation of a whole list into a job that only touches its stale rows.
+
+    Addresses are matched case-insensitively. The file can be shared by several
+    worker processes.
+
+    Example
+    -------
+    store = ZBResultStore("/var/lib/zb/results.sqlite")
+    store.refresh(zero_bounce, addresses)   # nightly: only missing or stale addresses are sent
+    result = store.get("jane@example.com")
+    """
+
+    DEFAULT_MAX_AGES: Dict[ZBValidateStatus, timedelta] = {
+        ZBValidateStatus.valid: timedelta(days=30),
+        ZBValidateStatus.invalid: timedelta(days=90),
+        ZBValidateStatus.catch_all: timedelta(days=7),
+        ZBValidateStatus.unknown: timedelta(days=1),
+        ZBValidateStatus.spamtrap: timedelta(days=90),
+        ZBValidateStatus.abuse: timedelta(days=90),
+        ZBValidateStatus.do_not_mail: timedelta(days=90),
+    }
+
+    def __init__(
+        self,
+        path: str,
+        max_ages: Optional[Dict[ZBValidateStatus, timedelta]] = None,
+        default_max_age: timedelta = timedelta(days=1),
+    ):
+        """
+        Parameters
+        ----------
+        path: str
+            The SQLite file, created when missing
+        max_ages: Optional[Dict[ZBValidateStatus, timedelta]]
+            Per-status maximum ages, merged over DEFAULT_MAX_AGES.
+        default_max_age: timedelta, default 1 day
+            The maximum age for statuses missing from `max_ages`.
+        """
+        self._max_ages = dict(self.DEFAULT_MAX_AGES)
+        if max_ages:
+            self._max_ages.update(max_ages)
+        self._default_max_age = default_max_age
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS zb_validate_results "
+                "(key TEXT PRIMARY KEY, status TEXT, checked_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def key(email: str) -> str:
+        return email.strip().lower()
+
+    def max_age_for(self, status: Optional[str]) -> timedelta:
+        try:
+            return self._max_ages.get(ZBValidateStatus(status), self._default_max_age)
+        except ValueError:
+            return self._default_max_age
+
+    def put(self, results: Iterable[_StoredResult]) -> int:
+        """Stores validate results, each replacing any older result of its address.
+
+        Parameters
+        ----------
+        results: Iterable[Union[ZBValidateResponse, ZBCompactValidateResponse, dict]]
+            Results of `validate`, `validate_batch` or `validate_many`, or the
+            decoded JSON of API results. ZBValidateBatchError items are skipped.
+
+        Returns
+        -------
+        stored: int
+            How many results were given to the store
+        """
+        rows = []
+        for result in results:
+            if isinstance(result, ZBValidateBatchError):
+                continue
+            values = _raw_values(result)
+            if not values.get("address"):
+                raise ZBClientException("Invalid parameter: a stored result must have an address")
+            rows.append((self.key(values["address"]), values.get("status"), _checked_at(values), json.dumps(values)))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO zb_validate_results (key, status, checked_at, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET "
+                "status = excluded.status, checked_at = excluded.checked_at, value = excluded.value "
+                "WHERE excluded.checked_at >= zb_validate_results.checked_at",
+                rows,
+            )
+        return len(rows)
+
+    def get(self, email: str) -> Optional[ZBValidateResponse]:
+        """The stored result of `email`, however old, or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM zb_validate_results WHERE key = ?", (self.key(email),)
+            ).fetchone()
+        return ZBValidateResponse(_zb_json.loads(row[0])) if row else None
+
+    def stale(self, emails: Iterable[str], now: Optional[datetime] = None) -> List[str]:
+        """The addresses of `emails` with no stored result, or one older than its status allows.
+
+        Repeated addresses are returned once, in the order they first appear.
+
+        Parameters
+        ----------
+        emails: Iterable[str]
+            The addresses to check
+        now: datetime, optional
+            The time ages are measured at, the current time by default
+        """
+        now_s = time.time() if now is None else now.timestamp()
+        first = {}
+        for email in emails:
+            first.setdefault(self.key(email), email)
+        keys = list(first)
+
+        checked = {}
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+                chunk = keys[start:start + _QUERY_CHUNK_SIZE]
+                checked.update(
+                    (key, (status, checked_at)) for key, status, checked_at in self._connection.execute(
+                        "SELECT key, status, checked_at FROM zb_validate_results "
+                        f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                )
+
+        max_ages_s = {}
+        stale = []
+        for key in keys:
+            entry = checked.get(key)
+            if entry is not None:
+                status, checked_at = entry
+                if status not in max_ages_s:
+                    max_ages_s[status] = self.max_age_for(status).total_seconds()
+                if now_s - checked_at <= max_ages_s[status]:
+                    continue
+            stale.append(first[key])
+        return stale
+
+    def refresh(self, zero_bounce: "ZeroBounce", emails: Iterable[str], concurrency: int = 4) -> int:
+        """Validates the `stale` addresses of `emails` with `validate_many` and stores the results.
+
+        Addresses the API answers with an error stay stale, so the next refresh
+        tries them again.
+
+        Parameters
+        ----------
+        zero_bounce: ZeroBounce
+            The client to validate with
+        emails: Iterable[str]
+            The whole list; only its stale addresses are sent
+        concurrency: int, default 4
+            How many validatebatch requests may run at the same time
+
+        Returns
+        -------
+        stored: int
+            How many results were validated and stored
+        """
+        stored = 0
+        pending = []
+        for result in zero_bounce.validate_many(self.stale(emails), concurrency=concurrency, compact=True):
+            pending.append(result)
+            if len(pending) >= _QUERY_CHUNK_SIZE:
+                stored += self.put(pending)
+                pending.clear()
+        return stored + self.put(pending)
+
+    def clear(self):
+        """Removes every stored result."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM zb_validate_results")
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM zb_validate_results").fetchone()[0]
@@ -0,0 +1,130 @@
+import random
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+
+from . import ZBClientException
+from .zb_rate_limiter import ZBRateLimiter
+
+
+class ZBRetryPolicy:
+    """When and how long to wait before a failed request is sent again.
+
+    A request is retried after a connection error, a timeout, or a response
+    whose status is in `retry_statuses`, until `max_attempts` attempts were
+    made. Waits grow exponentially from `backoff` up to `max_backoff`, with full
+    jitter so that many clients do not retry in lockstep. A ``Retry-After``
+    header is honored instead, unless it asks for more than `max_retry_after`,
+    in which case the response is returned as is.
+
+    Only requests that are safe to repeat are retried: every GET and
+    validatebatch. sendfile is retried only with `retry_sendfile`, and only when
+    the uploaded stream can be rewound, since a retry after the server accepted
+    the file would start a second job.
+
+    The counters (`retries`, `exhausted`) may be read at any time; a policy can be
+    shared by several clients.
+    """
+
+    DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: timedelta = timedelta(milliseconds=500),
+        max_backoff: timedelta = timedelta(seconds=30),
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        max_retry_after: timedelta = timedelta(minutes=1),
+        retry_sendfile: bool = False,
+    ):
+        """
+        Parameters
+        ----------
+        max_attempts: int, default 3
+            How many times a request may be sent in total
+        backoff: timedelta, default 500 ms
+            The wait before the first retry, doubled for every later one
+        max_backoff: timedelta, default 30 seconds
+            The longest wait between two attempts, Retry-After aside
+        jitter: bool, default True
+            Wait a random time between zero and the backoff
+        retry_statuses: Iterable[int], default 429, 500, 502, 503 and 504
+            The HTTP statuses worth retrying
+        max_retry_after: timedelta, default 1 minute
+            The longest Retry-After to honor
+        retry_sendfile: bool, default False
+            Also retry sendfile uploads whose file stream can be rewound
+        """
+        if max_attempts < 1:
+            raise ZBClientException("Invalid parameter: max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self._backoff_s = backoff.total_seconds()
+        self._max_backoff_s = max_backoff.total_seconds()
+        self._jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self._max_retry_after_s = max_retry_after.total_seconds()
+        self.retry_sendfile = retry_sendfile
+        self._lock = threading.Lock()
+        self.retries: Dict[str, int] = Counter()
+        """How many retries were made, by endpoint family"""
+        self.exhausted: Dict[str, int] = Counter()
+        """How many retryable failures were given up on, by endpoint family"""
+
+    def allows(self, method: str, url: str) -> bool:
+        """Whether a request may be sent more than once."""
+        if method == "GET":
+            return True
+        endpoint = url.rstrip("/").rsplit("/", 1)[-1]
+        if endpoint == "validatebatch":
+            return True
+        return endpoint == "sendfile" and self.retry_sendfile
+
+    def backoff_s(self, attempt: int) -> float:
+        """The wait in seconds after the failed attempt number `attempt` (from 1)."""
+        delay = min(self._max_backoff_s, self._backoff_s * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self._jitter else delay
+
+    def retry_after_s(self, value: Optional[str]) -> Optional[float]:
+        """The wait asked for by a Retry-After header, in seconds, or None."""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def delay_for_status(self, attempt: int, retry_after: Optional[str]) -> Optional[float]:
+        """The wait before retrying a response, or None when it must not be retried."""
+        if attempt >= self.max_attempts:
+            return None
+        wait = self.retry_after_s(retry_after)
+        if wait is None:
+            return self.backoff_s(attempt)
+        return wait if wait <= self._max_retry_after_s else None
+
+    def delay_for_error(self, attempt: int) -> Optional[float]:
+        """The wait before retrying a request that raised, or None when it must not be retried."""
+        return self.backoff_s(attempt) if attempt < self.max_attempts else None
+
+    def record(self, url: str, retrying: bool):
+        family = ZBRateLimiter.family_for(url)
+        with self._lock:
+            if retrying:
+                self.retries[family] += 1
+            else:
+                self.exhausted[family] += 1
+
+    @property
+    def retry_count(self) -> int:
+        """The total number of retries made"""
+        with self._lock:
+            return sum(self.retries.values())
@@ -0,0 +1,21 @@
+from typing import List
+
+from ._zb_response import ZBResponse
+from .zb_send_file_response import ZBSendFileResponse
+
+
+class ZBShardedSendFileResponse(ZBResponse):
+    """This is the response of `send_file_sharded`: one sendfile job per shard."""
+
+    responses: List[ZBSendFileResponse] = None
+    """The sendfile response of each shard, in the order of the shards in the file"""
+
+    @property
+    def file_ids(self) -> List[str]:
+        """The file ID of each shard, to pass to `get_file_sharded`"""
+        return [response.file_id for response in self.responses]
+
+    @property
+    def success(self) -> bool:
+        """Whether every shard was accepted"""
+        return all(response.success for response in self.responses)
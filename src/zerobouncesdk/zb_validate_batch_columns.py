@@ -0,0 +1,230 @@
+import csv
+from array import array
+from itertools import accumulate, chain, compress
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple, Union
+
+from . import ZBClientException, ZBValidateStatus, ZBValidateSubStatus
+from .zb_lazy_validate_response import _LazyList
+from .zb_validate_batch_response import ZBValidateBatchError, ZBValidateBatchResponse
+
+_CODE_COLUMNS = ("status", "sub_status", "free_email", "mx_found")
+
+_Criterion = Union[None, object, Iterable[object]]
+
+
+def _codes_for(members: tuple) -> dict:
+    # both the enum members and their raw API values map to the member's index
+    codes = {member: index for index, member in enumerate(members)}
+    codes.update({member.value: index for index, member in enumerate(members)})
+    return codes
+
+
+_STATUS_CODES = _codes_for(tuple(ZBValidateStatus))
+_SUB_STATUS_CODES = _codes_for(tuple(ZBValidateSubStatus))
+_BOOL_CODES = {True: 1, False: 0, "true": 1, "false": 0, "True": 1, "False": 0}
+
+
+def _mask(column: array, codes: Iterable[int]) -> bytes:
+    """One byte per row, 1 where the row's code is one of `codes`."""
+    table = bytearray(256)
+    for code in codes:
+        table[code & 0xFF] = 1
+    return column.tobytes().translate(table)
+
+
+def _and(first: bytes, second: bytes) -> bytes:
+    both = int.from_bytes(first, "little") & int.from_bytes(second, "little")
+    return both.to_bytes(len(first), "little")
+
+
+class ZBValidateBatchColumns:
+    """Validation results stored column by column instead of one object per email.
+
+    `addresses` is a list of the address strings, and `status`, `sub_status`,
+    `free_email` and `mx_found` are ``array("b")`` columns of small integer codes:
+    the index of the member in `STATUSES` or `SUB_STATUSES`, 1 or 0 for the
+    booleans, and `NULL` (-1) when the API sent no value or one the SDK does not
+    know.
+
+    Responses are appended without building a result object per email when they
+    come from ``validate_batch(..., lazy=True)``. Filtering, counting and the
+    exports work on whole columns at once.
+
+    Example
+    -------
+    columns = ZBValidateBatchColumns()
+    for batch in batches:
+        columns.append(zero_bounce.validate_batch(batch, lazy=True))
+    valid = columns.filter(status=ZBValidateStatus.valid, free_email=False)
+    valid.to_csv("valid.csv")
+    """
+
+    STATUSES: Tuple[ZBValidateStatus, ...] = tuple(ZBValidateStatus)
+    """The statuses, in the order of their codes"""
+
+    SUB_STATUSES: Tuple[ZBValidateSubStatus, ...] = tuple(ZBValidateSubStatus)
+    """The sub-statuses, in the order of their codes"""
+
+    NULL = -1
+    """The code of a missing or unknown value"""
+
+    def __init__(self):
+        self.addresses: List[str] = []
+        self.status = array("b")
+        self.sub_status = array("b")
+        self.free_email = array("b")
+        self.mx_found = array("b")
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def append(self, response: Union[ZBValidateBatchResponse, dict]):
+        """Adds the email_batch results of a validatebatch response.
+
+        Parameters
+        ----------
+        response: ZBValidateBatchResponse or dict
+            The response, or the decoded JSON body of one. The errors are ignored.
+        """
+        if isinstance(response, dict):
+            self._append_raw(response.get("email_batch") or [])
+        elif isinstance(response.email_batch, _LazyList):
+            # the raw API values, so no result object gets built
+            self._append_raw(response.email_batch._values)
+        else:
+            self.extend(response.email_batch)
+
+    def extend(self, results: Iterable):
+        """Adds validation results, such as the ones yielded by `validate_many`.
+
+        ZBValidateBatchError results are skipped.
+        """
+        results = [result for result in results if not isinstance(result, ZBValidateBatchError)]
+        self.addresses.extend([result.address or "" for result in results])
+        self.status.extend([_STATUS_CODES.get(result.status, self.NULL) for result in results])
+        self.sub_status.extend([_SUB_STATUS_CODES.get(result.sub_status, self.NULL) for result in results])
+        self.free_email.extend([_BOOL_CODES.get(result.free_email, self.NULL) for result in results])
+        self.mx_found.extend([_BOOL_CODES.get(result.mx_found, self.NULL) for result in results])
+
+    def _append_raw(self, rows: List[dict]):
+        self.addresses.extend([row.get("address") or "" for row in rows])
+        self.status.extend([_STATUS_CODES.get(row.get("status"), self.NULL) for row in rows])
+        self.sub_status.extend([_SUB_STATUS_CODES.get(row.get("sub_status"), self.NULL) for row in rows])
+        self.free_email.extend([_BOOL_CODES.get(row.get("free_email"), self.NULL) for row in rows])
+        self.mx_found.extend([_BOOL_CODES.get(row.get("mx_found"), self.NULL) for row in rows])
+
+    def row(self, index: int) -> dict:
+        """The values of one row, decoded."""
+        return {
+            "address": self.addresses[index],
+            "status": self._decode(self.STATUSES, self.status[index]),
+            "sub_status": self._decode(self.SUB_STATUSES, self.sub_status[index]),
+            "free_email": self._decode((False, True), self.free_email[index]),
+            "mx_found": self._decode((False, True), self.mx_found[index]),
+        }
+
+    @classmethod
+    def _decode(cls, members: tuple, code: int):
+        return None if code == cls.NULL else members[code]
+
+    def mask(
+        self,
+        status: _Criterion = None,
+        sub_status: _Criterion = None,
+        free_email: Optional[bool] = None,
+        mx_found: Optional[bool] = None,
+    ) -> bytes:
+        """One byte per row, 1 for the rows matching every given criterion.
+
+        `status` and `sub_status` take one member or several; None means any value.
+        """
+        mask = b"\x01" * len(self)
+        criteria = (
+            (self.status, _STATUS_CODES, status),
+            (self.sub_status, _SUB_STATUS_CODES, sub_status),
+            (self.free_email, _BOOL_CODES, free_email),
+            (self.mx_found, _BOOL_CODES, mx_found),
+        )
+        for column, codes, wanted in criteria:
+            if wanted is None:
+                continue
+            if isinstance(wanted, (str, bool, ZBValidateStatus, ZBValidateSubStatus)):
+                wanted = (wanted,)
+            try:
+                wanted_codes = [codes[value] for value in wanted]
+            except KeyError as e:
+                raise ZBClientException(f"Invalid parameter: unknown value {e.args[0]!r}") from None
+            mask = _and(mask, _mask(column, wanted_codes))
+        return mask
+
+    def indices(self, **criteria) -> List[int]:
+        """The indices of the rows matching the criteria of `mask`."""
+        return list(compress(range(len(self)), self.mask(**criteria)))
+
+    def filter(self, **criteria) -> "ZBValidateBatchColumns":
+        """A new container with the rows matching the criteria of `mask`, in order."""
+        return self.take(self.mask(**criteria))
+
+    def take(self, mask: bytes) -> "ZBValidateBatchColumns":
+        """A new container with the rows whose byte in `mask` is not zero."""
+        taken = ZBValidateBatchColumns()
+        taken.addresses = list(compress(self.addresses, mask))
+        for name in _CODE_COLUMNS:
+            setattr(taken, name, array("b", compress(getattr(self, name), mask)))
+        return taken
+
+    def status_counts(self) -> Dict[ZBValidateStatus, int]:
+        """How many rows have each status, statuses with no row left out."""
+        data = self.status.tobytes()
+        counts = {status: data.count(bytes((code,))) for code, status in enumerate(self.STATUSES)}
+        return {status: count for status, count in counts.items() if count}
+
+    def group_by_status(self) -> Dict[ZBValidateStatus, "ZBValidateBatchColumns"]:
+        """The rows split by status, statuses with no row left out."""
+        return {status: self.filter(status=status) for status in self.status_counts()}
+
+    def to_csv(self, target: Union[str, TextIO]):
+        """Writes the rows as CSV, with a header row, to a path or a text stream."""
+        if isinstance(target, str):
+            with open(target, "w", newline="", encoding="utf-8") as stream:
+                return self.to_csv(stream)
+        # code NULL (-1) indexes the trailing empty string
+        status_names = [status.value for status in self.STATUSES] + [""]
+        sub_status_names = [sub_status.value for sub_status in self.SUB_STATUSES] + [""]
+        bool_names = ["false", "true", ""]
+        writer = csv.writer(target)
+        writer.writerow(("address",) + _CODE_COLUMNS)
+        writer.writerows(zip(
+            self.addresses,
+            map(status_names.__getitem__, self.status),
+            map(sub_status_names.__getitem__, self.sub_status),
+            map(bool_names.__getitem__, self.free_email),
+            map(bool_names.__getitem__, self.mx_found),
+        ))
+
+    def to_buffers(self) -> Dict[str, memoryview]:
+        """The columns as buffers laid out the way Apache Arrow expects.
+
+        ``address_offsets`` (int32, one more than the row count) and
+        ``address_data`` (UTF-8) form an Arrow string array; the other columns are
+        int8, with `NULL` for missing values. For example, with pyarrow::
+
+            buffers = columns.to_buffers()
+            addresses = pa.Array.from_buffers(pa.string(), len(columns), [
+                None, pa.py_buffer(buffers["address_offsets"]), pa.py_buffer(buffers["address_data"])
+            ])
+            status = pa.Array.from_buffers(pa.int8(), len(columns), [None, pa.py_buffer(buffers["status"])])
+        """
+        text = "".join(self.addresses)
+        if text.isascii():
+            lengths = map(len, self.addresses)
+        else:
+            lengths = (len(address.encode("utf-8")) for address in self.addresses)
+        offsets = array("i", chain((0,), accumulate(lengths)))
+        buffers = {
+            "address_offsets": memoryview(offsets),
+            "address_data": memoryview(text.encode("utf-8")),
+        }
+        for name in _CODE_COLUMNS:
+            buffers[name] = memoryview(getattr(self, name))
+        return buffers
@@ -1,6 +1,8 @@
 from typing import List
 
 from ._zb_response import ZBResponse
+from .zb_compact_validate_response import ZBCompactValidateBatchEmail
+from .zb_lazy_validate_response import ZBLazyValidateBatchEmail, _LazyList
 from .zb_validate_response import ZBValidateResponse
 
 
@@ -18,11 +20,20 @@ class ZBValidateBatchResponse(ZBResponse):
     """This is the response for the POST /validatebatch request."""
 
     email_batch: List[ZBValidateBatchEmail] = None
-    """An Array of validated emails"""
+    """An Array of validated emails, ZBCompactValidateBatchEmail objects when built with `compact`.
+    When built with `lazy`, a read-only sequence whose elements are built on first access,
+    as ZBLazyValidateBatchEmail objects unless `compact` is set too."""
 
     errors: List[ZBValidateBatchError] = None
     """An Array of errors encountered, if any"""
 
-    def __init__(self, data):
-        self.email_batch = [ZBValidateBatchEmail(email) for email in data.get("email_batch", [])]
+    def __init__(self, data, compact: bool = False, lazy: bool = False):
+        if compact:
+            email_class = ZBCompactValidateBatchEmail
+        else:
+            email_class = ZBLazyValidateBatchEmail if lazy else ZBValidateBatchEmail
+        if lazy:
+            self.email_batch = _LazyList(data.get("email_batch", []), email_class)
+        else:
+            self.email_batch = [email_class(email) for email in data.get("email_batch", [])]
         self.errors = [ZBValidateBatchError(error) for error in data.get("errors", [])]
@@ -0,0 +1,215 @@
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Dict, Optional
+
+from . import ZBClientException, ZBValidateStatus
+from . import _zb_json
+
+
+class ZBCacheBackend(ABC):
+    """The storage interface used by `ZBValidateCache`.
+
+    Implement `get`, `set` and `clear` to share cached results through any store
+    (a local file, Redis, ...). Values are the raw JSON dicts returned by the API.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict]:
+        """Returns the stored value, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: dict, ttl_s: float):
+        """Stores the value for `ttl_s` seconds."""
+
+    @abstractmethod
+    def clear(self):
+        """Removes every stored value."""
+
+
+class ZBMemoryCacheBackend(ZBCacheBackend):
+    """An in-process, thread-safe LRU cache holding at most `max_size` entries."""
+
+    def __init__(self, max_size: int = 10000):
+        if max_size < 1:
+            raise ZBClientException("Invalid parameter: max_size must be at least 1")
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(value)
+
+    def set(self, key: str, value: dict, ttl_s: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_s, dict(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class ZBSqliteCacheBackend(ZBCacheBackend):
+    """A cache stored in a local SQLite file, shareable by several worker processes.
+
+    Expired rows are deleted every `purge_every` writes, or with `purge`, so the
+    file does not keep growing in a long-lived process.
+    """
+
+    def __init__(self, path: str, purge_every: int = 1000):
+        """
+        Parameters
+        ----------
+        path: str
+            The SQLite file, created when missing
+        purge_every: int, default 1000
+            How many writes go between two purges of the expired rows; 0 only
+            purges when `purge` is called
+        """
+        if purge_every < 0:
+            raise ZBClientException("Invalid parameter: purge_every must not be negative")
+        self._purge_every = purge_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS zb_validate_cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS zb_validate_cache_expires_at ON zb_validate_cache (expires_at)"
+            )
+
+    def get(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM zb_validate_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return _zb_json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: dict, ttl_s: float):
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO zb_validate_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now + ttl_s),
+            )
+            self._writes += 1
+            if self._purge_every and self._writes >= self._purge_every:
+                self._writes = 0
+                self._delete_expired(now)
+
+    def purge(self) -> int:
+        """Deletes the expired rows; how many were deleted."""
+        with self._lock, self._connection:
+            return self._delete_expired(time.time())
+
+    def _delete_expired(self, now: float) -> int:
+        return self._connection.execute("DELETE FROM zb_validate_cache WHERE expires_at <= ?", (now,)).rowcount
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM zb_validate_cache")
+
+    def close(self):
+        self._connection.close()
+
+
+class ZBValidateCache:
+    """Caches validate results keyed on the normalized email and IP address.
+
+    Each result is kept for the TTL of its status, so definitive answers such as
+    ``invalid`` can live much longer than ``unknown`` or ``catch-all``. A TTL of
+    zero disables caching for that status.
+    """
+
+    DEFAULT_TTLS: Dict[ZBValidateStatus, timedelta] = {
+        ZBValidateStatus.valid: timedelta(days=7),
+        ZBValidateStatus.invalid: timedelta(days=30),
+        ZBValidateStatus.catch_all: timedelta(hours=6),
+        ZBValidateStatus.unknown: timedelta(hours=1),
+        ZBValidateStatus.spamtrap: timedelta(days=30),
+        ZBValidateStatus.abuse: timedelta(days=30),
+        ZBValidateStatus.do_not_mail: timedelta(days=30),
+    }
+
+    def __init__(
+        self,
+        backend: Optional[ZBCacheBackend] = None,
+        ttls: Optional[Dict[ZBValidateStatus, timedelta]] = None,
+        default_ttl: timedelta = timedelta(hours=1),
+    ):
+        """
+        Parameters
+        ----------
+        backend: Optional[ZBCacheBackend], default ZBMemoryCacheBackend()
+            Where the results are stored.
+        ttls: Optional[Dict[ZBValidateStatus, timedelta]]
+            Per-status TTLs, merged over DEFAULT_TTLS.
+        default_ttl: timedelta, default 1 hour
+            The TTL for statuses missing from `ttls`.
+        """
+        self._backend = backend if backend is not None else ZBMemoryCacheBackend()
+        self._ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self._ttls.update(ttls)
+        self._default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self.hits = 0
+        """Number of lookups answered from the cache."""
+        self.misses = 0
+        """Number of lookups that had to call the API."""
+
+    @staticmethod
+    def key(email: str, ip_address: str = None) -> str:
+        return f"{email.strip().lower()}|{(ip_address or '').strip()}"
+
+    def ttl_for(self, status: Optional[str]) -> timedelta:
+        try:
+            return self._ttls.get(ZBValidateStatus(status), self._default_ttl)
+        except ValueError:
+            return self._default_ttl
+
+    def get(self, email: str, ip_address: str = None) -> Optional[dict]:
+        value = self._backend.get(self.key(email, ip_address))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, email: str, ip_address: str, value: dict):
+        ttl_s = self.ttl_for(value.get("status")).total_seconds()
+        if ttl_s > 0:
+            self._backend.set(self.key(email, ip_address), value, ttl_s)
+
+    def clear(self):
+        self._backend.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,137 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from typing import List, Tuple
+
+from . import ZBClientException, ZBValidateBatchElement
+from ._zb_batch import VALIDATE_BATCH_MAX_SIZE, match_batch_results
+
+_CLOSE = object()
+
+
+class ZBValidateDispatcher:
+    """Turns single address submissions into validatebatch requests.
+
+    `submit` returns immediately with a future. Submissions are gathered until
+    `max_batch_size` addresses are waiting or the oldest one has waited `max_wait`,
+    then sent together with `ZeroBounce.validate_batch`. Each future resolves to the
+    matching `ZBValidateBatchEmail` or `ZBValidateBatchError`, or to the exception
+    raised by the batch request.
+
+    Example
+    -------
+    with ZBValidateDispatcher(zero_bounce) as dispatcher:
+        future = dispatcher.submit("valid@example.com")
+        result = future.result()
+    """
+
+    def __init__(
+        self,
+        client,
+        max_batch_size: int = VALIDATE_BATCH_MAX_SIZE,
+        max_wait: timedelta = timedelta(milliseconds=20),
+        concurrency: int = 4,
+    ):
+        """
+        Parameters
+        ----------
+        client: ZeroBounce
+            The client used to send the batches
+        max_batch_size: int, default 100
+            The largest batch to send, at most 100
+        max_wait: timedelta, default 20 ms
+            How long a submission may wait for others to join its batch
+        concurrency: int, default 4
+            How many batches may be in flight at the same time
+        """
+        if not 1 <= max_batch_size <= VALIDATE_BATCH_MAX_SIZE:
+            raise ZBClientException(
+                f"Invalid parameter: max_batch_size must be between 1 and {VALIDATE_BATCH_MAX_SIZE}"
+            )
+        if concurrency < 1:
+            raise ZBClientException("Invalid parameter: concurrency must be at least 1")
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_wait_s = max_wait.total_seconds()
+        self._queue = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=concurrency)
+        self._collector = threading.Thread(
+            target=self._collect, name="ZBValidateDispatcher", daemon=True
+        )
+        self._collector.start()
+
+    def submit(self, email: str, ip_address: str = None) -> Future:
+        """Queues an address for validation.
+
+        Returns
+        -------
+        future: concurrent.futures.Future
+            Resolves to a ZBValidateBatchEmail or a ZBValidateBatchError
+
+        Raises
+        ------
+        ZBClientException
+            If the email is empty or the dispatcher is closed
+        """
+        element = ZBValidateBatchElement(email, ip_address)
+        future = Future()
+        with self._close_lock:
+            if self._closed:
+                raise ZBClientException("ZBValidateDispatcher is closed")
+            self._queue.put((element, future))
+        return future
+
+    def close(self):
+        """Sends the pending submissions and waits until every future is resolved."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_CLOSE)
+        self._collector.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _collect(self):
+        closing = False
+        while not closing:
+            item = self._queue.get()
+            if item is _CLOSE:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self._max_wait_s
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch: List[Tuple[ZBValidateBatchElement, Future]]):
+        batch = [(element, future) for element, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        elements = [element for element, _ in batch]
+        try:
+            response = self._client.validate_batch(elements)
+            results = match_batch_results(elements, response)
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from . import ZBValidateStatus, ZBValidateSubStatus
 from ._zb_response import ZBResponse
-from ._zb_utils import safe_enum_convert
+from ._zb_utils import parse_datetime, safe_enum_convert
 
 
 class ZBValidateResponse(ZBResponse):
@@ -73,9 +73,14 @@ class ZBValidateResponse(ZBResponse):
     processed_at: datetime = None
     """The UTC time the email was validated."""
 
+    decided_locally: bool = False
+    """True when the result comes from the client's ZBPreFilter and no request was made."""
+
+    PROCESSED_AT_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
     def __init__(self, data):
         super().__init__(data)
         self.status = safe_enum_convert(ZBValidateStatus, self.status, "status")
         self.sub_status = safe_enum_convert(ZBValidateSubStatus, self.sub_status, "sub_status")
         if self.processed_at is not None:
-            self.processed_at = datetime.strptime(self.processed_at, "%Y-%m-%d %H:%M:%S.%f")
+            self.processed_at = parse_datetime(self.processed_at, self.PROCESSED_AT_FORMAT)
@@ -1,12 +1,34 @@
-import json
 import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import date, timedelta
 import os
-from typing import BinaryIO, List, Optional, Union
+import tempfile
+import time
+from functools import partial
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Union
 
 import requests
+from requests import exceptions as requests_exceptions
+from requests.adapters import HTTPAdapter
 
 from .zb_get_file_options import ZBGetFileOptions
+from ._zb_batch import DuplicateFanOut, chunk_batch_elements, match_batch_results, with_local_results
+from ._zb_csv_shards import CsvShards, merge_result_files
+from ._zb_download import GetFileDownload, resume_plan, resume_request_headers
+from ._zb_file_results import FileResultRowParser
+from ._zb_json import JsonLoads, loads_object
+from . import _zb_json
+from ._zb_multipart import MultipartFileStream, ProgressCallback
+from ._zb_single_flight import SingleFlight
+from .zb_deduplicator import ZBDeduplicator
+from .zb_domain_format_cache import ZBDomainFormatCache
+from .zb_pre_filter import ZBPreFilter
+from .zb_rate_limiter import ZBRateLimiter
+from .zb_region_failover import ZBRegionFailover
+from .zb_retry_policy import ZBRetryPolicy
+from .zb_validate_cache import ZBValidateCache
 from . import (
     ZBApiException,
     ZBApiUrl,
@@ -14,16 +36,21 @@ from . import (
     ZBGetCreditsResponse,
     ZBGetApiUsageResponse,
     ZBGetActivityResponse,
+    ZBLazyValidateResponse,
     ZBValidateResponse,
     ZBValidateBatchElement,
     ZBValidateBatchResponse,
+    ZBValidateBatchEmail,
+    ZBValidateBatchError,
     ZBSendFileResponse,
+    ZBShardedSendFileResponse,
     ZBFileStatusResponse,
     ZBGetFileResponse,
     ZBDeleteFileResponse,
     ZBGuessFormatResponse,
     ZBFindEmailFormatResponse,
     ZBFindDomainResponse,
+    ZBFileResultRow,
 )
 
 
@@ -33,6 +60,12 @@ class ZeroBounce:
     BULK_BASE_URL = "https://bulkapi.zerobounce.net/v2"
     SCORING_BASE_URL = "https://bulkapi.zerobounce.net/v2/scoring"
     DEFAULT_HTTP_TIMEOUT_S = 120.0
+    DEFAULT_API_POOL_SIZE = 10
+    DEFAULT_BULK_POOL_SIZE = 4
+    DEFAULT_SCORING_POOL_SIZE = 4
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    UPLOAD_CHUNK_SIZE = 64 * 1024
+    _TRANSIENT_ERRORS = (requests_exceptions.ConnectionError, requests_exceptions.Timeout)
 
     @staticmethod
     def _require_https_url(url: str) -> str:
@@ -40,9 +73,28 @@ class ZeroBounce:
             raise ZBClientException("base_url must be an https:// URL")
         return url.rstrip("/")
 
-    def __init__(self, api_key: str, base_url: Optional[Union[ZBApiUrl, str]] = None, timeout: timedelta | None = None):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[Union[ZBApiUrl, str]] = None,
+        timeout: timedelta | None = None,
+        api_pool_size: int = DEFAULT_API_POOL_SIZE,
+        bulk_pool_size: int = DEFAULT_BULK_POOL_SIZE,
+        scoring_pool_size: int = DEFAULT_SCORING_POOL_SIZE,
+        validate_cache: Optional[ZBValidateCache] = None,
+        coalesce_validate: bool = True,
+        rate_limiter: Optional[ZBRateLimiter] = None,
+        retry_policy: Optional[ZBRetryPolicy] = None,
+        failover: Optional[ZBRegionFailover] = None,
+        json_loads: Optional[JsonLoads] = None,
+        pre_filter: Optional[ZBPreFilter] = None,
+        domain_format_cache: Optional[ZBDomainFormatCache] = None,
+    ):
         """Initialize the ZeroBounce client.
 
+        The client keeps a pooled, keep-alive HTTP session that is reused across
+        calls. Call `close()` when done, or use the client as a context manager.
+
         Parameters
         ----------
         api_key: str
@@ -51,6 +103,35 @@ class ZeroBounce:
             The base URL for the API. Can be a ZBApiUrl enum value, a custom URL string,
             or None to use the default URL.
         timeout: Optional[timedelta], default timeout to use for API requests.
+        api_pool_size: int, default 10
+            Maximum number of kept-alive connections to the API host.
+        bulk_pool_size: int, default 4
+            Maximum number of kept-alive connections to the bulk API.
+        scoring_pool_size: int, default 4
+            Maximum number of kept-alive connections to the scoring API.
+        validate_cache: Optional[ZBValidateCache]
+            When given, validate results are cached and reused until their TTL expires.
+        coalesce_validate: bool, default True
+            Concurrent validate calls for the same normalized email and IP address
+            share a single request, whose result or exception every caller receives.
+        rate_limiter: Optional[ZBRateLimiter]
+            When given, every request waits for its endpoint family's rate limit.
+            The same limiter may be shared by several clients.
+        retry_policy: Optional[ZBRetryPolicy]
+            When given, requests that are safe to repeat are retried after connection
+            errors, timeouts and transient HTTP statuses.
+        failover: Optional[ZBRegionFailover]
+            When given, API requests are spread over its regions with a circuit
+            breaker per region, and base_url is ignored.
+        json_loads: Optional[Callable[[bytes], Any]]
+            The function decoding response bodies. Defaults to orjson.loads or
+            ujson.loads when installed, else json.loads.
+        pre_filter: Optional[ZBPreFilter]
+            When given, validate and validatebatch answer the addresses it rejects
+            locally, without sending them.
+        domain_format_cache: Optional[ZBDomainFormatCache]
+            When given, find_domain results are cached per domain and company, and
+            find_email_format builds addresses from confidently known formats locally.
 
         Raises
         ------
@@ -60,35 +141,83 @@ class ZeroBounce:
         if not api_key.strip():
             raise ZBClientException("Empty parameter: api_key")
         self._api_key = api_key
-        
+        self._failover = failover
+        self._base_url = failover.regions[0] if failover is not None else self._resolve_base_url(base_url)
+        self._timeout_s: float = (
+            self.DEFAULT_HTTP_TIMEOUT_S if timeout is None else timeout.total_seconds()
+        )
+        self._check_pool_sizes(
+            api_pool_size=api_pool_size,
+            bulk_pool_size=bulk_pool_size,
+            scoring_pool_size=scoring_pool_size,
+        )
+        self._validate_cache = validate_cache
+        self._validate_flight = SingleFlight() if coalesce_validate else None
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._json_loads = json_loads or _zb_json.loads
+        self._pre_filter = pre_filter
+        self._domain_format_cache = domain_format_cache
+
+        self._session = requests.Session()
+        # Longest prefix wins when requests picks an adapter, so scoring gets its
+        # own pool even though it lives on the bulk API host.
+        regions = failover.regions if failover is not None else [self._base_url]
+        for prefix, size in (
+            *((region + "/", api_pool_size) for region in regions),
+            (self.BULK_BASE_URL + "/", bulk_pool_size),
+            (self.SCORING_BASE_URL + "/", scoring_pool_size),
+        ):
+            self._session.mount(
+                prefix, HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            )
+        self._hedge_executor = (
+            ThreadPoolExecutor(max_workers=2 * api_pool_size)
+            if failover is not None and failover.hedge_validate
+            else None
+        )
+
+    def close(self):
+        """Closes the pooled HTTP connections held by this client."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def _resolve_base_url(cls, base_url: Optional[Union[ZBApiUrl, str]]) -> str:
         # Handle base_url: enum, string, or default
         if base_url is None:
-            self._base_url = ZBApiUrl.API_DEFAULT_URL.value
+            url = ZBApiUrl.API_DEFAULT_URL.value
         elif isinstance(base_url, ZBApiUrl):
-            self._base_url = base_url.value
+            url = base_url.value
         elif isinstance(base_url, str):
-            self._base_url = self._require_https_url(base_url)
+            url = cls._require_https_url(base_url)
         else:
             raise ZBClientException(f"Invalid base_url type: {type(base_url)}. Expected ZBApiUrl, str, or None.")
-        
+
         # Remove trailing slash if present to maintain consistent URL construction
-        self._base_url = self._base_url.rstrip('/')
+        return url.rstrip('/')
 
-        self._timeout_s: float = (
-            self.DEFAULT_HTTP_TIMEOUT_S if timeout is None else timeout.total_seconds()
-        )
+    @staticmethod
+    def _check_pool_sizes(**sizes: int):
+        for name, size in sizes.items():
+            if size < 1:
+                raise ZBClientException(f"Invalid parameter: {name} must be at least 1")
 
     @staticmethod
     def get_file_json_indicates_error(body: str) -> bool:
         """Whether a getfile response body looks like a JSON error payload (including HTTP 200)."""
-        t = body.lstrip()
-        if not t or t[0] != "{":
-            return False
-        try:
-            o = json.loads(body)
-        except ValueError:
-            return False
-        if not isinstance(o, dict):
+        return ZeroBounce._json_object_indicates_error(loads_object(body))
+
+    @staticmethod
+    def _json_object_indicates_error(o: Optional[dict]) -> bool:
+        if o is None:
             return False
         if "success" in o:
             s = o["success"]
@@ -104,13 +233,9 @@ class ZeroBounce:
         return "success" in o
 
     @staticmethod
-    def _format_get_file_error_message(body: str) -> str:
-        try:
-            o = json.loads(body)
-        except ValueError:
+    def _format_get_file_error_message(body: str, o: Optional[dict]) -> str:
+        if o is None:
             return body if body else "Invalid getfile response"
-        if not isinstance(o, dict):
-            return body
         for k in ("message", "error", "error_message"):
             v = o.get(k)
             if not v:
@@ -121,33 +246,162 @@ class ZeroBounce:
                 return v[0].strip()
         return body
 
+    @classmethod
+    def _raise_for_get_file_error(
+        cls, status_code: int, body_bytes: bytes, content_type: str, json_loads: Optional[JsonLoads] = None
+    ):
+        body_str = body_bytes.decode("utf-8", errors="replace")
+        # decoded once, and only when the body starts like a JSON object
+        o = loads_object(body_bytes, json_loads)
+
+        if status_code > 299:
+            if body_str.lstrip().startswith("{"):
+                raise ZBApiException(cls._format_get_file_error_message(body_str, o))
+            raise ZBApiException(body_str or f"HTTP {status_code}")
+
+        if "application/json" in content_type.lower() or cls._json_object_indicates_error(o):
+            raise ZBApiException(cls._format_get_file_error_message(body_str, o))
+
     @staticmethod
-    def _should_treat_get_file_body_as_error(body: str, content_type: str) -> bool:
-        ct = content_type.lower()
-        if "application/json" in ct:
-            return True
-        return ZeroBounce.get_file_json_indicates_error(body)
+    def _rewind(body) -> bool:
+        """Whether a request body can be sent again, rewinding it if needed."""
+        return not isinstance(body, MultipartFileStream) or body.rewind()
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Sends every request of the client.
+
+        Retries the request as the retry policy allows. `_send` waits for the
+        rate limiter before every request that goes out.
+        """
+        policy = self._retry_policy
+        retryable = policy is not None and policy.allows(method, url)
+        send = self._session.get if method == "GET" else self._session.post
+        attempt = 1
+        while True:
+            try:
+                response = self._send(send, url, kwargs)
+            except self._TRANSIENT_ERRORS:
+                if not retryable:
+                    raise
+                delay = policy.delay_for_error(attempt)
+                if delay is None or not self._rewind(kwargs.get("data")):
+                    policy.record(url, retrying=False)
+                    raise
+            else:
+                if not retryable or response.status_code not in policy.retry_statuses:
+                    return response
+                delay = policy.delay_for_status(attempt, response.headers.get("Retry-After"))
+                if delay is None or not self._rewind(kwargs.get("data")):
+                    policy.record(url, retrying=False)
+                    return response
+                response.close()
+            policy.record(url, retrying=True)
+            time.sleep(delay)
+            attempt += 1
+
+    def _throttle(self, url: str):
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(self._rate_limiter.family_for(url))
+
+    def _send(self, send, url: str, kwargs: dict) -> requests.Response:
+        """Sends one attempt of a request, to the healthiest regions when failing over.
+
+        Every request sent, failover and hedged ones included, first waits for
+        the rate limiter.
+        """
+        failover = self._failover
+        if failover is None or not url.startswith(self._base_url + "/"):
+            self._throttle(url)
+            return send(url, timeout=self._timeout_s, **kwargs)
+        path = url[len(self._base_url):]
+        regions = failover.candidates()
+        if failover.hedge_validate and path == "/validate" and len(regions) > 1:
+            return self._send_hedged(send, regions, path, kwargs)
+        for index, region in enumerate(regions):
+            last = index == len(regions) - 1
+            if not failover.begin_call(region) and not last:
+                continue  # another request is probing this half-open region
+            try:
+                response = self._send_to_region(send, region, path, kwargs)
+            except self._TRANSIENT_ERRORS:
+                if last:
+                    raise
+            else:
+                if response.status_code < 500 or last:
+                    return response
+                response.close()
+            failover.record_failover()
+
+    def _send_to_region(self, send, region: str, path: str, kwargs: dict) -> requests.Response:
+        try:
+            self._throttle(region + path)
+            started = time.monotonic()
+            response = send(region + path, timeout=self._timeout_s, **kwargs)
+        except self._TRANSIENT_ERRORS:
+            self._failover.record_failure(region)
+            raise
+        except BaseException:
+            self._failover.abandon_call(region)
+            raise
+        if response.status_code >= 500:
+            self._failover.record_failure(region)
+        else:
+            self._failover.record_success(region, time.monotonic() - started)
+        return response
+
+    def _send_hedged(self, send, regions: List[str], path: str, kwargs: dict) -> requests.Response:
+        failover = self._failover
+        first = next((region for region in regions if failover.begin_call(region)), regions[0])
+        primary = self._hedge_executor.submit(self._send_to_region, send, first, path, kwargs)
+        try:
+            response = primary.result(timeout=failover.hedge_delay_s(first))
+            if response.status_code < 500:
+                return response
+            hedging = False
+        except FutureTimeoutError:
+            hedging = True
+        except self._TRANSIENT_ERRORS:
+            hedging = False
+        second = next((region for region in regions if region != first and failover.begin_call(region)), None)
+        if second is None:
+            return primary.result()
+        if hedging:
+            failover.record_hedge()
+        else:
+            failover.record_failover()
+        pending = {primary, self._hedge_executor.submit(self._send_to_region, send, second, path, kwargs)}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result().status_code < 500:
+                    return future.result()
+            if not pending:
+                # both failed: report the primary's outcome
+                return primary.result()
 
     def _get(self, url, response_class, params=None):
+        return response_class(self._get_json(url, params))
+
+    def _get_json(self, url, params=None):
         if not params:
             params = {}
         params["api_key"] = self._api_key
-        response = requests.get(url, params=params, timeout=self._timeout_s)
+        response = self._request("GET", url, params=params)
 
         try:
-            json_response = response.json()
+            json_response = self._json_loads(response.content)
         except ValueError as e:
             raise ZBApiException from e
 
         error = json_response.pop("error", None)
         if error:
             raise ZBApiException(error)
-        return response_class(json_response)
+        return json_response
 
-    def _post(self, url, response_class, data=None, json=None, files=None):
-        response = requests.post(url, data=data, json=json, files=files, timeout=self._timeout_s)
+    def _post(self, url, response_class, data=None, json=None, files=None, headers=None):
+        response = self._request("POST", url, data=data, json=json, files=files, headers=headers)
         try:
-            json_response = response.json()
+            json_response = self._json_loads(response.content)
         except ValueError as e:
             raise ZBApiException('Request not processed succesfully. Status code %s' % response.status_code)
 
@@ -220,8 +474,10 @@ class ZeroBounce:
             f"{self._base_url}/activity", ZBGetActivityResponse, params={"email": email}
         )
 
-    def validate(self, email: str, ip_address: str = None):
+    def validate(self, email: str, ip_address: str = None, lazy: bool = False):
         """Validates the given email address.
+        When the client has a validate_cache, a cached result is returned if available.
+        When the client has a pre_filter, the addresses it rejects are answered locally.
 
         Parameters
         ----------
@@ -229,6 +485,9 @@ class ZeroBounce:
             The email address you want to validate
         ip_address: str or None
             The IP Address the email signed up from (Can be blank)
+        lazy: bool, default False
+            Return a ZBLazyValidateResponse, which decodes status, sub_status
+            and processed_at only when they are first read
 
         Raises
         ------
@@ -239,23 +498,53 @@ class ZeroBounce:
         response: ZBValidateResponse
             Returns a ZBValidateResponse object if the request was successful
         """
+        response_class = ZBLazyValidateResponse if lazy else ZBValidateResponse
+        if self._pre_filter is not None:
+            local_result = self._pre_filter.local_result(email)
+            if local_result is not None:
+                return response_class(local_result)
+
+        if self._validate_cache is not None:
+            cached = self._validate_cache.get(email, ip_address)
+            if cached is not None:
+                return response_class(cached)
+
+        if self._validate_flight is None:
+            return response_class(self._fetch_validate(email, ip_address))
+        json_response = self._validate_flight.do(
+            ZBValidateCache.key(email, ip_address),
+            lambda: self._fetch_validate(email, ip_address),
+        )
+        # every coalesced caller gets its own response object
+        return response_class(dict(json_response))
 
-        return self._get(
+    def _fetch_validate(self, email: str, ip_address: str = None):
+        json_response = self._get_json(
             f"{self._base_url}/validate",
-            ZBValidateResponse,
             params={
                 "email": email,
                 "ip_address": ip_address,
             },
         )
+        if self._validate_cache is not None:
+            self._validate_cache.set(email, ip_address, dict(json_response))
+        return json_response
 
-    def validate_batch(self, email_batch: List[ZBValidateBatchElement]):
+    def validate_batch(
+        self, email_batch: List[ZBValidateBatchElement], compact: bool = False, lazy: bool = False
+    ):
         """Allows you to send us batches up to 100 emails at a time.
 
         Parameters
         ----------
         email_batch: List[ZBValidateBatchElement]
             Array of ZBValidateBatchElement
+        compact: bool, default False
+            Build the results as slotted ZBCompactValidateBatchEmail objects,
+            which take less memory and are faster to create
+        lazy: bool, default False
+            Build each email_batch result only when it is first accessed, as a
+            ZBLazyValidateBatchEmail unless `compact` is set
 
         Raises
         ------
@@ -269,6 +558,13 @@ class ZeroBounce:
         """
         if not email_batch:
             raise ZBClientException("Empty parameter: email_batch")
+        response_class = partial(ZBValidateBatchResponse, compact=compact, lazy=lazy)
+        if self._pre_filter is not None:
+            email_batch, local_results = self._pre_filter.split(email_batch)
+            if not email_batch:
+                return response_class({"email_batch": local_results, "errors": []})
+            if local_results:
+                response_class = with_local_results(response_class, local_results)
 
         json={
             "api_key": self._api_key,
@@ -278,26 +574,144 @@ class ZeroBounce:
         }
         return self._post(
             f"{self._base_url}/validatebatch",
-            ZBValidateBatchResponse,
+            response_class,
             json=json)
 
+    def validate_many(
+        self,
+        emails: Iterable[Union[str, ZBValidateBatchElement]],
+        concurrency: int = 4,
+        compact: bool = False,
+        lazy: bool = False,
+        deduplicator: Optional[ZBDeduplicator] = None,
+    ) -> Iterator[Union[ZBValidateBatchEmail, ZBValidateBatchError]]:
+        """Validates any number of email addresses through validatebatch.
+
+        The addresses are read lazily, split into batches of 100 and sent with up
+        to `concurrency` batches in flight over the pooled session. Results are
+        yielded as soon as they are available, one per input address and in input
+        order. Keep `api_pool_size` at least as large as `concurrency` so every
+        in-flight batch gets a kept-alive connection.
+
+        Parameters
+        ----------
+        emails: Iterable[Union[str, ZBValidateBatchElement]]
+            The email addresses, optionally with their IP address
+        concurrency: int, default 4
+            How many validatebatch requests may run at the same time
+        compact: bool, default False
+            Yield slotted ZBCompactValidateBatchEmail objects, see `validate_batch`
+        lazy: bool, default False
+            Yield ZBLazyValidateBatchEmail objects, see `validate_batch`
+        deduplicator: ZBDeduplicator or None
+            Send only the first occurrence of each address; its duplicates are
+            given the same result object
+
+        Raises
+        ------
+        ZBApiException
+        ZBClientException
+
+        Returns
+        -------
+        results: Iterator[Union[ZBValidateBatchEmail, ZBValidateBatchError]]
+            A ZBValidateBatchEmail for each validated address, or a
+            ZBValidateBatchError when the API reported an error for it
+        """
+        if concurrency < 1:
+            raise ZBClientException("Invalid parameter: concurrency must be at least 1")
+
+        if deduplicator is not None:
+            fan_out = DuplicateFanOut(deduplicator)
+            for result in self.validate_many(fan_out.unique(emails), concurrency, compact, lazy):
+                fan_out.add(result)
+                yield from fan_out.drain()
+            yield from fan_out.drain()
+            return
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending = deque()
+        try:
+            for chunk in chunk_batch_elements(emails):
+                pending.append((chunk, executor.submit(self.validate_batch, chunk, compact, lazy)))
+                if len(pending) >= concurrency:
+                    chunk, future = pending.popleft()
+                    yield from match_batch_results(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                yield from match_batch_results(chunk, future.result())
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _send_file_data(
+        return_url: str = None,
+        first_name_column: int = None,
+        last_name_column: int = None,
+        gender_column: int = None,
+        ip_address_column: int = None,
+        has_header_row: bool = None,
+        remove_duplicate: bool = None,
+        allow_phase_2: Optional[bool] = None,
+    ) -> dict:
+        data = {}
+        if return_url is not None:
+            data["return_url"] = return_url
+        if first_name_column is not None:
+            data["first_name_column"] = first_name_column
+        if last_name_column is not None:
+            data["last_name_column"] = last_name_column
+        if gender_column is not None:
+            data["gender_column"] = gender_column
+        if ip_address_column is not None:
+            data["ip_address_column"] = ip_address_column
+        if has_header_row is not None:
+            data["has_header_row"] = has_header_row
+        if remove_duplicate is not None:
+            data["remove_duplicate"] = remove_duplicate
+        if allow_phase_2 is not None:
+            data["allow_phase_2"] = "true" if allow_phase_2 else "false"
+        return data
+
     def _send_file(
         self,
         scoring: bool,
         file_path: str,
         email_address_column: int,
         data: dict,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
+        with open(file_path, "rb") as file:
+            return self._send_file_from_stream(
+                scoring, file, os.path.basename(file_path), email_address_column, data,
+                progress_callback,
+            )
+
+    @classmethod
+    def _send_file_body(
+        cls,
+        api_key: str,
+        file_stream: BinaryIO,
+        file_name: str,
+        email_address_column: int,
+        data: dict,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> MultipartFileStream:
+        data = dict(data)
         data.update(
             {
-                "api_key": self._api_key,
+                "api_key": api_key,
                 "email_address_column": email_address_column,
             }
         )
-        url = f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/sendfile"
-        with open(file_path, "rb") as file:
-            files = {"file": (os.path.basename(file_path), file, "text/csv")}
-            return self._post(url, ZBSendFileResponse, data=data, files=files)
+        return MultipartFileStream(
+            data,
+            "file",
+            file_name,
+            file_stream,
+            chunk_size=cls.UPLOAD_CHUNK_SIZE,
+            progress=progress_callback,
+        )
 
     def _send_file_from_stream(
         self,
@@ -306,17 +720,13 @@ class ZeroBounce:
         file_name: str,
         email_address_column: int,
         data: dict,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
-        data = dict(data)
-        data.update(
-            {
-                "api_key": self._api_key,
-                "email_address_column": email_address_column,
-            }
-        )
         url = f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/sendfile"
-        files = {"file": (file_name, file_stream, "text/csv")}
-        return self._post(url, ZBSendFileResponse, data=data, files=files)
+        body = self._send_file_body(
+            self._api_key, file_stream, file_name, email_address_column, data, progress_callback
+        )
+        return self._post(url, ZBSendFileResponse, data=body, headers=body.headers)
 
     def send_file(
         self,
@@ -330,6 +740,7 @@ class ZeroBounce:
         has_header_row: bool = False,
         remove_duplicate: bool = True,
         allow_phase_2: Optional[bool] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
         """Allows user to send a file for bulk email validation
 
@@ -355,6 +766,8 @@ class ZeroBounce:
             If you want the system to remove duplicate emails.
         allow_phase_2: bool or None
             When not None, sends allow_phase_2 (validation bulk sendfile only).
+        progress_callback: Callable[[int, Optional[int]], None] or None
+            Called while uploading with the bytes sent so far and the total, if known.
 
         Raises
         ------
@@ -366,25 +779,18 @@ class ZeroBounce:
             Returns a ZBSendFileResponse object if the request was successful
         """
 
-        data = {}
-        if return_url is not None:
-            data["return_url"] = return_url
-        if first_name_column is not None:
-            data["first_name_column"] = first_name_column
-        if last_name_column is not None:
-            data["last_name_column"] = last_name_column
-        if gender_column is not None:
-            data["gender_column"] = gender_column
-        if ip_address_column is not None:
-            data["ip_address_column"] = ip_address_column
-        if has_header_row is not None:
-            data["has_header_row"] = has_header_row
-        if remove_duplicate is not None:
-            data["remove_duplicate"] = remove_duplicate
-        if allow_phase_2 is not None:
-            data["allow_phase_2"] = "true" if allow_phase_2 else "false"
+        data = self._send_file_data(
+            return_url=return_url,
+            first_name_column=first_name_column,
+            last_name_column=last_name_column,
+            gender_column=gender_column,
+            ip_address_column=ip_address_column,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+            allow_phase_2=allow_phase_2,
+        )
 
-        return self._send_file(False, file_path, email_address_column, data)
+        return self._send_file(False, file_path, email_address_column, data, progress_callback)
 
     def send_file_stream(
         self,
@@ -399,6 +805,7 @@ class ZeroBounce:
         has_header_row: bool = False,
         remove_duplicate: bool = True,
         allow_phase_2: Optional[bool] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
         """Send a file for bulk email validation from a stream (e.g. in-memory CSV or uploaded file).
 
@@ -426,31 +833,26 @@ class ZeroBounce:
             If you want the system to remove duplicate emails.
         allow_phase_2: bool or None
             When not None, sends allow_phase_2 (validation bulk sendfile only).
+        progress_callback: Callable[[int, Optional[int]], None] or None
+            Called while uploading with the bytes sent so far and the total, if known.
 
         Returns
         -------
         response: ZBSendFileResponse
         """
-        data = {}
-        if return_url is not None:
-            data["return_url"] = return_url
-        if first_name_column is not None:
-            data["first_name_column"] = first_name_column
-        if last_name_column is not None:
-            data["last_name_column"] = last_name_column
-        if gender_column is not None:
-            data["gender_column"] = gender_column
-        if ip_address_column is not None:
-            data["ip_address_column"] = ip_address_column
-        if has_header_row is not None:
-            data["has_header_row"] = has_header_row
-        if remove_duplicate is not None:
-            data["remove_duplicate"] = remove_duplicate
-        if allow_phase_2 is not None:
-            data["allow_phase_2"] = "true" if allow_phase_2 else "false"
+        data = self._send_file_data(
+            return_url=return_url,
+            first_name_column=first_name_column,
+            last_name_column=last_name_column,
+            gender_column=gender_column,
+            ip_address_column=ip_address_column,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+            allow_phase_2=allow_phase_2,
+        )
 
         return self._send_file_from_stream(
-            False, file_stream, file_name, email_address_column, data
+            False, file_stream, file_name, email_address_column, data, progress_callback
         )
 
     def scoring_send_file(
@@ -460,6 +862,7 @@ class ZeroBounce:
         return_url: str = None,
         has_header_row: bool = False,
         remove_duplicate: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
         """Allows user to send a file for bulk email scoring
 
@@ -475,6 +878,8 @@ class ZeroBounce:
             If the first row from the submitted file is a header row.
         remove_duplicate: bool
             If you want the system to remove duplicate emails.
+        progress_callback: Callable[[int, Optional[int]], None] or None
+            Called while uploading with the bytes sent so far and the total, if known.
 
         Raises
         ------
@@ -486,15 +891,13 @@ class ZeroBounce:
             Returns a ZBSendFileResponse object if the request was successful
         """
 
-        data = {}
-        if return_url is not None:
-            data["return_url"] = return_url
-        if has_header_row is not None:
-            data["has_header_row"] = has_header_row
-        if remove_duplicate is not None:
-            data["remove_duplicate"] = remove_duplicate
+        data = self._send_file_data(
+            return_url=return_url,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+        )
 
-        return self._send_file(True, file_path, email_address_column, data)
+        return self._send_file(True, file_path, email_address_column, data, progress_callback)
 
     def scoring_send_file_stream(
         self,
@@ -504,6 +907,7 @@ class ZeroBounce:
         return_url: str = None,
         has_header_row: bool = False,
         remove_duplicate: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
     ):
         """Send a file for bulk email scoring from a stream.
 
@@ -521,21 +925,169 @@ class ZeroBounce:
             If the first row from the submitted file is a header row.
         remove_duplicate: bool
             If you want the system to remove duplicate emails.
+        progress_callback: Callable[[int, Optional[int]], None] or None
+            Called while uploading with the bytes sent so far and the total, if known.
 
         Returns
         -------
         response: ZBSendFileResponse
         """
-        data = {}
-        if return_url is not None:
-            data["return_url"] = return_url
-        if has_header_row is not None:
-            data["has_header_row"] = has_header_row
-        if remove_duplicate is not None:
-            data["remove_duplicate"] = remove_duplicate
+        data = self._send_file_data(
+            return_url=return_url,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+        )
 
         return self._send_file_from_stream(
-            True, file_stream, file_name, email_address_column, data
+            True, file_stream, file_name, email_address_column, data, progress_callback
+        )
+
+    @staticmethod
+    def _shard_file_name(source: Union[str, BinaryIO], file_name: Optional[str]) -> str:
+        if file_name is not None:
+            return file_name
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.basename(source)
+        return os.path.basename(getattr(source, "name", "") or "") or "emails.csv"
+
+    @staticmethod
+    def _check_shards(shards: int, concurrency: Optional[int]):
+        if shards < 1:
+            raise ZBClientException("Invalid parameter: shards must be at least 1")
+        if concurrency is not None and concurrency < 1:
+            raise ZBClientException("Invalid parameter: concurrency must be at least 1")
+
+    def _send_file_sharded(
+        self,
+        scoring: bool,
+        source: Union[str, BinaryIO],
+        file_name: Optional[str],
+        email_address_column: int,
+        shards: int,
+        concurrency: Optional[int],
+        data: dict,
+    ):
+        self._check_shards(shards, concurrency)
+        file_name = self._shard_file_name(source, file_name)
+        with CsvShards(source, shards, bool(data.get("has_header_row")), file_name) as csv_shards:
+            if not csv_shards.paths:
+                raise ZBClientException("Empty file: there are no records to send")
+            with ThreadPoolExecutor(max_workers=concurrency or len(csv_shards.paths)) as executor:
+                futures = [
+                    executor.submit(self._send_file, scoring, path, email_address_column, data)
+                    for path in csv_shards.paths
+                ]
+                responses = [future.result() for future in futures]
+        return ZBShardedSendFileResponse({"responses": responses})
+
+    def send_file_sharded(
+        self,
+        source: Union[str, BinaryIO],
+        email_address_column: int,
+        shards: int = 4,
+        file_name: Optional[str] = None,
+        return_url: str = None,
+        first_name_column: int = None,
+        last_name_column: int = None,
+        gender_column: int = None,
+        ip_address_column: int = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        allow_phase_2: Optional[bool] = None,
+        concurrency: Optional[int] = None,
+    ):
+        """Splits a large file into shards and sends them concurrently for bulk email validation
+
+        Each shard is a separate sendfile job holding a contiguous run of records,
+        with the header row repeated when `has_header_row` is set, so the column
+        indexes apply to every shard. Download the merged results with
+        `get_file_sharded`. Note that `remove_duplicate` only removes duplicates
+        within a shard.
+
+        Parameters
+        ----------
+        source: str or BinaryIO
+            The path of the csv or txt file, or a file-like object opened in binary mode.
+        email_address_column: int
+            The column index of the email address in the file. Index starts from 1.
+        shards: int
+            The number of shards to split the file into, at most. Small files may
+            produce fewer shards.
+        file_name: str or None
+            The base name of the uploaded shards. Defaults to the name of the file.
+        return_url: str or None
+            The URL will be used to call back when the validation of a shard is completed.
+        first_name_column: int or None
+            The column index of the first name column.
+        last_name_column: int or None
+            The column index of the last name column.
+        gender_column: int or None
+            The column index of the gender column.
+        ip_address_column: int or None
+            The IP Address the email signed up from.
+        has_header_row: bool
+            If the first row from the submitted file is a header row.
+        remove_duplicate: bool
+            If you want the system to remove duplicate emails.
+        allow_phase_2: bool or None
+            When not None, sends allow_phase_2 (validation bulk sendfile only).
+        concurrency: int or None
+            How many shards may be uploading at the same time. Defaults to all of them.
+
+        Raises
+        ------
+        ZBClientException
+        ZBApiException
+
+        Returns
+        -------
+        response: ZBShardedSendFileResponse
+            Holds the ZBSendFileResponse of every shard, in file order
+        """
+        data = self._send_file_data(
+            return_url=return_url,
+            first_name_column=first_name_column,
+            last_name_column=last_name_column,
+            gender_column=gender_column,
+            ip_address_column=ip_address_column,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+            allow_phase_2=allow_phase_2,
+        )
+
+        return self._send_file_sharded(
+            False, source, file_name, email_address_column, shards, concurrency, data
+        )
+
+    def scoring_send_file_sharded(
+        self,
+        source: Union[str, BinaryIO],
+        email_address_column: int,
+        shards: int = 4,
+        file_name: Optional[str] = None,
+        return_url: str = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        concurrency: Optional[int] = None,
+    ):
+        """Splits a large file into shards and sends them concurrently for bulk email scoring
+
+        See `send_file_sharded`. Download the merged results with
+        `scoring_get_file_sharded`.
+
+        Returns
+        -------
+        response: ZBShardedSendFileResponse
+            Holds the ZBSendFileResponse of every shard, in file order
+        """
+        data = self._send_file_data(
+            return_url=return_url,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+        )
+
+        return self._send_file_sharded(
+            True, source, file_name, email_address_column, shards, concurrency, data
         )
 
     def _file_status(self, scoring: bool, file_id: str):
@@ -587,17 +1139,110 @@ class ZeroBounce:
 
         return self._file_status(True, file_id)
 
-    def _get_file(
+    @staticmethod
+    def _file_status_error(file_id: str, error: Exception) -> ZBFileStatusResponse:
+        return ZBFileStatusResponse(
+            {"success": False, "file_id": file_id, "message": str(error) or error.__class__.__name__}
+        )
+
+    @staticmethod
+    def _check_status_sweep(concurrency: int, max_requests_per_second: Optional[float]):
+        if concurrency < 1:
+            raise ZBClientException("Invalid parameter: concurrency must be at least 1")
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ZBClientException("Invalid parameter: max_requests_per_second must be positive")
+
+    def _file_status_or_error(self, scoring: bool, file_id: str) -> ZBFileStatusResponse:
+        try:
+            return self._file_status(scoring, file_id)
+        except Exception as e:
+            return self._file_status_error(file_id, e)
+
+    def _file_status_many(
         self,
         scoring: bool,
+        file_ids: Iterable[str],
+        concurrency: int,
+        max_requests_per_second: Optional[float],
+    ) -> Dict[str, ZBFileStatusResponse]:
+        self._check_status_sweep(concurrency, max_requests_per_second)
+        file_ids = list(dict.fromkeys(file_ids))
+        interval_s = 1 / max_requests_per_second if max_requests_per_second else 0
+        next_start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(file_ids) or 1)) as executor:
+            futures = {}
+            for file_id in file_ids:
+                if interval_s:
+                    delay = next_start - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    next_start = max(next_start, time.monotonic()) + interval_s
+                futures[file_id] = executor.submit(self._file_status_or_error, scoring, file_id)
+            return {file_id: future.result() for file_id, future in futures.items()}
+
+    def file_status_many(
+        self,
+        file_ids: Iterable[str],
+        concurrency: int = 10,
+        max_requests_per_second: Optional[float] = None,
+    ) -> Dict[str, ZBFileStatusResponse]:
+        """Returns the file processing status of many submitted files at once
+
+        The filestatus requests are sent concurrently over the client's connection
+        pool, so a sweep over many files takes about one round trip instead of one
+        per file. A request that fails does not stop the others: its entry is a
+        ZBFileStatusResponse with ``success`` False and the error in ``message``.
+
+        Parameters
+        ----------
+        file_ids: Iterable[str]
+            The returned file IDs when calling sendfile API. Duplicates are checked once.
+        concurrency: int
+            How many requests may be in flight at the same time.
+        max_requests_per_second: float or None
+            Spaces the requests out to stay under this rate.
+
+        Raises
+        ------
+        ZBClientException
+
+        Returns
+        -------
+        response: Dict[str, ZBFileStatusResponse]
+            The status of every file, keyed by file ID
+        """
+
+        return self._file_status_many(False, file_ids, concurrency, max_requests_per_second)
+
+    def scoring_file_status_many(
+        self,
+        file_ids: Iterable[str],
+        concurrency: int = 10,
+        max_requests_per_second: Optional[float] = None,
+    ) -> Dict[str, ZBFileStatusResponse]:
+        """Returns the scoring file processing status of many submitted files at once
+
+        See `file_status_many`.
+
+        Returns
+        -------
+        response: Dict[str, ZBFileStatusResponse]
+            The status of every file, keyed by file ID
+        """
+
+        return self._file_status_many(True, file_ids, concurrency, max_requests_per_second)
+
+    @staticmethod
+    def _get_file_params(
+        api_key: str,
+        scoring: bool,
         file_id: str,
-        download_path: str,
         options: Optional[ZBGetFileOptions] = None,
-    ):
+    ) -> dict:
         if not file_id.strip():
             raise ZBClientException("Empty parameter: file_id")
         params = {
-            "api_key": self._api_key,
+            "api_key": api_key,
             "file_id": file_id,
         }
         if options is not None:
@@ -605,29 +1250,49 @@ class ZeroBounce:
                 params["download_type"] = options.download_type
             if not scoring and options.activity_data is not None:
                 params["activity_data"] = "true" if options.activity_data else "false"
+        return params
 
-        response = requests.get(
-            f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/getfile",
-            params=params,
-            timeout=self._timeout_s,
+    def _get_file(
+        self,
+        scoring: bool,
+        file_id: str,
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        resume: bool = False,
+        verify: bool = False,
+    ):
+        params = self._get_file_params(self._api_key, scoring, file_id, options)
+        url = f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/getfile"
+        headers, offset = resume_request_headers(download_path) if resume else (None, 0)
+        response = self._request("GET", url, params=params, headers=headers, stream=True)
+        append_at, expected_size = resume_plan(response.status_code, response.headers, offset)
+        if append_at is None and offset:
+            # the server cannot continue the part file: download it all again
+            response.close()
+            del headers["Range"]
+            response = self._request("GET", url, params=params, headers=headers, stream=True)
+            append_at, expected_size = resume_plan(response.status_code, response.headers, 0)
+        if append_at is None:
+            response.close()
+            raise ZBApiException('Unexpected partial getfile response. Status code %s' % response.status_code)
+        download = GetFileDownload(
+            download_path,
+            response.status_code,
+            response.headers.get("Content-Type") or "",
+            partial(self._raise_for_get_file_error, json_loads=self._json_loads),
+            resume_offset=append_at,
+            expected_size=expected_size if verify else None,
+            keep_part=resume,
         )
-        body_bytes = response.content or b""
-        body_str = body_bytes.decode("utf-8", errors="replace")
-        content_type = response.headers.get("Content-Type") or ""
-
-        if response.status_code > 299:
-            if body_str.lstrip().startswith("{"):
-                raise ZBApiException(self._format_get_file_error_message(body_str))
-            raise ZBApiException(body_str or f"HTTP {response.status_code}")
-
-        if self._should_treat_get_file_body_as_error(body_str, content_type):
-            raise ZBApiException(self._format_get_file_error_message(body_str))
-
-        dirname = os.path.dirname(download_path)
-        if dirname:
-            os.makedirs(dirname, exist_ok=True)
-        with open(download_path, "wb") as f:
-            f.write(body_bytes)
+        try:
+            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                download.feed(chunk)
+            download.finish()
+        except BaseException:
+            download.abort()
+            raise
+        finally:
+            response.close()
 
         return ZBGetFileResponse({"local_file_path": download_path})
 
@@ -636,6 +1301,8 @@ class ZeroBounce:
         file_id: str,
         download_path: str,
         options: Optional[ZBGetFileOptions] = None,
+        resume: bool = False,
+        verify: bool = False,
     ):
         """Allows you to get the validation results for the file you submitted
 
@@ -647,6 +1314,12 @@ class ZeroBounce:
             The local path where the file will be downloaded.
         options: ZBGetFileOptions or None
             Optional download_type and activity_data (validation bulk getfile only).
+        resume: bool
+            Keep the partial ``<download_path>.part`` file when a download fails, and
+            continue from it with a Range request next time. Falls back to a full
+            download when the server does not honor the range.
+        verify: bool
+            Check that the downloaded size matches the size announced by the server.
 
         Raises
         ------
@@ -659,13 +1332,15 @@ class ZeroBounce:
             Returns a ZBGetFileResponse object if the request was successful
         """
 
-        return self._get_file(False, file_id, download_path, options)
+        return self._get_file(False, file_id, download_path, options, resume, verify)
 
     def scoring_get_file(
         self,
         file_id: str,
         download_path: str,
         options: Optional[ZBGetFileOptions] = None,
+        resume: bool = False,
+        verify: bool = False,
     ):
         """Allows you to get the validation results for the file you submitted
 
@@ -677,6 +1352,12 @@ class ZeroBounce:
             The local path where the file will be downloaded.
         options: ZBGetFileOptions or None
             Optional download_type; activity_data is not sent for scoring getfile.
+        resume: bool
+            Keep the partial ``<download_path>.part`` file when a download fails, and
+            continue from it with a Range request next time. Falls back to a full
+            download when the server does not honor the range.
+        verify: bool
+            Check that the downloaded size matches the size announced by the server.
 
         Raises
         ------
@@ -689,7 +1370,132 @@ class ZeroBounce:
             Returns a ZBGetFileResponse object if the request was successful
         """
 
-        return self._get_file(True, file_id, download_path, options)
+        return self._get_file(True, file_id, download_path, options, resume, verify)
+
+    def _get_file_sharded(
+        self,
+        scoring: bool,
+        file_ids: List[str],
+        download_path: str,
+        options: Optional[ZBGetFileOptions],
+        concurrency: int,
+    ):
+        if not file_ids:
+            raise ZBClientException("Empty parameter: file_ids")
+        self._check_shards(len(file_ids), concurrency)
+        with tempfile.TemporaryDirectory(prefix="zb-shards-") as directory:
+            paths = [os.path.join(directory, f"{index}.csv") for index in range(len(file_ids))]
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = [
+                    executor.submit(self._get_file, scoring, file_id, path, options)
+                    for file_id, path in zip(file_ids, paths)
+                ]
+                for future in futures:
+                    future.result()
+            merge_result_files(paths, download_path)
+        return ZBGetFileResponse({"local_file_path": download_path})
+
+    def get_file_sharded(
+        self,
+        file_ids: List[str],
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        concurrency: int = 4,
+    ):
+        """Downloads the results of a file sent with `send_file_sharded` as one file
+
+        The shard results are downloaded concurrently and concatenated in the
+        order of `file_ids`, with a single header row, so the rows keep the order
+        of the original file.
+
+        Parameters
+        ----------
+        file_ids: List[str]
+            The file IDs of the shards, as in ZBShardedSendFileResponse.file_ids.
+        download_path: str
+            The local path where the merged file will be written.
+        options: ZBGetFileOptions or None
+            Optional download_type and activity_data (validation bulk getfile only).
+        concurrency: int
+            How many shards may be downloading at the same time.
+
+        Raises
+        ------
+        ZBClientException
+        ZBApiException
+
+        Returns
+        -------
+        response: ZBGetFileResponse
+            Returns a ZBGetFileResponse object if every download was successful
+        """
+
+        return self._get_file_sharded(False, file_ids, download_path, options, concurrency)
+
+    def scoring_get_file_sharded(
+        self,
+        file_ids: List[str],
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        concurrency: int = 4,
+    ):
+        """Downloads the results of a file sent with `scoring_send_file_sharded` as one file
+
+        See `get_file_sharded`.
+
+        Returns
+        -------
+        response: ZBGetFileResponse
+            Returns a ZBGetFileResponse object if every download was successful
+        """
+
+        return self._get_file_sharded(True, file_ids, download_path, options, concurrency)
+
+    def iter_file_results(
+        self,
+        file_id: str,
+        options: Optional[ZBGetFileOptions] = None,
+        email_address_column: Optional[int] = None,
+    ) -> Iterator[ZBFileResultRow]:
+        """Streams the validation results for the file you submitted as parsed rows.
+
+        Rows are yielded while the body is still downloading, without writing the
+        file or holding the whole body in memory. The request is sent when
+        iteration starts.
+
+        Parameters
+        ----------
+        file_id: str
+            The returned file ID when calling sendfile API.
+        options: ZBGetFileOptions or None
+            Optional download_type and activity_data.
+        email_address_column: int or None
+            The column index of the email address in the file. Index starts from 1.
+            By default the "Email Address" column, or else the first one.
+
+        Raises
+        ------
+        ZBClientException
+        ZBApiException
+
+        Returns
+        -------
+        rows: Iterator[ZBFileResultRow]
+        """
+        params = self._get_file_params(self._api_key, False, file_id, options)
+        response = self._request("GET", f"{self.BULK_BASE_URL}/getfile", params=params, stream=True)
+        try:
+            parser = FileResultRowParser(
+                response.status_code,
+                response.headers.get("Content-Type") or "",
+                partial(self._raise_for_get_file_error, json_loads=self._json_loads),
+                email_address_column,
+            )
+            for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                yield from parser.feed(chunk)
+            yield from parser.finish()
+        finally:
+            response.close()
 
     def _delete_file(self, scoring: bool, file_id: str):
         if not file_id.strip():
@@ -799,14 +1605,14 @@ class ZeroBounce:
         )
 
 
-    def find_email_format(
-        self, 
-        first_name: str, 
-        domain: str = '', 
+    @staticmethod
+    def _find_email_format_params(
+        first_name: str,
+        domain: str = '',
         company_name: str = '',
-        middle_name: str = '', 
+        middle_name: str = '',
         last_name: str = ''
-    ):
+    ) -> dict:
         if not domain and not company_name:
             raise ZBClientException("Empty parameter: domain or company_name required")
         if domain and company_name:
@@ -820,17 +1626,10 @@ class ZeroBounce:
             params["middle_name"] = middle_name
         if last_name:
             params["last_name"] = last_name
+        return params
 
-        return self._get(
-            f"{self._base_url}/guessformat",
-            ZBFindEmailFormatResponse,
-            params)
-
-    def find_domain(
-        self,
-        domain: str = '',
-        company_name: str = ''
-    ):
+    @staticmethod
+    def _find_domain_params(domain: str = '', company_name: str = '') -> dict:
         if not domain and not company_name:
             raise ZBClientException("Empty parameter: domain xor company_name required")
         if domain and company_name:
@@ -840,7 +1639,55 @@ class ZeroBounce:
             params["domain"] = domain
         if company_name:
             params["company_name"] = company_name
+        return params
+
+    def find_email_format(
+        self, 
+        first_name: str, 
+        domain: str = '', 
+        company_name: str = '',
+        middle_name: str = '', 
+        last_name: str = ''
+    ):
+        params = self._find_email_format_params(
+            first_name, domain, company_name, middle_name, last_name
+        )
+        if self._domain_format_cache is not None:
+            domain_format = self._domain_format_cache.get(domain, company_name)
+            if domain_format is None:
+                try:
+                    domain_format = self._fetch_domain_format(
+                        domain, company_name, self._find_domain_params(domain, company_name)
+                    )
+                except (ZBApiException, ValueError, requests_exceptions.RequestException):
+                    # the direct request below may still succeed
+                    domain_format = None
+            if domain_format is not None:
+                local = self._domain_format_cache.format_email(domain_format, first_name, middle_name, last_name)
+                if local is not None:
+                    return local
         return self._get(
+            f"{self._base_url}/guessformat",
+            ZBFindEmailFormatResponse,
+            params)
+
+    def find_domain(
+        self,
+        domain: str = '',
+        company_name: str = ''
+    ):
+        params = self._find_domain_params(domain, company_name)
+        if self._domain_format_cache is not None:
+            cached = self._domain_format_cache.get(domain, company_name)
+            if cached is not None:
+                return cached
+        return self._fetch_domain_format(domain, company_name, params)
+
+    def _fetch_domain_format(self, domain: str, company_name: str, params: dict) -> ZBFindDomainResponse:
+        response = self._get(
             f"{self._base_url}/guessformat",
             ZBFindDomainResponse,
-            params)
\ No newline at end of file
+            params)
+        if self._domain_format_cache is not None:
+            self._domain_format_cache.put(domain, company_name, response)
+        return response
\ No newline at end of file
@@ -0,0 +1,1088 @@
+import asyncio
+import os
+import tempfile
+import time
+from collections import deque
+from datetime import date, timedelta
+from functools import partial
+from typing import AsyncIterator, BinaryIO, Dict, Iterable, List, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the async extra
+    httpx = None
+
+from .zb_get_file_options import ZBGetFileOptions
+from ._zb_batch import DuplicateFanOut, chunk_batch_elements, match_batch_results, with_local_results
+from ._zb_csv_shards import CsvShards, merge_result_files
+from ._zb_download import GetFileDownload, resume_plan, resume_request_headers
+from ._zb_file_results import FileResultRowParser
+from ._zb_json import JsonLoads
+from . import _zb_json
+from ._zb_multipart import MultipartFileStream, ProgressCallback
+from ._zb_single_flight import AsyncSingleFlight
+from .zb_deduplicator import ZBDeduplicator
+from .zb_domain_format_cache import ZBDomainFormatCache
+from .zb_pre_filter import ZBPreFilter
+from .zb_rate_limiter import ZBRateLimiter
+from .zb_region_failover import ZBRegionFailover
+from .zb_retry_policy import ZBRetryPolicy
+from .zb_validate_cache import ZBValidateCache
+from .zerobouncesdk import ZeroBounce
+from . import (
+    ZBApiException,
+    ZBApiUrl,
+    ZBClientException,
+    ZBGetCreditsResponse,
+    ZBGetApiUsageResponse,
+    ZBGetActivityResponse,
+    ZBLazyValidateResponse,
+    ZBValidateResponse,
+    ZBValidateBatchElement,
+    ZBValidateBatchResponse,
+    ZBValidateBatchEmail,
+    ZBValidateBatchError,
+    ZBSendFileResponse,
+    ZBShardedSendFileResponse,
+    ZBFileStatusResponse,
+    ZBGetFileResponse,
+    ZBDeleteFileResponse,
+    ZBFindEmailFormatResponse,
+    ZBFindDomainResponse,
+    ZBFileResultRow,
+)
+
+
+async def _run_blocking(function, *args):
+    """Runs `function` on the loop's default executor, so that blocking work such as
+    DNS lookups or file copies does not hold up the other coroutines."""
+    return await asyncio.get_running_loop().run_in_executor(None, partial(function, *args))
+
+
+class AsyncZeroBounce:
+    """The asyncio counterpart of `ZeroBounce`.
+
+    Every request method is a coroutine that returns the same response classes and
+    raises the same exceptions as its `ZeroBounce` equivalent. Connections are pooled
+    per host and shared by all coroutines using the client, so a single event loop can
+    keep many requests in flight. Requires the ``httpx`` package
+    (``pip install zerobouncesdk[async]``).
+    """
+
+    BULK_BASE_URL = ZeroBounce.BULK_BASE_URL
+    SCORING_BASE_URL = ZeroBounce.SCORING_BASE_URL
+    DEFAULT_HTTP_TIMEOUT_S = ZeroBounce.DEFAULT_HTTP_TIMEOUT_S
+    DEFAULT_API_POOL_SIZE = 100
+    DEFAULT_BULK_POOL_SIZE = ZeroBounce.DEFAULT_BULK_POOL_SIZE
+    DEFAULT_SCORING_POOL_SIZE = ZeroBounce.DEFAULT_SCORING_POOL_SIZE
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[Union[ZBApiUrl, str]] = None,
+        timeout: timedelta | None = None,
+        api_pool_size: int = DEFAULT_API_POOL_SIZE,
+        bulk_pool_size: int = DEFAULT_BULK_POOL_SIZE,
+        scoring_pool_size: int = DEFAULT_SCORING_POOL_SIZE,
+        transport: "Optional[httpx.AsyncBaseTransport]" = None,
+        validate_cache: Optional[ZBValidateCache] = None,
+        coalesce_validate: bool = True,
+        rate_limiter: Optional[ZBRateLimiter] = None,
+        retry_policy: Optional[ZBRetryPolicy] = None,
+        failover: Optional[ZBRegionFailover] = None,
+        json_loads: Optional[JsonLoads] = None,
+        pre_filter: Optional[ZBPreFilter] = None,
+        domain_format_cache: Optional[ZBDomainFormatCache] = None,
+    ):
+        """Initialize the asyncio ZeroBounce client.
+
+        Call `aclose()` when done, or use the client as an async context manager.
+
+        Parameters
+        ----------
+        api_key: str
+            Your ZeroBounce API key
+        base_url: Optional[Union[ZBApiUrl, str]], default ZBApiUrl.API_DEFAULT_URL
+            The base URL for the API. Can be a ZBApiUrl enum value, a custom URL string,
+            or None to use the default URL.
+        timeout: Optional[timedelta], default timeout to use for API requests.
+        api_pool_size: int, default 100
+            Maximum number of concurrent connections to the API host.
+        bulk_pool_size: int, default 4
+            Maximum number of concurrent connections to the bulk API.
+        scoring_pool_size: int, default 4
+            Maximum number of concurrent connections to the scoring API.
+        transport: Optional[httpx.AsyncBaseTransport]
+            A custom httpx transport shared by all hosts (e.g. for proxies or tests).
+            When given, the pool sizes are not applied.
+        validate_cache: Optional[ZBValidateCache]
+            When given, validate results are cached and reused until their TTL expires.
+        coalesce_validate: bool, default True
+            Concurrent validate calls for the same normalized email and IP address
+            share a single request, whose result or exception every caller receives.
+        rate_limiter: Optional[ZBRateLimiter]
+            When given, every request waits for its endpoint family's rate limit.
+            The same limiter may be shared by several clients, sync or async.
+        retry_policy: Optional[ZBRetryPolicy]
+            When given, requests that are safe to repeat are retried after connection
+            errors, timeouts and transient HTTP statuses.
+        failover: Optional[ZBRegionFailover]
+            When given, API requests are spread over its regions with a circuit
+            breaker per region, and base_url is ignored.
+        json_loads: Optional[Callable[[bytes], Any]]
+            The function decoding response bodies. Defaults to orjson.loads or
+            ujson.loads when installed, else json.loads.
+        pre_filter: Optional[ZBPreFilter]
+            When given, validate and validatebatch answer the addresses it rejects
+            locally, without sending them. Its checks, which may look up DNS records,
+            run on the event loop's default executor.
+        domain_format_cache: Optional[ZBDomainFormatCache]
+            When given, find_domain results are cached per domain and company, and
+            find_email_format builds addresses from confidently known formats locally.
+
+        Raises
+        ------
+        ZBClientException
+            If api_key is empty or httpx is not installed
+        """
+        if httpx is None:
+            raise ZBClientException(
+                "AsyncZeroBounce requires httpx: pip install zerobouncesdk[async]"
+            )
+        if not api_key.strip():
+            raise ZBClientException("Empty parameter: api_key")
+        self._api_key = api_key
+        self._failover = failover
+        self._base_url = failover.regions[0] if failover is not None else ZeroBounce._resolve_base_url(base_url)
+        self._timeout_s: float = (
+            self.DEFAULT_HTTP_TIMEOUT_S if timeout is None else timeout.total_seconds()
+        )
+        ZeroBounce._check_pool_sizes(
+            api_pool_size=api_pool_size,
+            bulk_pool_size=bulk_pool_size,
+            scoring_pool_size=scoring_pool_size,
+        )
+        self._validate_cache = validate_cache
+        self._validate_flight = AsyncSingleFlight() if coalesce_validate else None
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._json_loads = json_loads or _zb_json.loads
+        self._pre_filter = pre_filter
+        self._domain_format_cache = domain_format_cache
+
+        def client(pool_size):
+            if transport is not None:
+                return httpx.AsyncClient(transport=transport, timeout=self._timeout_s)
+            limits = httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            )
+            return httpx.AsyncClient(limits=limits, timeout=self._timeout_s)
+
+        self._api_client = client(api_pool_size)
+        self._bulk_client = client(bulk_pool_size)
+        self._scoring_client = client(scoring_pool_size)
+
+    async def aclose(self):
+        """Closes the pooled HTTP connections held by this client."""
+        await self._api_client.aclose()
+        await self._bulk_client.aclose()
+        await self._scoring_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def _client_for(self, url: str):
+        if url.startswith(self.SCORING_BASE_URL + "/"):
+            return self._scoring_client
+        if url.startswith(self.BULK_BASE_URL + "/"):
+            return self._bulk_client
+        return self._api_client
+
+    async def _throttle(self, url: str):
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(self._rate_limiter.family_for(url))
+
+    async def _request(self, method: str, url: str, stream: bool = False, **kwargs):
+        """Sends every request of the client.
+
+        Retries the request as the retry policy allows, while `_send` waits for
+        the rate limiter before every request that goes out. With `stream`, the
+        body is left unread and the caller must close the response.
+        """
+        policy = self._retry_policy
+        retryable = policy is not None and policy.allows(method, url)
+        body = kwargs.get("content")
+        attempt = 1
+        while True:
+            if isinstance(body, MultipartFileStream):
+                kwargs["content"] = body.aiter_chunks()
+            try:
+                response = await self._send(method, url, kwargs, stream)
+            except httpx.TransportError:
+                if not retryable:
+                    raise
+                delay = policy.delay_for_error(attempt)
+                if delay is None or not ZeroBounce._rewind(body):
+                    policy.record(url, retrying=False)
+                    raise
+            else:
+                if not retryable or response.status_code not in policy.retry_statuses:
+                    return response
+                delay = policy.delay_for_status(attempt, response.headers.get("Retry-After"))
+                if delay is None or not ZeroBounce._rewind(body):
+                    policy.record(url, retrying=False)
+                    return response
+                await response.aclose()
+            policy.record(url, retrying=True)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    async def _client_send(client: httpx.AsyncClient, method: str, url: str, kwargs: dict, stream: bool):
+        if stream:
+            return await client.send(client.build_request(method, url, **kwargs), stream=True)
+        return await client.request(method, url, **kwargs)
+
+    async def _send(self, method: str, url: str, kwargs: dict, stream: bool = False):
+        """Sends one attempt of a request, to the healthiest regions when failing over.
+
+        Every request sent, failover and hedged ones included, first waits for
+        the rate limiter.
+        """
+        failover = self._failover
+        if failover is None or not url.startswith(self._base_url + "/"):
+            await self._throttle(url)
+            return await self._client_send(self._client_for(url), method, url, kwargs, stream)
+        path = url[len(self._base_url):]
+        regions = failover.candidates()
+        if failover.hedge_validate and path == "/validate" and len(regions) > 1:
+            return await self._send_hedged(method, regions, path, kwargs)
+        for index, region in enumerate(regions):
+            last = index == len(regions) - 1
+            if not failover.begin_call(region) and not last:
+                continue  # another request is probing this half-open region
+            try:
+                response = await self._send_to_region(method, region, path, kwargs, stream)
+            except httpx.TransportError:
+                if last:
+                    raise
+            else:
+                if response.status_code < 500 or last:
+                    return response
+                await response.aclose()
+            failover.record_failover()
+
+    async def _send_to_region(self, method: str, region: str, path: str, kwargs: dict, stream: bool = False):
+        try:
+            await self._throttle(region + path)
+            started = time.monotonic()
+            response = await self._client_send(self._api_client, method, region + path, kwargs, stream)
+        except httpx.TransportError:
+            self._failover.record_failure(region)
+            raise
+        except BaseException:
+            self._failover.abandon_call(region)
+            raise
+        if response.status_code >= 500:
+            self._failover.record_failure(region)
+        else:
+            self._failover.record_success(region, time.monotonic() - started)
+        return response
+
+    async def _send_hedged(self, method: str, regions: List[str], path: str, kwargs: dict):
+        failover = self._failover
+        first = next((region for region in regions if failover.begin_call(region)), regions[0])
+        primary = asyncio.ensure_future(self._send_to_region(method, first, path, kwargs))
+        done, _ = await asyncio.wait({primary}, timeout=failover.hedge_delay_s(first))
+        if done:
+            if primary.exception() is None and primary.result().status_code < 500:
+                return primary.result()
+            if primary.exception() is not None and not isinstance(primary.exception(), httpx.TransportError):
+                return primary.result()
+        second = next((region for region in regions if region != first and failover.begin_call(region)), None)
+        if second is None:
+            return await primary
+        if done:
+            failover.record_failover()
+        else:
+            failover.record_hedge()
+        pending = {primary, asyncio.ensure_future(self._send_to_region(method, second, path, kwargs))}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().status_code < 500:
+                        return task.result()
+            # both failed: report the primary's outcome
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get(self, url, response_class, params=None):
+        return response_class(await self._get_json(url, params))
+
+    async def _get_json(self, url, params=None):
+        if not params:
+            params = {}
+        params["api_key"] = self._api_key
+        # httpx sends None values as empty strings, requests drops them
+        params = {k: v for k, v in params.items() if v is not None}
+        response = await self._request("GET", url, params=params)
+
+        try:
+            json_response = self._json_loads(response.content)
+        except ValueError as e:
+            raise ZBApiException from e
+
+        error = json_response.pop("error", None)
+        if error:
+            raise ZBApiException(error)
+        return json_response
+
+    async def _post(self, url, response_class, data=None, json=None, files=None, content=None, headers=None):
+        response = await self._request(
+            "POST", url, data=data, json=json, files=files, content=content, headers=headers
+        )
+        try:
+            json_response = self._json_loads(response.content)
+        except ValueError as e:
+            raise ZBApiException('Request not processed succesfully. Status code %s' % response.status_code)
+
+        return response_class(json_response)
+
+    async def get_credits(self):
+        """Tells you how many credits you have left on your account.
+
+        Returns
+        -------
+        response: ZBGetCreditsResponse
+        """
+
+        return await self._get(f"{self._base_url}/getcredits", ZBGetCreditsResponse)
+
+    async def get_api_usage(self, start_date: date, end_date: date):
+        """Returns the API usage between the given dates.
+
+        Returns
+        -------
+        response: ZBGetApiUsageResponse
+        """
+
+        return await self._get(
+            f"{self._base_url}/getapiusage",
+            ZBGetApiUsageResponse,
+            params={
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+            },
+        )
+
+    async def get_activity(self, email: str):
+        """Allows you to gather insights into your subscribers' overall email engagement
+
+        Returns
+        -------
+        response: ZBGetActivityResponse
+        """
+
+        return await self._get(
+            f"{self._base_url}/activity", ZBGetActivityResponse, params={"email": email}
+        )
+
+    async def validate(self, email: str, ip_address: str = None, lazy: bool = False):
+        """Validates the given email address.
+        When the client has a validate_cache, a cached result is returned if available.
+        When the client has a pre_filter, the addresses it rejects are answered locally.
+        With `lazy`, the result is a ZBLazyValidateResponse.
+
+        Returns
+        -------
+        response: ZBValidateResponse
+        """
+        response_class = ZBLazyValidateResponse if lazy else ZBValidateResponse
+        if self._pre_filter is not None:
+            local_result = await _run_blocking(self._pre_filter.local_result, email)
+            if local_result is not None:
+                return response_class(local_result)
+
+        if self._validate_cache is not None:
+            cached = self._validate_cache.get(email, ip_address)
+            if cached is not None:
+                return response_class(cached)
+
+        if self._validate_flight is None:
+            return response_class(await self._fetch_validate(email, ip_address))
+        json_response = await self._validate_flight.do(
+            ZBValidateCache.key(email, ip_address),
+            lambda: self._fetch_validate(email, ip_address),
+        )
+        # every coalesced caller gets its own response object
+        return response_class(dict(json_response))
+
+    async def _fetch_validate(self, email: str, ip_address: str = None):
+        json_response = await self._get_json(
+            f"{self._base_url}/validate",
+            params={
+                "email": email,
+                "ip_address": ip_address,
+            },
+        )
+        if self._validate_cache is not None:
+            self._validate_cache.set(email, ip_address, dict(json_response))
+        return json_response
+
+    async def validate_batch(
+        self, email_batch: List[ZBValidateBatchElement], compact: bool = False, lazy: bool = False
+    ):
+        """Allows you to send us batches up to 100 emails at a time.
+
+        With `compact`, the results are slotted ZBCompactValidateBatchEmail objects.
+        With `lazy`, each result is built when first accessed.
+
+        Returns
+        -------
+        response: ZBValidateBatchResponse
+        """
+        if not email_batch:
+            raise ZBClientException("Empty parameter: email_batch")
+        response_class = partial(ZBValidateBatchResponse, compact=compact, lazy=lazy)
+        if self._pre_filter is not None:
+            email_batch, local_results = await _run_blocking(self._pre_filter.split, email_batch)
+            if not email_batch:
+                return response_class({"email_batch": local_results, "errors": []})
+            if local_results:
+                response_class = with_local_results(response_class, local_results)
+
+        json = {
+            "api_key": self._api_key,
+            "email_batch": [
+                batch_element.to_json() for batch_element in email_batch
+            ],
+        }
+        return await self._post(
+            f"{self._base_url}/validatebatch",
+            response_class,
+            json=json)
+
+    async def validate_many(
+        self,
+        emails: Iterable[Union[str, ZBValidateBatchElement]],
+        concurrency: int = 10,
+        compact: bool = False,
+        lazy: bool = False,
+        deduplicator: Optional[ZBDeduplicator] = None,
+    ) -> AsyncIterator[Union[ZBValidateBatchEmail, ZBValidateBatchError]]:
+        """Validates any number of email addresses through validatebatch.
+
+        An async generator with the same semantics as `ZeroBounce.validate_many`:
+        batches of 100, up to `concurrency` in flight, one result per input
+        address yielded in input order, duplicates sent once with a `deduplicator`.
+
+        Returns
+        -------
+        results: AsyncIterator[Union[ZBValidateBatchEmail, ZBValidateBatchError]]
+        """
+        if concurrency < 1:
+            raise ZBClientException("Invalid parameter: concurrency must be at least 1")
+
+        if deduplicator is not None:
+            fan_out = DuplicateFanOut(deduplicator)
+            async for result in self.validate_many(fan_out.unique(emails), concurrency, compact, lazy):
+                fan_out.add(result)
+                for drained in fan_out.drain():
+                    yield drained
+            for drained in fan_out.drain():
+                yield drained
+            return
+
+        pending = deque()
+        try:
+            for chunk in chunk_batch_elements(emails):
+                pending.append((chunk, asyncio.ensure_future(self.validate_batch(chunk, compact, lazy))))
+                if len(pending) >= concurrency:
+                    chunk, task = pending.popleft()
+                    for result in match_batch_results(chunk, await task):
+                        yield result
+            while pending:
+                chunk, task = pending.popleft()
+                for result in match_batch_results(chunk, await task):
+                    yield result
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def _send_file(
+        self,
+        scoring: bool,
+        file_path: str,
+        email_address_column: int,
+        data: dict,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        with open(file_path, "rb") as file:
+            return await self._send_file_from_stream(
+                scoring, file, os.path.basename(file_path), email_address_column, data,
+                progress_callback,
+            )
+
+    async def _send_file_from_stream(
+        self,
+        scoring: bool,
+        file_stream: BinaryIO,
+        file_name: str,
+        email_address_column: int,
+        data: dict,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        url = f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/sendfile"
+        body = ZeroBounce._send_file_body(
+            self._api_key, file_stream, file_name, email_address_column, data, progress_callback
+        )
+        return await self._post(url, ZBSendFileResponse, content=body, headers=body.headers)
+
+    async def send_file(
+        self,
+        file_path: str,
+        email_address_column: int,
+        return_url: str = None,
+        first_name_column: int = None,
+        last_name_column: int = None,
+        gender_column: int = None,
+        ip_address_column: int = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        allow_phase_2: Optional[bool] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """Allows user to send a file for bulk email validation
+
+        Returns
+        -------
+        response: ZBSendFileResponse
+        """
+        data = ZeroBounce._send_file_data(
+            return_url=return_url,
+            first_name_column=first_name_column,
+            last_name_column=last_name_column,
+            gender_column=gender_column,
+            ip_address_column=ip_address_column,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+            allow_phase_2=allow_phase_2,
+        )
+        return await self._send_file(False, file_path, email_address_column, data, progress_callback)
+
+    async def send_file_stream(
+        self,
+        file_stream: BinaryIO,
+        file_name: str,
+        email_address_column: int,
+        return_url: str = None,
+        first_name_column: int = None,
+        last_name_column: int = None,
+        gender_column: int = None,
+        ip_address_column: int = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        allow_phase_2: Optional[bool] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """Send a file for bulk email validation from a stream.
+
+        Returns
+        -------
+        response: ZBSendFileResponse
+        """
+        data = ZeroBounce._send_file_data(
+            return_url=return_url,
+            first_name_column=first_name_column,
+            last_name_column=last_name_column,
+            gender_column=gender_column,
+            ip_address_column=ip_address_column,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+            allow_phase_2=allow_phase_2,
+        )
+        return await self._send_file_from_stream(
+            False, file_stream, file_name, email_address_column, data, progress_callback
+        )
+
+    async def scoring_send_file(
+        self,
+        file_path: str,
+        email_address_column: int,
+        return_url: str = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """Allows user to send a file for bulk email scoring
+
+        Returns
+        -------
+        response: ZBSendFileResponse
+        """
+        data = ZeroBounce._send_file_data(
+            return_url=return_url,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+        )
+        return await self._send_file(True, file_path, email_address_column, data, progress_callback)
+
+    async def scoring_send_file_stream(
+        self,
+        file_stream: BinaryIO,
+        file_name: str,
+        email_address_column: int,
+        return_url: str = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ):
+        """Send a file for bulk email scoring from a stream.
+
+        Returns
+        -------
+        response: ZBSendFileResponse
+        """
+        data = ZeroBounce._send_file_data(
+            return_url=return_url,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+        )
+        return await self._send_file_from_stream(
+            True, file_stream, file_name, email_address_column, data, progress_callback
+        )
+
+    @staticmethod
+    async def _gather_limited(coroutines: list, concurrency: int) -> list:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*(limited(coroutine) for coroutine in coroutines))
+
+    async def _send_file_sharded(
+        self,
+        scoring: bool,
+        source: Union[str, BinaryIO],
+        file_name: Optional[str],
+        email_address_column: int,
+        shards: int,
+        concurrency: Optional[int],
+        data: dict,
+    ):
+        ZeroBounce._check_shards(shards, concurrency)
+        file_name = ZeroBounce._shard_file_name(source, file_name)
+        # splitting copies the whole file: keep it off the event loop
+        csv_shards = await _run_blocking(CsvShards, source, shards, bool(data.get("has_header_row")), file_name)
+        try:
+            if not csv_shards.paths:
+                raise ZBClientException("Empty file: there are no records to send")
+            responses = await self._gather_limited(
+                [self._send_file(scoring, path, email_address_column, data) for path in csv_shards.paths],
+                concurrency or len(csv_shards.paths),
+            )
+        finally:
+            await _run_blocking(csv_shards.close)
+        return ZBShardedSendFileResponse({"responses": responses})
+
+    async def send_file_sharded(
+        self,
+        source: Union[str, BinaryIO],
+        email_address_column: int,
+        shards: int = 4,
+        file_name: Optional[str] = None,
+        return_url: str = None,
+        first_name_column: int = None,
+        last_name_column: int = None,
+        gender_column: int = None,
+        ip_address_column: int = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        allow_phase_2: Optional[bool] = None,
+        concurrency: Optional[int] = None,
+    ):
+        """Splits a large file into shards and sends them concurrently for bulk email validation
+
+        Returns
+        -------
+        response: ZBShardedSendFileResponse
+        """
+        data = ZeroBounce._send_file_data(
+            return_url=return_url,
+            first_name_column=first_name_column,
+            last_name_column=last_name_column,
+            gender_column=gender_column,
+            ip_address_column=ip_address_column,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+            allow_phase_2=allow_phase_2,
+        )
+        return await self._send_file_sharded(
+            False, source, file_name, email_address_column, shards, concurrency, data
+        )
+
+    async def scoring_send_file_sharded(
+        self,
+        source: Union[str, BinaryIO],
+        email_address_column: int,
+        shards: int = 4,
+        file_name: Optional[str] = None,
+        return_url: str = None,
+        has_header_row: bool = False,
+        remove_duplicate: bool = True,
+        concurrency: Optional[int] = None,
+    ):
+        """Splits a large file into shards and sends them concurrently for bulk email scoring
+
+        Returns
+        -------
+        response: ZBShardedSendFileResponse
+        """
+        data = ZeroBounce._send_file_data(
+            return_url=return_url,
+            has_header_row=has_header_row,
+            remove_duplicate=remove_duplicate,
+        )
+        return await self._send_file_sharded(
+            True, source, file_name, email_address_column, shards, concurrency, data
+        )
+
+    async def _file_status(self, scoring: bool, file_id: str):
+        if not file_id.strip():
+            raise ZBClientException("Empty parameter: file_id")
+        return await self._get(
+            f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/filestatus",
+            ZBFileStatusResponse,
+            params={"file_id": file_id},
+        )
+
+    async def file_status(self, file_id: str):
+        """Returns the file processing status for the file that has been submitted
+
+        Returns
+        -------
+        response: ZBFileStatusResponse
+        """
+
+        return await self._file_status(False, file_id)
+
+    async def scoring_file_status(self, file_id: str):
+        """Returns the file processing status for the file that has been submitted
+
+        Returns
+        -------
+        response: ZBFileStatusResponse
+        """
+
+        return await self._file_status(True, file_id)
+
+    async def _file_status_many(
+        self,
+        scoring: bool,
+        file_ids: Iterable[str],
+        concurrency: int,
+        max_requests_per_second: Optional[float],
+    ) -> Dict[str, ZBFileStatusResponse]:
+        ZeroBounce._check_status_sweep(concurrency, max_requests_per_second)
+        file_ids = list(dict.fromkeys(file_ids))
+        interval_s = 1 / max_requests_per_second if max_requests_per_second else 0
+        started = time.monotonic()
+
+        async def file_status(index: int, file_id: str):
+            delay = started + index * interval_s - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await self._file_status(scoring, file_id)
+            except Exception as e:
+                return ZeroBounce._file_status_error(file_id, e)
+
+        responses = await self._gather_limited(
+            [file_status(index, file_id) for index, file_id in enumerate(file_ids)], concurrency
+        )
+        return dict(zip(file_ids, responses))
+
+    async def file_status_many(
+        self,
+        file_ids: Iterable[str],
+        concurrency: int = 10,
+        max_requests_per_second: Optional[float] = None,
+    ) -> Dict[str, ZBFileStatusResponse]:
+        """Returns the file processing status of many submitted files at once
+
+        Returns
+        -------
+        response: Dict[str, ZBFileStatusResponse]
+        """
+
+        return await self._file_status_many(False, file_ids, concurrency, max_requests_per_second)
+
+    async def scoring_file_status_many(
+        self,
+        file_ids: Iterable[str],
+        concurrency: int = 10,
+        max_requests_per_second: Optional[float] = None,
+    ) -> Dict[str, ZBFileStatusResponse]:
+        """Returns the scoring file processing status of many submitted files at once
+
+        Returns
+        -------
+        response: Dict[str, ZBFileStatusResponse]
+        """
+
+        return await self._file_status_many(True, file_ids, concurrency, max_requests_per_second)
+
+    async def _get_file(
+        self,
+        scoring: bool,
+        file_id: str,
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        resume: bool = False,
+        verify: bool = False,
+    ):
+        params = ZeroBounce._get_file_params(self._api_key, scoring, file_id, options)
+        url = f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/getfile"
+        headers, offset = resume_request_headers(download_path) if resume else (None, 0)
+        response = await self._request("GET", url, params=params, headers=headers, stream=True)
+        try:
+            append_at, expected_size = resume_plan(response.status_code, response.headers, offset)
+            if append_at is None and offset:
+                # the server cannot continue the part file: download it all again
+                await response.aclose()
+                del headers["Range"]
+                response = await self._request("GET", url, params=params, headers=headers, stream=True)
+                append_at, expected_size = resume_plan(response.status_code, response.headers, 0)
+            if append_at is None:
+                raise ZBApiException('Unexpected partial getfile response. Status code %s' % response.status_code)
+            await self._write_get_file(
+                response, download_path, append_at, expected_size if verify else None, resume
+            )
+        finally:
+            await response.aclose()
+        return ZBGetFileResponse({"local_file_path": download_path})
+
+    async def _write_get_file(self, response, download_path, append_at, expected_size, keep_part):
+        download = GetFileDownload(
+            download_path,
+            response.status_code,
+            response.headers.get("Content-Type") or "",
+            partial(ZeroBounce._raise_for_get_file_error, json_loads=self._json_loads),
+            resume_offset=append_at,
+            expected_size=expected_size,
+            keep_part=keep_part,
+        )
+        try:
+            async for chunk in response.aiter_bytes(ZeroBounce.DOWNLOAD_CHUNK_SIZE):
+                download.feed(chunk)
+            download.finish()
+        except BaseException:
+            download.abort()
+            raise
+
+    async def get_file(
+        self,
+        file_id: str,
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        resume: bool = False,
+        verify: bool = False,
+    ):
+        """Allows you to get the validation results for the file you submitted
+
+        Returns
+        -------
+        response: ZBGetFileResponse
+        """
+
+        return await self._get_file(False, file_id, download_path, options, resume, verify)
+
+    async def scoring_get_file(
+        self,
+        file_id: str,
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        resume: bool = False,
+        verify: bool = False,
+    ):
+        """Allows you to get the scoring results for the file you submitted
+
+        Returns
+        -------
+        response: ZBGetFileResponse
+        """
+
+        return await self._get_file(True, file_id, download_path, options, resume, verify)
+
+    async def _get_file_sharded(
+        self,
+        scoring: bool,
+        file_ids: List[str],
+        download_path: str,
+        options: Optional[ZBGetFileOptions],
+        concurrency: int,
+    ):
+        if not file_ids:
+            raise ZBClientException("Empty parameter: file_ids")
+        ZeroBounce._check_shards(len(file_ids), concurrency)
+        with tempfile.TemporaryDirectory(prefix="zb-shards-") as directory:
+            paths = [os.path.join(directory, f"{index}.csv") for index in range(len(file_ids))]
+            await self._gather_limited(
+                [
+                    self._get_file(scoring, file_id, path, options)
+                    for file_id, path in zip(file_ids, paths)
+                ],
+                concurrency,
+            )
+            await _run_blocking(merge_result_files, paths, download_path)
+        return ZBGetFileResponse({"local_file_path": download_path})
+
+    async def get_file_sharded(
+        self,
+        file_ids: List[str],
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        concurrency: int = 4,
+    ):
+        """Downloads the results of a file sent with `send_file_sharded` as one file
+
+        Returns
+        -------
+        response: ZBGetFileResponse
+        """
+
+        return await self._get_file_sharded(False, file_ids, download_path, options, concurrency)
+
+    async def scoring_get_file_sharded(
+        self,
+        file_ids: List[str],
+        download_path: str,
+        options: Optional[ZBGetFileOptions] = None,
+        concurrency: int = 4,
+    ):
+        """Downloads the results of a file sent with `scoring_send_file_sharded` as one file
+
+        Returns
+        -------
+        response: ZBGetFileResponse
+        """
+
+        return await self._get_file_sharded(True, file_ids, download_path, options, concurrency)
+
+    async def iter_file_results(
+        self,
+        file_id: str,
+        options: Optional[ZBGetFileOptions] = None,
+        email_address_column: Optional[int] = None,
+    ) -> AsyncIterator[ZBFileResultRow]:
+        """Streams the validation results for the file you submitted as parsed rows.
+
+        Returns
+        -------
+        rows: AsyncIterator[ZBFileResultRow]
+        """
+        params = ZeroBounce._get_file_params(self._api_key, False, file_id, options)
+        url = f"{self.BULK_BASE_URL}/getfile"
+        response = await self._request("GET", url, params=params, stream=True)
+        try:
+            parser = FileResultRowParser(
+                response.status_code,
+                response.headers.get("Content-Type") or "",
+                partial(ZeroBounce._raise_for_get_file_error, json_loads=self._json_loads),
+                email_address_column,
+            )
+            async for chunk in response.aiter_bytes(ZeroBounce.DOWNLOAD_CHUNK_SIZE):
+                for row in parser.feed(chunk):
+                    yield row
+            for row in parser.finish():
+                yield row
+        finally:
+            await response.aclose()
+
+    async def _delete_file(self, scoring: bool, file_id: str):
+        if not file_id.strip():
+            raise ZBClientException("Empty parameter: file_id")
+        return await self._get(
+            f"{self.SCORING_BASE_URL if scoring else self.BULK_BASE_URL}/deletefile",
+            ZBDeleteFileResponse,
+            params={"file_id": file_id},
+        )
+
+    async def delete_file(self, file_id: str):
+        """Deletes the file that you submitted
+
+        Returns
+        -------
+        response: ZBDeleteFileResponse
+        """
+
+        return await self._delete_file(False, file_id)
+
+    async def scoring_delete_file(self, file_id: str):
+        """Deletes the file that you submitted
+
+        Returns
+        -------
+        response: ZBDeleteFileResponse
+        """
+
+        return await self._delete_file(True, file_id)
+
+    async def find_email_format(
+        self,
+        first_name: str,
+        domain: str = '',
+        company_name: str = '',
+        middle_name: str = '',
+        last_name: str = ''
+    ):
+        params = ZeroBounce._find_email_format_params(
+            first_name, domain, company_name, middle_name, last_name
+        )
+        if self._domain_format_cache is not None:
+            domain_format = self._domain_format_cache.get(domain, company_name)
+            if domain_format is None:
+                try:
+                    domain_format = await self._fetch_domain_format(
+                        domain, company_name, ZeroBounce._find_domain_params(domain, company_name)
+                    )
+                except (ZBApiException, ValueError, httpx.HTTPError):
+                    # the direct request below may still succeed
+                    domain_format = None
+            if domain_format is not None:
+                local = self._domain_format_cache.format_email(domain_format, first_name, middle_name, last_name)
+                if local is not None:
+                    return local
+        return await self._get(
+            f"{self._base_url}/guessformat",
+            ZBFindEmailFormatResponse,
+            params)
+
+    async def find_domain(
+        self,
+        domain: str = '',
+        company_name: str = ''
+    ):
+        params = ZeroBounce._find_domain_params(domain, company_name)
+        if self._domain_format_cache is not None:
+            cached = self._domain_format_cache.get(domain, company_name)
+            if cached is not None:
+                return cached
+        return await self._fetch_domain_format(domain, company_name, params)
+
+    async def _fetch_domain_format(self, domain: str, company_name: str, params: dict) -> ZBFindDomainResponse:
+        response = await self._get(
+            f"{self._base_url}/guessformat",
+            ZBFindDomainResponse,
+            params)
+        if self._domain_format_cache is not None:
+            self._domain_format_cache.put(domain, company_name, response)
+        return response
@@ -1,3 +1,4 @@
+import copy
 import json
 from unittest import TestCase
 from unittest.mock import patch
@@ -10,6 +11,9 @@ class BaseTestCase(TestCase):
         requests_patch = patch("zerobouncesdk.zerobouncesdk.requests")
         self.addCleanup(requests_patch.stop)
         self.requests_mock = requests_patch.start()
+        # The client talks through a pooled requests.Session; route its calls
+        # to the same mock so tests can assert on requests_mock.get/post.
+        self.requests_mock.Session.return_value = self.requests_mock
         self.zero_bounce_client = ZeroBounce("dummy_key")
 
 
@@ -31,5 +35,13 @@ class MockResponse:
     def ok(self):
         return self.status_code < 400
 
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
     def json(self):
-        return self.json_data
+        # like requests, hand out a fresh object on every call
+        return copy.deepcopy(self.json_data)
@@ -1,21 +1,60 @@
-from datetime import date, datetime, timedelta
+import asyncio
+import io
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
+from unittest import IsolatedAsyncioTestCase, mock
 
+import httpx
+import requests
 
 from . import BaseTestCase, MockResponse
 from zerobouncesdk import (
+    AsyncZeroBounce,
     ZBApiException,
+    ZBApiUrl,
+    ZBBulkJobRunner,
+    ZBCacheBackend,
     ZBClientException,
+    ZBCompactValidateBatchEmail,
+    ZBCompactValidateResponse,
     ZBConfidence,
+    ZBDeduplicator,
+    ZBDomainFormatCache,
     ZBDownloadType,
+    ZBEmailNormalizer,
     ZBGetFileOptions,
+    ZBLazyValidateBatchEmail,
+    ZBLazyValidateResponse,
+    ZBMemoryCacheBackend,
+    ZBMxPreScreen,
+    ZBPreFilter,
+    ZBRateLimiter,
+    ZBRegionFailover,
+    ZBResultStore,
+    ZBRetryPolicy,
+    ZBSqliteCacheBackend,
+    ZBValidateCache,
     ZBValidateStatus,
     ZBValidateSubStatus,
+    ZBValidateBatchColumns,
     ZBValidateBatchElement,
     ZBValidateBatchError,
+    ZBValidateBatchResponse,
+    ZBValidateResponse,
+    ZBValidateDispatcher,
     ZeroBounce,
 )
+from zerobouncesdk import _zb_csv_shards, zb_mx_pre_screen
+from zerobouncesdk._zb_json import loads_object
 from zerobouncesdk._zb_response import ZBResponse
+from zerobouncesdk._zb_utils import parse_datetime, safe_enum_convert
 
 
 class ZeroBounceTestCase(BaseTestCase):
@@ -44,6 +83,39 @@ class ZeroBounceTestCase(BaseTestCase):
             'https://example.com', params={'api_key': 'dummy_key'}, timeout=120.0
         )
 
+    def test_session_mounts_pool_per_host(self):
+        self.requests_mock.mount.reset_mock()
+        ZeroBounce("dummy_key", api_pool_size=20, bulk_pool_size=3, scoring_pool_size=2)
+        mounted = {
+            call.args[0]: call.args[1]._pool_maxsize
+            for call in self.requests_mock.mount.call_args_list
+        }
+        self.assertEqual(mounted, {
+            "https://api.zerobounce.net/v2/": 20,
+            "https://bulkapi.zerobounce.net/v2/": 3,
+            "https://bulkapi.zerobounce.net/v2/scoring/": 2,
+        })
+
+    def test_init_rejects_empty_pool(self):
+        with self.assertRaises(ZBClientException) as cm:
+            ZeroBounce("dummy_key", api_pool_size=0)
+        self.assertEqual(str(cm.exception), "Invalid parameter: api_pool_size must be at least 1")
+
+    def test_session_reused_across_calls(self):
+        self.requests_mock.get.return_value = MockResponse({"Credits": "1"})
+        self.requests_mock.Session.reset_mock()
+        client = ZeroBounce("dummy_key")
+        client.get_credits()
+        client.get_credits()
+        self.requests_mock.Session.assert_called_once_with()
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+
+    def test_context_manager_closes_session(self):
+        with ZeroBounce("dummy_key") as client:
+            self.assertIsInstance(client, ZeroBounce)
+            self.requests_mock.close.assert_not_called()
+        self.requests_mock.close.assert_called_once_with()
+
     def test_credits_invalid_key(self):
         self.requests_mock.get.return_value = MockResponse({
             "Credits": "-1",
@@ -112,6 +184,461 @@ class ZeroBounceTestCase(BaseTestCase):
         self.assertEqual(response.sub_status, ZBValidateSubStatus.mailbox_not_found)
         self.assertEqual(response.processed_at, datetime(2023, 3, 28, 12, 30, 18, 990000))
 
+    def test_validate_lazy_decodes_on_first_access(self):
+        self.requests_mock.get.return_value = MockResponse({
+            "address": "invalid@example.com",
+            "status": "invalid",
+            "sub_status": "mailbox_not_found",
+            "processed_at": "2023-03-28 12:30:18.990",
+        })
+
+        response = self.zero_bounce_client.validate("invalid@example.com", lazy=True)
+        self.assertIsInstance(response, ZBLazyValidateResponse)
+        self.assertEqual(response.__dict__["status"], "invalid")
+        self.assertEqual(response.status, ZBValidateStatus.invalid)
+        self.assertIs(response.__dict__["status"], ZBValidateStatus.invalid)
+        self.assertEqual(response.__dict__["processed_at"], "2023-03-28 12:30:18.990")
+        self.assertEqual(response.sub_status, ZBValidateSubStatus.mailbox_not_found)
+        self.assertEqual(response.processed_at, datetime(2023, 3, 28, 12, 30, 18, 990000))
+        self.assertIsNone(response.did_you_mean)
+
+    def test_lazy_validate_response_str_and_assignment(self):
+        response = ZBLazyValidateResponse({"status": "valid"})
+        response.sub_status = ZBValidateSubStatus.alias_address
+        self.assertIs(response.sub_status, ZBValidateSubStatus.alias_address)
+        self.assertIsNone(response.processed_at)
+        self.assertIn("ZBValidateStatus.valid", str(response))
+
+    def test_pre_filter_checks_syntax_and_domains(self):
+        pre_filter = ZBPreFilter(disposable_domains=["Mailinator.com", "b\u00fccher.example"], invalid_domains={"nomx.test"})
+        self.assertIsNone(pre_filter.check("john.doe+tag@example.com"))
+        self.assertIsNone(pre_filter.check('"john doe"@example.com'))
+        self.assertIsNone(pre_filter.check("\u00fcser@example.com"))
+        for email in ("plainaddress", "a..b@example.com", "a@localhost", "a@-example.com", "a@example.123",
+                      "a" * 65 + "@example.com", "a@[192.0.2.1]"):
+            result = pre_filter.check(email)
+            self.assertEqual(result.sub_status, ZBValidateSubStatus.failed_syntax_check, email)
+        disposable = pre_filter.check("x@mail.MAILINATOR.com")
+        self.assertEqual(disposable.status, ZBValidateStatus.do_not_mail)
+        self.assertEqual(disposable.sub_status, ZBValidateSubStatus.disposable)
+        self.assertEqual(disposable.domain, "mail.mailinator.com")
+        self.assertTrue(disposable.decided_locally)
+        self.assertEqual(pre_filter.check("x@B\u00dcCHER.example").sub_status, ZBValidateSubStatus.disposable)
+        self.assertEqual(pre_filter.check("x@nomx.test").sub_status, ZBValidateSubStatus.no_dns_entries)
+        self.assertEqual(pre_filter.normalize("Jo@B\u00fccher.Example"), "Jo@xn--bcher-kva.example")
+        self.assertEqual(ZBPreFilter(allow_domain_literals=True).normalize("a@[192.0.2.1]"), "a@[192.0.2.1]")
+        self.assertEqual(pre_filter.rejected["failed_syntax_check"], 7)
+
+    @staticmethod
+    def _stub_resolver(lookups, ttl_s=None):
+        mail_hosts = {"example.com": ["mx.example.com"], "other.example": ["mx.other.example"]}
+
+        def resolve(domain):
+            lookups.append(domain)
+            if domain == "timeout.example":
+                raise TimeoutError(domain)
+            return mail_hosts.get(domain, []), ttl_s
+        return resolve
+
+    def test_mx_pre_screen_caches_each_domain(self):
+        lookups = []
+        screen = ZBMxPreScreen(self._stub_resolver(lookups), concurrency=4)
+
+        results = screen.has_mail_servers(["Example.com", "example.com.", "dead.example", "timeout.example"])
+        self.assertEqual(results, {"example.com": True, "dead.example": False, "timeout.example": None})
+        self.assertEqual(sorted(lookups), ["dead.example", "example.com", "timeout.example"])
+        self.assertTrue(screen.has_mail_server("EXAMPLE.com"))
+        self.assertFalse(screen.has_mail_server("dead.example"))
+        self.assertIsNone(screen.has_mail_server("timeout.example"))
+        self.assertEqual(len(lookups), 3)
+        self.assertEqual(screen.stats["hits"], 3)
+        self.assertEqual(screen.stats["errors"], 1)
+
+        # failures are only remembered for error_ttl
+        screen = ZBMxPreScreen(self._stub_resolver(lookups), error_ttl=timedelta(0))
+        screen.has_mail_server("timeout.example")
+        screen.has_mail_server("timeout.example")
+        self.assertEqual(lookups.count("timeout.example"), 3)
+
+    def test_mx_pre_screen_without_dnspython_never_rejects(self):
+        # an MX-only domain has no address record: getaddrinfo fails with EAI_NONAME
+        def getaddrinfo(host, port, *args, **kwargs):
+            if host == "mx-only.example":
+                raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("192.0.2.1", 0))]
+
+        with mock.patch.object(zb_mx_pre_screen, "dns", None), \
+                mock.patch.object(zb_mx_pre_screen.socket, "getaddrinfo", getaddrinfo):
+            screen = ZBMxPreScreen()
+            self.assertIsNone(screen.has_mail_server("mx-only.example"))
+            self.assertTrue(screen.has_mail_server("example.com"))
+            self.assertIsNone(ZBPreFilter(mx_screen=screen).check("jane@mx-only.example"))
+
+    def test_mx_pre_screen_respects_ttl(self):
+        lookups = []
+        screen = ZBMxPreScreen(self._stub_resolver(lookups, ttl_s=0), min_ttl=timedelta(0))
+        screen.has_mail_server("example.com")
+        screen.has_mail_server("example.com")
+        self.assertEqual(lookups, ["example.com", "example.com"])
+
+        lookups.clear()
+        screen = ZBMxPreScreen(self._stub_resolver(lookups, ttl_s=0), min_ttl=timedelta(minutes=1))
+        screen.has_mail_server("example.com")
+        screen.has_mail_server("example.com")
+        self.assertEqual(lookups, ["example.com"])
+
+    def test_pre_filter_with_mx_screen(self):
+        lookups = []
+        pre_filter = ZBPreFilter(mx_screen=ZBMxPreScreen(self._stub_resolver(lookups)))
+        client = ZeroBounce("dummy_key", pre_filter=pre_filter)
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+
+        emails = ["a@example.com", "b@dead.example", "c@example.com", "d@timeout.example", "e@dead.example"]
+        results = list(client.validate_many(emails))
+        sent = [e["email_address"] for e in self.requests_mock.post.call_args.kwargs["json"]["email_batch"]]
+        self.assertEqual(sent, ["a@example.com", "c@example.com", "d@timeout.example"])
+        self.assertEqual(results[1].sub_status, ZBValidateSubStatus.no_dns_entries)
+        self.assertTrue(results[4].decided_locally)
+        self.assertEqual(sorted(lookups), ["dead.example", "example.com", "timeout.example"])
+
+    def test_pre_filter_filter_file(self):
+        directory = self._download_dir()
+        source = directory / "emails.csv"
+        source.write_bytes(
+            b'email,name\r\na@example.com,"Doe, John"\r\nbroken,x\r\n\r\n'
+            b'b@dead.example,y\r\nc@other.example,"multi\r\nline"\r\n'
+        )
+        pre_filter = ZBPreFilter(mx_screen=ZBMxPreScreen(self._stub_resolver([])))
+
+        rejected = pre_filter.filter_file(str(source), str(directory / "filtered.csv"), 1, has_header_row=True)
+        self.assertEqual(
+            (directory / "filtered.csv").read_bytes(),
+            b'email,name\r\na@example.com,"Doe, John"\r\nc@other.example,"multi\r\nline"\r\n',
+        )
+        self.assertEqual([r["address"] for r in rejected], ["broken", "b@dead.example"])
+        self.assertEqual([r["sub_status"] for r in rejected], ["failed_syntax_check", "no_dns_entries"])
+
+    def test_email_normalizer(self):
+        normalizer = ZBEmailNormalizer()
+        self.assertEqual(normalizer("  Jane.Doe+news@Example.COM. "), "Jane.Doe+news@example.com")
+        self.assertEqual(normalizer("jane@Bücher.de"), "jane@xn--bcher-kva.de")
+        self.assertEqual(normalizer(" not-an-email "), "not-an-email")
+        self.assertEqual(ZBEmailNormalizer(fold_local_part=True)("Jane@Example.com"), "jane@example.com")
+
+        provider_rules = ZBEmailNormalizer(provider_rules=True)
+        self.assertEqual(provider_rules("J.Doe+promo@GoogleMail.com"), "jdoe@gmail.com")
+        self.assertEqual(provider_rules("Jane+tag@outlook.com"), "jane@outlook.com")
+        self.assertEqual(provider_rules("j.doe+tag@example.com"), "j.doe+tag@example.com")
+
+    def test_deduplicator_modes(self):
+        for mode in (ZBDeduplicator.EXACT, ZBDeduplicator.BLOOM):
+            deduplicator = ZBDeduplicator(mode=mode, expected_items=1000)
+            self.assertTrue(deduplicator.add("a@example.com"))
+            self.assertFalse(deduplicator.add(" a@EXAMPLE.com"))
+            self.assertTrue(deduplicator.add("A@example.com"))
+            self.assertEqual((deduplicator.unique, deduplicator.duplicates), (2, 1))
+
+        bloom = ZBDeduplicator(mode=ZBDeduplicator.BLOOM, expected_items=10000, false_positive_rate=0.01)
+        new = sum(bloom.add(f"user{i}@example.com") for i in range(10000))
+        self.assertGreater(new, 9800)
+        with self.assertRaises(ZBClientException):
+            ZBDeduplicator(mode="fuzzy")
+        with self.assertRaises(ZBClientException):
+            ZBDeduplicator(false_positive_rate=1)
+
+    def test_validate_many_sends_duplicates_once(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        deduplicator = ZBDeduplicator(ZBEmailNormalizer(provider_rules=True))
+        emails = [f"user{i % 120}@example.com" for i in range(300)] + ["j.doe@gmail.com", "JDoe+x@gmail.com"]
+
+        results = list(self.zero_bounce_client.validate_many(iter(emails), concurrency=2, deduplicator=deduplicator))
+        sent = [
+            e["email_address"]
+            for call in self.requests_mock.post.call_args_list for e in call.kwargs["json"]["email_batch"]
+        ]
+        self.assertEqual(len(sent), 121)
+        self.assertEqual(len(set(sent)), 121)
+        self.assertEqual(len(results), 302)
+        self.assertEqual([r.address for r in results[:300]], emails[:300])
+        self.assertIs(results[250], results[10])
+        self.assertIs(results[301], results[300])
+        self.assertEqual(deduplicator.duplicates, 181)
+
+    def test_validate_many_reused_deduplicator_answers_earlier_addresses(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        deduplicator = ZBDeduplicator()
+
+        first = list(self.zero_bounce_client.validate_many(["a@example.com", "b@example.com"], deduplicator=deduplicator))
+        second = list(self.zero_bounce_client.validate_many(["b@example.com", "c@example.com", "a@example.com"], deduplicator=deduplicator))
+        self.assertEqual(self.requests_mock.post.call_count, 2)
+        self.assertEqual(
+            [e["email_address"] for e in self.requests_mock.post.call_args.kwargs["json"]["email_batch"]],
+            ["c@example.com"],
+        )
+        self.assertNotIsInstance(second[0], ZBValidateBatchError)
+        self.assertIs(second[0], first[1])
+        self.assertIs(second[2], first[0])
+        self.assertEqual(second[1].address, "c@example.com")
+
+    def test_validate_many_expired_duplicate(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        deduplicator = ZBDeduplicator(max_results=1)
+        emails = ["a@example.com", "b@example.com", "b@example.com", "a@example.com"]
+
+        results = list(self.zero_bounce_client.validate_many(emails, deduplicator=deduplicator))
+        self.assertEqual([r.address for r in results[:3]], ["a@example.com", "b@example.com", "b@example.com"])
+        self.assertIsInstance(results[3], ZBValidateBatchError)
+        self.assertEqual(results[3].email_address, "a@example.com")
+
+    def test_validate_many_sends_bloom_false_positives(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        # an 8-bit filter: a few addresses set every bit, so anything else is a false positive
+        deduplicator = ZBDeduplicator(mode=ZBDeduplicator.BLOOM, expected_items=1, false_positive_rate=0.5)
+        for i in range(50):
+            deduplicator.add(f"seen{i}@example.com")
+        self.assertFalse(deduplicator.add("never-seen@example.com"))
+        unique, duplicates = deduplicator.unique, deduplicator.duplicates
+
+        emails = ["new@example.com", "new@example.com", "other@example.com"]
+        results = list(self.zero_bounce_client.validate_many(emails, deduplicator=deduplicator))
+        sent = [e["email_address"] for e in self.requests_mock.post.call_args.kwargs["json"]["email_batch"]]
+        self.assertEqual(sent, ["new@example.com", "other@example.com"])
+        self.assertEqual([r.address for r in results], emails)
+        self.assertIs(results[1], results[0])
+        self.assertEqual((deduplicator.unique - unique, deduplicator.duplicates - duplicates), (2, 1))
+
+    def test_deduplicator_filter_file(self):
+        directory = self._download_dir()
+        source = directory / "emails.csv"
+        source.write_bytes(
+            b'email,name\r\na@example.com,"Doe, John"\r\n\r\nA@Example.com,x\r\n'
+            b'b@example.com,"multi\r\nline"\r\n a@example.com ,y\r\n'
+        )
+
+        removed = ZBDeduplicator().filter_file(str(source), str(directory / "unique.csv"), 1, has_header_row=True)
+        self.assertEqual(removed, 1)
+        self.assertEqual(
+            (directory / "unique.csv").read_bytes(),
+            b'email,name\r\na@example.com,"Doe, John"\r\nA@Example.com,x\r\nb@example.com,"multi\r\nline"\r\n',
+        )
+
+    def test_result_store_stale_and_put(self):
+        path = str(self._download_dir() / "results.sqlite")
+        store = ZBResultStore(path)
+        now = datetime(2024, 6, 1, 12, 0, 0)
+        stored = store.put([
+            ZBValidateResponse({"address": "Old@example.com", "status": "valid", "processed_at": "2024-04-01 00:00:00.000"}),
+            ZBCompactValidateResponse({"address": "fresh@example.com", "status": "valid", "processed_at": "2024-05-25 00:00:00.000"}),
+            {"address": "unknown@example.com", "status": "unknown", "processed_at": "2024-05-30 00:00:00.000"},
+            ZBValidateBatchError({"email_address": "error@example.com", "error": "Invalid email"}),
+        ])
+        self.assertEqual(stored, 3)
+        self.assertEqual(len(store), 3)
+
+        emails = ["new@example.com", "old@example.com", "fresh@example.com", "unknown@example.com", "NEW@example.com"]
+        self.assertEqual(
+            store.stale(emails, now=now.replace(tzinfo=timezone.utc)),
+            ["new@example.com", "old@example.com", "unknown@example.com"],
+        )
+
+        result = store.get(" OLD@example.com")
+        self.assertEqual(result.status, ZBValidateStatus.valid)
+        self.assertEqual(result.processed_at, datetime(2024, 4, 1))
+
+        # an older result does not replace a newer one
+        store.put([{"address": "fresh@example.com", "status": "invalid", "processed_at": "2024-01-01 00:00:00.000"}])
+        self.assertEqual(store.get("fresh@example.com").status, ZBValidateStatus.valid)
+
+        custom = ZBResultStore(path, max_ages={ZBValidateStatus.unknown: timedelta(days=5)})
+        self.assertNotIn("unknown@example.com", custom.stale(emails, now=now.replace(tzinfo=timezone.utc)))
+        store.close()
+        custom.close()
+
+    def test_result_store_refresh_sends_only_stale_addresses(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        store = ZBResultStore(str(self._download_dir() / "results.sqlite"))
+        store.put([{"address": f"user{i}@example.com", "status": "valid"} for i in range(150)])
+        emails = [f"user{i}@example.com" for i in range(200)] + ["bad@example.com"]
+
+        stored = store.refresh(self.zero_bounce_client, emails, concurrency=2)
+        sent = [
+            e["email_address"]
+            for call in self.requests_mock.post.call_args_list for e in call.kwargs["json"]["email_batch"]
+        ]
+        self.assertEqual(sent, emails[150:])
+        self.assertEqual(stored, 50)
+        self.assertEqual(store.stale(emails), ["bad@example.com"])
+        store.close()
+
+    def test_validate_with_pre_filter_skips_request(self):
+        client = ZeroBounce("dummy_key", pre_filter=ZBPreFilter())
+
+        response = client.validate("not-an-email")
+        self.assertEqual(response.status, ZBValidateStatus.invalid)
+        self.assertEqual(response.sub_status, ZBValidateSubStatus.failed_syntax_check)
+        self.assertTrue(response.decided_locally)
+        self.requests_mock.get.assert_not_called()
+
+    def test_validate_batch_with_pre_filter_sends_plausible_addresses(self):
+        client = ZeroBounce("dummy_key", pre_filter=ZBPreFilter(disposable_domains=["mailinator.com"]))
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+
+        results = list(client.validate_many(["a@example.com", "broken@", "b@mailinator.com", "c@example.com"]))
+        sent = [e["email_address"] for e in self.requests_mock.post.call_args.kwargs["json"]["email_batch"]]
+        self.assertEqual(sent, ["a@example.com", "c@example.com"])
+        self.assertEqual([r.address for r in results], ["a@example.com", "broken@", "b@mailinator.com", "c@example.com"])
+        self.assertEqual([r.decided_locally for r in results], [False, True, True, False])
+        self.assertEqual(results[2].sub_status, ZBValidateSubStatus.disposable)
+
+        self.requests_mock.post.reset_mock()
+        response = client.validate_batch([ZBValidateBatchElement("broken@")], compact=True)
+        self.requests_mock.post.assert_not_called()
+        self.assertTrue(response.email_batch[0].decided_locally)
+
+    def test_validate_cache_hit_skips_request(self):
+        self.requests_mock.get.return_value = MockResponse({
+            "address": "invalid@example.com",
+            "status": "invalid",
+            "sub_status": "mailbox_not_found",
+            "processed_at": "2023-03-28 12:30:18.990",
+        })
+        cache = ZBValidateCache()
+        client = ZeroBounce("dummy_key", validate_cache=cache)
+
+        first = client.validate("invalid@example.com", "99.110.204.1")
+        second = client.validate(" Invalid@Example.com ", "99.110.204.1")
+        self.assertEqual(self.requests_mock.get.call_count, 1)
+        self.assertEqual(second.status, ZBValidateStatus.invalid)
+        self.assertEqual(second.processed_at, first.processed_at)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        client.validate("invalid@example.com")
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+
+    def test_validate_cache_uses_status_ttl(self):
+        self.requests_mock.get.return_value = MockResponse({
+            "address": "unknown@example.com",
+            "status": "unknown",
+            "sub_status": "mail_server_temporary_error",
+        })
+        cache = ZBValidateCache(ttls={ZBValidateStatus.unknown: timedelta(0)})
+        client = ZeroBounce("dummy_key", validate_cache=cache)
+
+        client.validate("unknown@example.com")
+        client.validate("unknown@example.com")
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+        self.assertEqual(cache.ttl_for("invalid"), timedelta(days=30))
+        self.assertEqual(cache.ttl_for("not-a-status"), timedelta(hours=1))
+
+    def _validate_concurrently(self, client, count):
+        started = threading.Barrier(count + 1)
+        release = threading.Event()
+        results = [None] * count
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return self.requests_mock.get.return_value
+
+        def worker(i):
+            started.wait()
+            try:
+                results[i] = client.validate("Same@example.com")
+            except ZBApiException as e:
+                results[i] = e
+
+        self.requests_mock.get.side_effect = slow_get
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        started.wait()
+        while len(client._validate_flight) == 0:
+            time.sleep(0.001)
+        time.sleep(0.1)  # let the other threads join the in-flight call
+        release.set()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_validate_coalesces_concurrent_calls(self):
+        self.requests_mock.get.return_value = MockResponse({
+            "address": "same@example.com",
+            "status": "valid",
+            "sub_status": "",
+        })
+
+        results = self._validate_concurrently(self.zero_bounce_client, 8)
+        self.assertEqual(self.requests_mock.get.call_count, 1)
+        self.assertTrue(all(r.status == ZBValidateStatus.valid for r in results))
+        self.assertEqual(len({id(r) for r in results}), 8)
+        self.assertEqual(len(self.zero_bounce_client._validate_flight), 0)
+
+    def test_validate_coalesced_error_reaches_every_caller(self):
+        self.requests_mock.get.return_value = MockResponse({"error": "Invalid API key"})
+
+        results = self._validate_concurrently(self.zero_bounce_client, 4)
+        self.assertEqual(self.requests_mock.get.call_count, 1)
+        self.assertTrue(all(isinstance(r, ZBApiException) for r in results))
+
+    def test_validate_without_coalescing(self):
+        self.requests_mock.get.return_value = MockResponse({"address": "same@example.com", "status": "valid"})
+        client = ZeroBounce("dummy_key", coalesce_validate=False)
+
+        results = [client.validate("same@example.com") for _ in range(2)]
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+        self.assertIsNone(client._validate_flight)
+        self.assertEqual(len(results), 2)
+
+    def test_memory_cache_backend_evicts_least_recently_used(self):
+        backend = ZBMemoryCacheBackend(max_size=2)
+        backend.set("a", {"status": "valid"}, 60)
+        backend.set("b", {"status": "valid"}, 60)
+        backend.get("a")
+        backend.set("c", {"status": "valid"}, 60)
+        self.assertIsNotNone(backend.get("a"))
+        self.assertIsNone(backend.get("b"))
+        backend.set("d", {"status": "valid"}, 0)
+        self.assertIsNone(backend.get("d"))
+
+    def test_incomplete_cache_backend_fails_on_construction(self):
+        class GetOnlyBackend(ZBCacheBackend):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnlyBackend()
+
+    def test_sqlite_cache_backend_shared_between_instances(self):
+        path = Path(tempfile.mkdtemp()) / "zb_cache.sqlite"
+        first = ZBSqliteCacheBackend(str(path))
+        second = ZBSqliteCacheBackend(str(path))
+        self.addCleanup(shutil.rmtree, path.parent)
+        self.addCleanup(second.close)
+        self.addCleanup(first.close)
+
+        first.set("a@example.com|", {"status": "invalid"}, 60)
+        self.assertEqual(second.get("a@example.com|"), {"status": "invalid"})
+        self.assertIsNone(second.get("b@example.com|"))
+
+    def test_sqlite_cache_backend_deletes_expired_rows(self):
+        path = Path(tempfile.mkdtemp()) / "zb_cache.sqlite"
+        self.addCleanup(shutil.rmtree, path.parent)
+        backend = ZBSqliteCacheBackend(str(path), purge_every=3)
+        self.addCleanup(backend.close)
+
+        def rows():
+            return backend._connection.execute("SELECT key FROM zb_validate_cache ORDER BY key").fetchall()
+
+        backend.set("a@example.com|", {"status": "unknown"}, 0)
+        backend.set("b@example.com|", {"status": "invalid"}, 60)
+        self.assertEqual(len(rows()), 2)
+        backend.set("c@example.com|", {"status": "unknown"}, -1)  # the third write purges
+        self.assertEqual(rows(), [("b@example.com|",)])
+
+        backend.set("d@example.com|", {"status": "unknown"}, 0)
+        self.assertEqual(backend.purge(), 1)
+        self.assertEqual(backend.purge(), 0)
+        self.assertEqual(backend.get("b@example.com|"), {"status": "invalid"})
+
     def test_response_sub_status_accept_all(self):
         self.requests_mock.get.return_value = MockResponse({
             "address": "none@example.com",
@@ -221,6 +748,585 @@ class ZeroBounceTestCase(BaseTestCase):
         self.assertEqual(response.email_batch, [])
         self.assertEqual(response.errors, [])
 
+    def test_validate_batch_compact(self):
+        email = {
+            "address": "valid@example.com",
+            "status": "valid",
+            "sub_status": "",
+            "free_email": True,
+            "mx_found": "true",
+            "processed_at": "2023-03-28 12:30:18.990",
+        }
+        self.requests_mock.post.return_value = MockResponse({"email_batch": [email], "errors": []})
+
+        regular = self.zero_bounce_client.validate_batch([ZBValidateBatchElement("valid@example.com")])
+        compact = self.zero_bounce_client.validate_batch(
+            [ZBValidateBatchElement("valid@example.com")], compact=True
+        )
+        result = compact.email_batch[0]
+        self.assertIsInstance(result, ZBCompactValidateBatchEmail)
+        self.assertFalse(hasattr(result, "__dict__"))
+        for name in ("address", "status", "sub_status", "free_email", "mx_found", "processed_at", "domain"):
+            self.assertEqual(getattr(result, name), getattr(regular.email_batch[0], name))
+        self.assertEqual(result.status, ZBValidateStatus.valid)
+        self.assertEqual(result.processed_at, datetime(2023, 3, 28, 12, 30, 18, 990000))
+        self.assertIsNone(result.did_you_mean)
+
+    def test_validate_batch_lazy_builds_elements_on_access(self):
+        self.requests_mock.post.return_value = MockResponse({
+            "email_batch": [
+                {"address": "valid@example.com", "status": "valid", "sub_status": ""},
+                {"address": "invalid@example.com", "status": "invalid", "sub_status": "mailbox_not_found"},
+            ],
+            "errors": [],
+        })
+
+        response = self.zero_bounce_client.validate_batch(
+            [ZBValidateBatchElement("valid@example.com"), ZBValidateBatchElement("invalid@example.com")],
+            lazy=True,
+        )
+        self.assertEqual(len(response.email_batch), 2)
+        self.assertEqual(response.email_batch._items, [None, None])
+        second = response.email_batch[1]
+        self.assertIsInstance(second, ZBLazyValidateBatchEmail)
+        self.assertIsNone(response.email_batch._items[0])
+        self.assertIs(response.email_batch[-1], second)
+        self.assertEqual(second.sub_status, ZBValidateSubStatus.mailbox_not_found)
+        self.assertEqual([r.status for r in response.email_batch], [ZBValidateStatus.valid, ZBValidateStatus.invalid])
+
+        compact = self.zero_bounce_client.validate_batch(
+            [ZBValidateBatchElement("valid@example.com")], compact=True, lazy=True
+        )
+        self.assertIsInstance(compact.email_batch[0], ZBCompactValidateBatchEmail)
+
+    def test_validate_many_lazy(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        results = list(self.zero_bounce_client.validate_many(["a@example.com", "bad@example.com"], lazy=True))
+        self.assertIsInstance(results[0], ZBLazyValidateBatchEmail)
+        self.assertEqual(results[0].status, ZBValidateStatus.valid)
+        self.assertIsInstance(results[1], ZBValidateBatchError)
+
+    def test_batch_columns_append_filter_and_count(self):
+        columns = ZBValidateBatchColumns()
+        columns.append({"email_batch": [
+            {"address": "a@example.com", "status": "valid", "sub_status": "", "free_email": True, "mx_found": "true"},
+            {"address": "b@example.com", "status": "invalid", "sub_status": "mailbox_not_found", "free_email": False},
+        ]})
+        columns.append(ZBValidateBatchResponse(
+            {"email_batch": [{"address": "c@example.com", "status": "valid", "free_email": False}]}, lazy=True
+        ))
+        columns.extend([
+            ZBValidateBatchError({"email_address": "d@example.com", "error": "Invalid email"}),
+            ZBLazyValidateBatchEmail({"address": "e@example.com"}),
+        ])
+
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(list(columns.status), [1, 2, 1, ZBValidateBatchColumns.NULL])
+        # result objects default free_email and mx_found to False, raw rows leave them missing
+        self.assertEqual(list(columns.mx_found), [1, -1, -1, 0])
+        self.assertEqual(columns.indices(status=ZBValidateStatus.valid, free_email=False), [2])
+        self.assertEqual(
+            columns.filter(status=[ZBValidateStatus.valid, ZBValidateStatus.invalid]).addresses,
+            ["a@example.com", "b@example.com", "c@example.com"],
+        )
+        self.assertEqual(columns.status_counts(), {ZBValidateStatus.valid: 2, ZBValidateStatus.invalid: 1})
+        groups = columns.group_by_status()
+        self.assertEqual(groups[ZBValidateStatus.invalid].addresses, ["b@example.com"])
+        self.assertEqual(groups[ZBValidateStatus.invalid].row(0)["sub_status"], ZBValidateSubStatus.mailbox_not_found)
+        self.assertIsNone(columns.row(3)["status"])
+        with self.assertRaises(ZBClientException):
+            columns.mask(status="not-a-status")
+
+    def test_batch_columns_exports(self):
+        columns = ZBValidateBatchColumns()
+        columns.append(ZBValidateBatchResponse({"email_batch": [
+            {"address": "a@example.com", "status": "valid", "free_email": True, "mx_found": True},
+            {"address": "\u00fc@example.com", "status": "invalid"},
+        ]}))
+
+        stream = io.StringIO()
+        columns.to_csv(stream)
+        self.assertEqual(stream.getvalue().splitlines(), [
+            "address,status,sub_status,free_email,mx_found",
+            "a@example.com,valid,,true,true",
+            "\u00fc@example.com,invalid,,false,false",
+        ])
+        buffers = columns.to_buffers()
+        self.assertEqual(list(buffers["address_offsets"]), [0, 13, 27])
+        self.assertEqual(bytes(buffers["address_data"]).decode("utf-8"), "a@example.com\u00fc@example.com")
+        self.assertEqual(bytes(buffers["status"]), bytes([1, 2]))
+
+    def test_compact_validate_response_defaults(self):
+        response = ZBCompactValidateResponse({"address": "a@example.com", "extra": 1})
+        self.assertEqual(response.to_dict()["address"], "a@example.com")
+        self.assertIs(response.free_email, False)
+        self.assertIsNone(response.status)
+        self.assertNotIn("extra", response.to_dict())
+
+    def test_parse_datetime_matches_strptime(self):
+        fmt = "%Y-%m-%d %H:%M:%S.%f"
+        for value in ("2023-03-28 12:30:18.990", "2023-03-28 12:30:18.123456"):
+            self.assertEqual(parse_datetime(value, fmt), datetime.strptime(value, fmt))
+        with self.assertRaises(ValueError):
+            parse_datetime("2023-03-28", fmt)
+        with self.assertRaises(ValueError):
+            parse_datetime("2023-03-28 12:30:18.990+00:00", fmt)
+
+    def test_safe_enum_convert_fast_path(self):
+        self.assertIs(safe_enum_convert(ZBValidateSubStatus, "mailbox_not_found"),
+                      ZBValidateSubStatus.mailbox_not_found)
+        self.assertIs(safe_enum_convert(ZBValidateStatus, ZBValidateStatus.valid), ZBValidateStatus.valid)
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(safe_enum_convert(ZBValidateStatus, "unheard_of"))
+        self.assertIsNone(safe_enum_convert(ZBValidateStatus, None))
+
+    def test_validate_many_compact(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        results = list(self.zero_bounce_client.validate_many(["a@example.com", "bad@example.com"], compact=True))
+        self.assertIsInstance(results[0], ZBCompactValidateBatchEmail)
+        self.assertEqual(results[0].address, "a@example.com")
+        self.assertIsInstance(results[1], ZBValidateBatchError)
+
+    @staticmethod
+    def _validate_batch_echo(url, json=None, **kwargs):
+        emails = [element["email_address"] for element in json["email_batch"]]
+        return MockResponse({
+            # answer out of order to make sure results are matched by address
+            "email_batch": [
+                {"address": email, "status": "valid", "sub_status": ""}
+                for email in reversed(emails) if not email.startswith("bad")
+            ],
+            "errors": [
+                {"email_address": email, "error": "Invalid email"}
+                for email in emails if email.startswith("bad")
+            ],
+        })
+
+    def test_validate_many_chunks_and_keeps_order(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        emails = [f"user{i}@example.com" for i in range(250)]
+        emails[120] = "bad120@example.com"
+
+        results = list(self.zero_bounce_client.validate_many(iter(emails), concurrency=2))
+        self.assertEqual(self.requests_mock.post.call_count, 3)
+        batch_sizes = [
+            len(call.kwargs["json"]["email_batch"]) for call in self.requests_mock.post.call_args_list
+        ]
+        self.assertEqual(sorted(batch_sizes), [50, 100, 100])
+        self.assertEqual(len(results), 250)
+        self.assertEqual(results[0].address, "user0@example.com")
+        self.assertEqual(results[249].address, "user249@example.com")
+        self.assertIsInstance(results[120], ZBValidateBatchError)
+        self.assertEqual(results[120].email_address, "bad120@example.com")
+        self.assertEqual(results[120].error, "Invalid email")
+
+    def test_validate_many_applies_blanket_error(self):
+        self.requests_mock.post.return_value = MockResponse({
+            "email_batch": [],
+            "errors": [{
+                "email_address": "all",
+                "error": "Invalid API Key or your account ran out of credits",
+            }],
+        })
+
+        results = list(self.zero_bounce_client.validate_many(
+            ["a@example.com", ZBValidateBatchElement("b@example.com", "1.1.1.1")]
+        ))
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(isinstance(r, ZBValidateBatchError) for r in results))
+        self.assertEqual(
+            self.requests_mock.post.call_args.kwargs["json"]["email_batch"][1],
+            {"email_address": "b@example.com", "ip_address": "1.1.1.1"},
+        )
+
+    def test_validate_many_invalid_concurrency(self):
+        with self.assertRaises(ZBClientException):
+            list(self.zero_bounce_client.validate_many(["a@example.com"], concurrency=0))
+
+    def test_dispatcher_groups_submissions_into_batches(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+
+        with ZBValidateDispatcher(self.zero_bounce_client, max_wait=timedelta(seconds=5)) as dispatcher:
+            futures = [dispatcher.submit(f"user{i}@example.com") for i in range(149)]
+            futures.append(dispatcher.submit("bad@example.com", "1.1.1.1"))
+
+        batch_sizes = [
+            len(call.kwargs["json"]["email_batch"]) for call in self.requests_mock.post.call_args_list
+        ]
+        self.assertEqual(batch_sizes, [100, 50])
+        self.assertEqual(futures[42].result().address, "user42@example.com")
+        self.assertIsInstance(futures[-1].result(), ZBValidateBatchError)
+
+    def test_dispatcher_sends_after_max_wait(self):
+        self.requests_mock.post.side_effect = self._validate_batch_echo
+        dispatcher = ZBValidateDispatcher(self.zero_bounce_client, max_wait=timedelta(milliseconds=10))
+        self.addCleanup(dispatcher.close)
+
+        result = dispatcher.submit("valid@example.com").result(timeout=5)
+        self.assertEqual(result.status, ZBValidateStatus.valid)
+
+    def test_dispatcher_fans_out_batch_exception(self):
+        self.requests_mock.post.side_effect = ConnectionError("connection reset")
+
+        with ZBValidateDispatcher(self.zero_bounce_client) as dispatcher:
+            futures = [dispatcher.submit("a@example.com"), dispatcher.submit("b@example.com")]
+        self.assertEqual(self.requests_mock.post.call_count, 1)
+        for future in futures:
+            self.assertIsInstance(future.exception(), ConnectionError)
+        with self.assertRaises(ZBClientException):
+            dispatcher.submit("c@example.com")
+
+    def test_file_status_many(self):
+        def get(url, params=None, **kwargs):
+            if params["file_id"] == "broken":
+                raise ConnectionError("connection reset")
+            return MockResponse({"success": True, "file_id": params["file_id"], "file_status": "Complete"})
+
+        self.requests_mock.get.side_effect = get
+
+        statuses = self.zero_bounce_client.file_status_many(["f1", "f2", "broken", "f1"])
+        self.assertEqual(list(statuses), ["f1", "f2", "broken"])
+        self.assertEqual(self.requests_mock.get.call_count, 3)
+        self.assertEqual(statuses["f2"].file_status, "Complete")
+        self.assertFalse(statuses["broken"].success)
+        self.assertEqual(statuses["broken"].message, "connection reset")
+
+    def test_file_status_many_rate_limit(self):
+        self.requests_mock.get.return_value = MockResponse({"success": True, "file_status": "Processing"})
+
+        started = time.monotonic()
+        self.zero_bounce_client.scoring_file_status_many(["f1", "f2", "f3"], max_requests_per_second=50)
+        self.assertGreaterEqual(time.monotonic() - started, 0.04)
+        self.assertTrue(all("/scoring/" in call.args[0] for call in self.requests_mock.get.call_args_list))
+        with self.assertRaises(ZBClientException):
+            self.zero_bounce_client.file_status_many(["f1"], max_requests_per_second=0)
+
+    def test_rate_limiter_families(self):
+        self.assertEqual(ZBRateLimiter.family_for("https://api.zerobounce.net/v2/validate"), "validate")
+        self.assertEqual(ZBRateLimiter.family_for("https://bulkapi.zerobounce.net/v2/validatebatch"), "validatebatch")
+        self.assertEqual(ZBRateLimiter.family_for("https://bulkapi.zerobounce.net/v2/scoring/getfile"), "bulk")
+        self.assertEqual(ZBRateLimiter.family_for("https://api.zerobounce.net/v2/guessformat"), "guessformat")
+        self.assertEqual(ZBRateLimiter.family_for("https://api.zerobounce.net/v2/getcredits"), "default")
+        with self.assertRaises(ZBClientException):
+            ZBRateLimiter(validate=0)
+
+    def test_rate_limiter_paces_requests(self):
+        self.requests_mock.get.return_value = MockResponse({"Credits": "100"})
+        limiter = ZBRateLimiter(default=100, burst=timedelta(0))
+        client = ZeroBounce("dummy_key", rate_limiter=limiter, coalesce_validate=False)
+
+        started = time.monotonic()
+        for _ in range(6):
+            client.get_credits()
+        # the first request goes out at once, the next five wait 10 ms each
+        self.assertGreaterEqual(time.monotonic() - started, 0.045)
+        self.assertEqual(limiter.queue_depth(), 0)
+
+    def test_rate_limiter_queue_depth(self):
+        limiter = ZBRateLimiter(validate=10, burst=timedelta(0))
+        limiter.acquire("validate")
+        threads = [threading.Thread(target=limiter.acquire, args=("validate",)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.02)
+        self.assertEqual(limiter.queue_depth("validate"), 3)
+        self.assertEqual(limiter.queue_depth("bulk"), 0)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(limiter.queue_depth(), 0)
+        limiter.acquire("bulk")  # families without a rate are not limited
+
+    def _retrying_client(self, **policy_options):
+        policy = ZBRetryPolicy(backoff=timedelta(milliseconds=1), **policy_options)
+        return ZeroBounce("dummy_key", retry_policy=policy), policy
+
+    def test_retry_transient_status_and_errors(self):
+        client, policy = self._retrying_client()
+        self.requests_mock.get.side_effect = [
+            requests.exceptions.ConnectionError("connection reset"),
+            MockResponse({}, status_code=503, headers={"Retry-After": "0"}),
+            MockResponse({"Credits": "100"}),
+        ]
+
+        self.assertEqual(client.get_credits().credits, "100")
+        self.assertEqual(self.requests_mock.get.call_count, 3)
+        self.assertEqual(policy.retries, {"default": 2})
+        self.assertEqual(policy.retry_count, 2)
+
+    def test_retry_gives_up_after_max_attempts(self):
+        client, policy = self._retrying_client(max_attempts=2)
+        self.requests_mock.get.side_effect = requests.exceptions.Timeout("read timeout")
+
+        with self.assertRaises(requests.exceptions.Timeout):
+            client.validate("valid@example.com")
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+        self.assertEqual(policy.exhausted, {"validate": 1})
+
+    def test_retry_long_retry_after_returns_response(self):
+        client, policy = self._retrying_client(max_retry_after=timedelta(seconds=5))
+        self.requests_mock.get.return_value = MockResponse(
+            {"error": "Too many requests"}, status_code=429, headers={"Retry-After": "120"}
+        )
+
+        with self.assertRaises(ZBApiException):
+            client.get_credits()
+        self.assertEqual(self.requests_mock.get.call_count, 1)
+        self.assertAlmostEqual(policy.retry_after_s("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+
+    def test_retry_sendfile_only_with_opt_in(self):
+        bodies = []
+
+        def post(url, data=None, **kwargs):
+            bodies.append(data.read())
+            if len(bodies) == 1:
+                raise requests.exceptions.ConnectionError("connection reset")
+            return MockResponse({"success": True, "file_id": "f1"})
+
+        self.requests_mock.post.side_effect = post
+        client, _ = self._retrying_client()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            client.send_file_stream(io.BytesIO(b"a@example.com\n"), "emails.csv", 1)
+
+        bodies.clear()
+        client, policy = self._retrying_client(retry_sendfile=True)
+        self.assertEqual(client.send_file_stream(io.BytesIO(b"a@example.com\n"), "emails.csv", 1).file_id, "f1")
+        self.assertEqual(len(bodies), 2)
+        self.assertEqual(bodies[0].split(b"\r\n", 1)[1], bodies[1].split(b"\r\n", 1)[1])
+        self.assertEqual(policy.retries, {"bulk": 1})
+
+    def test_failover_to_healthy_region(self):
+        failover = ZBRegionFailover(failure_threshold=1, reset_timeout=timedelta(milliseconds=30))
+        client = ZeroBounce("dummy_key", failover=failover)
+        usa, eu = failover.regions
+
+        def get(url, **kwargs):
+            if url.startswith(usa):
+                raise requests.exceptions.ConnectionError("connection refused")
+            return MockResponse({"Credits": "5"})
+
+        self.requests_mock.get.side_effect = get
+        self.assertEqual(client.get_credits().credits, "5")
+        self.assertEqual(failover.failovers, 1)
+        self.assertEqual(failover.state(usa), ZBRegionFailover.OPEN)
+
+        self.requests_mock.get.reset_mock()
+        client.get_credits()
+        self.assertEqual([call.args[0] for call in self.requests_mock.get.call_args_list], [eu + "/getcredits"])
+
+        time.sleep(0.04)
+        self.assertEqual(failover.state(usa), ZBRegionFailover.HALF_OPEN)
+        self.assertEqual(failover.candidates(), [usa, eu])
+
+    def test_failover_raises_when_every_region_fails(self):
+        failover = ZBRegionFailover([ZBApiUrl.API_USA_URL, ZBApiUrl.API_EU_URL])
+        client = ZeroBounce("dummy_key", failover=failover)
+        self.requests_mock.get.return_value = MockResponse({"error": "Service unavailable"}, status_code=503)
+
+        with self.assertRaises(ZBApiException):
+            client.get_credits()
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+        self.assertEqual(failover.state(failover.regions[0]), ZBRegionFailover.CLOSED)
+
+    def test_hedged_validate(self):
+        failover = ZBRegionFailover(hedge_validate=True, hedge_after=timedelta(milliseconds=10))
+        client = ZeroBounce("dummy_key", failover=failover)
+        self.addCleanup(client.close)
+        usa, eu = failover.regions
+
+        def get(url, params=None, **kwargs):
+            if url.startswith(usa):
+                time.sleep(0.2)
+            return MockResponse({"address": params["email"], "status": "valid" if url.startswith(eu) else "unknown"})
+
+        self.requests_mock.get.side_effect = get
+        self.assertEqual(client.validate("valid@example.com").status, ZBValidateStatus.valid)
+        self.assertEqual(failover.hedges, 1)
+
+    def test_hedged_validate_fast_failure_fails_over(self):
+        limiter = ZBRateLimiter(validate=1000)
+        failover = ZBRegionFailover(failure_threshold=1, hedge_validate=True, hedge_after=timedelta(seconds=5))
+        client = ZeroBounce("dummy_key", failover=failover, rate_limiter=limiter)
+        self.addCleanup(client.close)
+        usa, eu = failover.regions
+
+        def get(url, params=None, **kwargs):
+            if url.startswith(usa):
+                return MockResponse({"error": "Service unavailable"}, status_code=503)
+            return MockResponse({"address": params["email"], "status": "valid"})
+
+        self.requests_mock.get.side_effect = get
+        with mock.patch.object(limiter, "acquire", wraps=limiter.acquire) as acquire:
+            started = time.monotonic()
+            self.assertEqual(client.validate("valid@example.com").status, ZBValidateStatus.valid)
+        self.assertLess(time.monotonic() - started, 1)  # no wait for the hedging delay
+        self.assertEqual((failover.failovers, failover.hedges), (1, 0))
+        self.assertEqual(failover.state(usa), ZBRegionFailover.OPEN)
+        # the failover request waited for the limiter too
+        self.assertEqual(acquire.call_args_list, [mock.call("validate"), mock.call("validate")])
+
+    def test_failover_sends_one_probe_to_half_open_region(self):
+        failover = ZBRegionFailover(failure_threshold=1, reset_timeout=timedelta(milliseconds=20))
+        client = ZeroBounce("dummy_key", failover=failover)
+        usa, eu = failover.regions
+        probe_sent, release_probe = threading.Event(), threading.Event()
+
+        def get(url, **kwargs):
+            if url.startswith(usa):
+                probe_sent.set()
+                release_probe.wait(5)
+            return MockResponse({"Credits": "5"})
+
+        self.requests_mock.get.side_effect = get
+        failover.record_failure(usa)
+        time.sleep(0.03)
+        self.assertEqual(failover.state(usa), ZBRegionFailover.HALF_OPEN)
+
+        probe = threading.Thread(target=client.get_credits)
+        probe.start()
+        self.assertTrue(probe_sent.wait(5))
+        self.assertEqual(failover.candidates(), [eu, usa])
+        self.assertFalse(failover.begin_call(usa))
+        client.get_credits()  # does not pile onto the probed region
+        release_probe.set()
+        probe.join()
+
+        urls = [call.args[0] for call in self.requests_mock.get.call_args_list]
+        self.assertEqual(urls, [usa + "/getcredits", eu + "/getcredits"])
+        self.assertEqual(failover.state(usa), ZBRegionFailover.CLOSED)
+
+    def _bulk_server(self, statuses, deleted=None):
+        """Answers filestatus with the next entry of `statuses` per file, raising the exceptions, and getfile with a CSV."""
+        statuses = {file_id: list(entries) for file_id, entries in statuses.items()}
+
+        def get(url, params=None, **kwargs):
+            file_id = params["file_id"]
+            if url.endswith("/filestatus"):
+                entries = statuses[file_id]
+                entry = entries.pop(0) if len(entries) > 1 else entries[0]
+                if isinstance(entry, Exception):
+                    raise entry
+                file_status, percentage, phase_2 = entry
+                return MockResponse({
+                    "success": True,
+                    "file_id": file_id,
+                    "file_status": file_status,
+                    "complete_percentage": percentage,
+                    "file_phase_2_status": phase_2,
+                })
+            if url.endswith("/getfile"):
+                return MockResponse(
+                    content=f"email,file\na@example.com,{file_id}\n", headers={"Content-Type": "text/csv"}
+                )
+            deleted.append(file_id)
+            return MockResponse({"success": True, "message": "File Deleted", "file_id": file_id})
+
+        return get
+
+    def test_bulk_job_runner_downloads_completed_jobs(self):
+        deleted = []
+        self.requests_mock.get.side_effect = self._bulk_server({
+            "f1": [("Processing", "10%", "N/A"), ("Processing", "60%", "N/A"), ("Complete", "100%", "N/A")],
+            "f2": [("Complete", "100%", "Processing"), ("Complete", "100%", "Complete")],
+        }, deleted)
+        self.requests_mock.post.return_value = MockResponse({"success": True, "file_id": "f1"})
+        directory = self._download_dir()
+        statuses = []
+
+        with ZBBulkJobRunner(
+            self.zero_bounce_client,
+            min_poll_interval=timedelta(milliseconds=1),
+            max_poll_interval=timedelta(milliseconds=20),
+            delete_files=True,
+            on_status=lambda job: statuses.append((job.file_id, job.status.complete_percentage)),
+        ) as runner:
+            first = runner.submit_file(io.BytesIO(b"a@example.com\n"), 1, str(directory / "f1.csv"))
+            second = runner.track(
+                "f2", str(directory / "f2.csv"), scoring=True,
+                options=ZBGetFileOptions(download_type=ZBDownloadType.PHASE_2),
+            )
+
+        self.assertEqual(first.result().local_file_path, str(directory / "f1.csv"))
+        self.assertEqual(first.file_id, "f1")
+        self.assertEqual((directory / "f2.csv").read_text(), "email,file\na@example.com,f2\n")
+        self.assertEqual(second.status.file_phase_2_status, "Complete")
+        self.assertEqual([s for s in statuses if s[0] == "f1"], [("f1", "10%"), ("f1", "60%"), ("f1", "100%")])
+        self.assertEqual(sorted(deleted), ["f1", "f2"])
+        scoring_urls = [
+            call.args[0] for call in self.requests_mock.get.call_args_list if call.kwargs["params"]["file_id"] == "f2"
+        ]
+        self.assertTrue(all("/scoring/" in url for url in scoring_urls))
+
+    def test_bulk_job_runner_failed_job(self):
+        self.requests_mock.get.side_effect = self._bulk_server({"f1": [("Failed", "0%", "N/A")]})
+
+        with ZBBulkJobRunner(self.zero_bounce_client, min_poll_interval=timedelta(milliseconds=1)) as runner:
+            job = runner.track("f1", str(self._download_dir() / "f1.csv"))
+        self.assertIsInstance(job.exception(), ZBApiException)
+        with self.assertRaises(ZBClientException):
+            runner.track("f2", "f2.csv")
+
+    def test_bulk_job_runner_retries_failed_polls(self):
+        deleted = []
+        self.requests_mock.get.side_effect = self._bulk_server({
+            "f1": [("Processing", "10%", "N/A"), requests.exceptions.ReadTimeout("Read timed out"),
+                   ("Complete", "100%", "N/A")],
+        }, deleted)
+        directory = self._download_dir()
+
+        with ZBBulkJobRunner(
+            self.zero_bounce_client,
+            min_poll_interval=timedelta(milliseconds=1),
+            max_poll_interval=timedelta(milliseconds=20),
+            delete_files=True,
+        ) as runner:
+            job = runner.track("f1", str(directory / "f1.csv"))
+        self.assertEqual(job.result().local_file_path, str(directory / "f1.csv"))
+        self.assertEqual(deleted, ["f1"])
+
+        timeout = requests.exceptions.ReadTimeout("Read timed out")
+        self.requests_mock.get.side_effect = self._bulk_server({"f2": [timeout]})
+        with ZBBulkJobRunner(
+            self.zero_bounce_client, min_poll_interval=timedelta(milliseconds=1), max_poll_errors=2
+        ) as runner:
+            job = runner.track("f2", str(directory / "f2.csv"))
+        self.assertIsInstance(job.exception(), ZBApiException)
+        self.assertIn("Read timed out", str(job.exception()))
+        filestatus_calls = [c for c in self.requests_mock.get.call_args_list if c.args[0].endswith("/filestatus")]
+        self.assertEqual(len([c for c in filestatus_calls if c.kwargs["params"]["file_id"] == "f2"]), 3)
+
+    def test_bulk_job_runner_waits_for_missing_phase_2_status(self):
+        self.requests_mock.get.side_effect = self._bulk_server({
+            "f1": [("Complete", "100%", None), ("Complete", "100%", ""), ("Complete", "100%", "Complete")],
+        })
+        statuses = []
+
+        with ZBBulkJobRunner(
+            self.zero_bounce_client,
+            min_poll_interval=timedelta(milliseconds=1),
+            on_status=lambda job: statuses.append(job.status.file_phase_2_status),
+        ) as runner:
+            job = runner.track(
+                "f1", str(self._download_dir() / "f1.csv"),
+                options=ZBGetFileOptions(download_type=ZBDownloadType.PHASE_2),
+            )
+        self.assertIsNotNone(job.result())
+        self.assertEqual(statuses, [None, "", "Complete"])
+
+    def test_bulk_job_runner_adapts_poll_interval(self):
+        runner = ZBBulkJobRunner(
+            self.zero_bounce_client, min_poll_interval=timedelta(seconds=1), max_poll_interval=timedelta(minutes=10)
+        )
+        self.addCleanup(runner.close)
+        job = runner._add_job(False, "unused.csv", None)
+        self.addCleanup(job.cancel)
+        status = ZBResponse({"complete_percentage": "10%"})
+
+        self.assertEqual(runner._next_interval(job, status), 1)
+        self.assertEqual(runner._next_interval(job, status), 2)  # no progress: back off
+        job._progress = (time.monotonic() - 10, 0.0)
+        # 10% in 10 s: 90 s left, next poll half way there
+        self.assertAlmostEqual(runner._next_interval(job, status), 45, delta=1)
+
     def test_response_contains_message_list(self):
         self.requests_mock.get.return_value = MockResponse({
             "success": "False",
@@ -284,7 +1390,7 @@ class ZeroBounceTestCase(BaseTestCase):
 
         self.zero_bounce_client.send_file("emails_allow2.txt", 1, allow_phase_2=True)
         _, kwargs = self.requests_mock.post.call_args
-        self.assertEqual(kwargs["data"]["allow_phase_2"], "true")
+        self.assertEqual(kwargs["data"].fields["allow_phase_2"], "true")
 
     def test_scoring_send_file_no_allow_phase_2(self):
         self.requests_mock.post.return_value = MockResponse({
@@ -299,7 +1405,77 @@ class ZeroBounceTestCase(BaseTestCase):
 
         self.zero_bounce_client.scoring_send_file("emails_score.txt", 1)
         _, kwargs = self.requests_mock.post.call_args
-        self.assertNotIn("allow_phase_2", kwargs["data"])
+        self.assertNotIn("allow_phase_2", kwargs["data"].fields)
+
+    def test_send_file_stream_is_chunked(self):
+        self.requests_mock.post.return_value = MockResponse({
+            "success": True,
+            "message": "File Accepted",
+            "file_name": "emails.csv",
+            "file_id": "5e87c21f-45b2-4803-8daf-307f29fa7340",
+        })
+        content = b"a@example.com\n" * 10000
+        progress = []
+
+        self.zero_bounce_client.send_file_stream(
+            io.BytesIO(content), "emails.csv", 1, progress_callback=lambda sent, total: progress.append((sent, total))
+        )
+        _, kwargs = self.requests_mock.post.call_args
+        body = kwargs["data"]
+        self.assertEqual(kwargs["headers"]["Content-Length"], str(body.len))
+        self.assertTrue(kwargs["headers"]["Content-Type"].startswith("multipart/form-data; boundary="))
+        self.assertEqual(body.fields["email_address_column"], 1)
+
+        first = body.read(1024)
+        self.assertEqual(len(first), 1024)
+        data = first + body.read()
+        self.assertEqual(len(data), body.len)
+        self.assertIn(b'filename="emails.csv"\r\nContent-Type: text/csv\r\n\r\n' + content + b"\r\n--", data)
+        self.assertGreater(len(progress), 2)
+        self.assertEqual(progress[-1], (body.len, body.len))
+
+    def test_send_file_sharded_keeps_header_and_order(self):
+        uploads = []
+
+        def accept(url, data=None, **kwargs):
+            body = data.read()
+            uploads.append(body[body.index(b"text/csv\r\n\r\n") + 12:body.rindex(b"\r\n--")])
+            return MockResponse({"success": True, "message": "File Accepted", "file_id": f"id-{len(uploads)}"})
+
+        self.requests_mock.post.side_effect = accept
+        rows = [b"a%d@example.com,x\n" % i for i in range(8)]
+        rows[3] = b'a3@example.com,"multi\nline"\n'
+        source = io.BytesIO(b"email,note\n" + b"".join(rows))
+
+        response = self.zero_bounce_client.send_file_sharded(
+            source, 1, shards=3, file_name="big.csv", has_header_row=True, concurrency=1
+        )
+        self.assertTrue(response.success)
+        self.assertEqual(response.file_ids, ["id-1", "id-2", "id-3"])
+        self.assertTrue(all(upload.startswith(b"email,note\n") for upload in uploads))
+        self.assertEqual(b"".join(upload[len(b"email,note\n"):] for upload in uploads), b"".join(rows))
+        for _, kwargs in self.requests_mock.post.call_args_list:
+            self.assertEqual(kwargs["data"].fields["has_header_row"], True)
+
+    def test_send_file_sharded_empty_file(self):
+        with self.assertRaises(ZBClientException):
+            self.zero_bounce_client.send_file_sharded(io.BytesIO(b"email\n"), 1, has_header_row=True)
+
+    def test_get_file_sharded_merges_in_order(self):
+        bodies = {
+            "id-1": b"Email Address,ZB Status\na@example.com,valid\n",
+            "id-2": b"Email Address,ZB Status\nb@example.com,invalid",
+        }
+        self.requests_mock.get.side_effect = lambda url, params=None, **kwargs: MockResponse(
+            content=bodies[params["file_id"]], headers={"Content-Type": "text/csv"}
+        )
+        out = self._download_dir() / "merged.csv"
+
+        response = self.zero_bounce_client.get_file_sharded(["id-1", "id-2"], str(out))
+        self.assertEqual(response.local_file_path, str(out))
+        self.assertEqual(
+            out.read_bytes(), b"Email Address,ZB Status\na@example.com,valid\nb@example.com,invalid\n"
+        )
 
     def test_blank_file_id(self):
         with self.assertRaises(ZBClientException) as cm:
@@ -347,6 +1523,231 @@ class ZeroBounceTestCase(BaseTestCase):
         self.assertTrue(response.success)
         self.assertEqual(response.local_file_path, "results.txt")
 
+    def test_get_file_streams_to_disk_in_chunks(self):
+        body = b"email,status\n" + b"".join(
+            b"user%d@example.com,valid\n" % i for i in range(20000)
+        )
+        self.requests_mock.get.return_value = MockResponse(
+            content=body, headers={"Content-Type": "text/csv"}
+        )
+        out = Path(tempfile.mkdtemp()) / "nested" / "results.csv"
+        self.addCleanup(shutil.rmtree, out.parent.parent)
+
+        response = self.zero_bounce_client.get_file("file-id", str(out))
+        self.assertEqual(response.local_file_path, str(out))
+        self.assertEqual(out.read_bytes(), body)
+        self.assertFalse(Path(str(out) + ".part").exists())
+        self.assertTrue(self.requests_mock.get.call_args.kwargs["stream"])
+
+    def test_get_file_error_keeps_existing_file(self):
+        self.requests_mock.get.return_value = MockResponse(
+            content=b'  {"success": false, "message": "File cannot be found."}',
+            headers={"Content-Type": "text/plain"},
+        )
+        out = Path(tempfile.mkdtemp()) / "results.csv"
+        self.addCleanup(shutil.rmtree, out.parent)
+        out.write_bytes(b"previous results")
+
+        with self.assertRaises(ZBApiException) as cm:
+            self.zero_bounce_client.get_file("file-id", str(out))
+        self.assertEqual(str(cm.exception), "File cannot be found.")
+        self.assertEqual(out.read_bytes(), b"previous results")
+        self.assertEqual(os.listdir(out.parent), ["results.csv"])
+
+    @staticmethod
+    def _counting_loads(calls):
+        def loads(body):
+            calls.append(body)
+            return json.loads(body)
+        return loads
+
+    def test_get_file_error_body_decoded_once(self):
+        calls = []
+        client = ZeroBounce("dummy_key", json_loads=self._counting_loads(calls))
+        self.requests_mock.get.return_value = MockResponse(
+            content=b'{"success": "False", "message": ["File not ready"]}',
+            headers={"Content-Type": "application/json"},
+            status_code=400,
+        )
+        out = self._download_dir() / "results.csv"
+
+        with self.assertRaises(ZBApiException) as cm:
+            client.get_file("file-id", str(out))
+        self.assertEqual(str(cm.exception), "File not ready")
+        self.assertEqual(len(calls), 1)
+
+        calls.clear()
+        self.requests_mock.get.return_value = MockResponse(content=b"email,status\n", headers={"Content-Type": "text/csv"})
+        client.get_file("file-id", str(out))
+        self.assertEqual(calls, [])
+
+    def test_json_loads_decodes_api_responses(self):
+        calls = []
+        client = ZeroBounce("dummy_key", json_loads=self._counting_loads(calls))
+        self.requests_mock.get.return_value = MockResponse({"Credits": "100"})
+        self.assertEqual(client.get_credits().credits, "100")
+        self.assertEqual(len(calls), 1)
+
+    def test_loads_object_only_decodes_objects(self):
+        self.assertEqual(loads_object(b' \n{"a": 1}'), {"a": 1})
+        self.assertIsNone(loads_object(b"[1, 2]"))
+        self.assertIsNone(loads_object(b"{not json"))
+        self.assertIsNone(loads_object("email\n{}"))
+        self.assertIsNone(loads_object(b""))
+
+    def test_get_file_http_error(self):
+        self.requests_mock.get.return_value = MockResponse(
+            content=b"Bad Gateway", headers={"Content-Type": "text/html"}, status_code=502
+        )
+
+        with self.assertRaises(ZBApiException) as cm:
+            self.zero_bounce_client.get_file("file-id", "never_written.csv")
+        self.assertEqual(str(cm.exception), "Bad Gateway")
+        self.assertFalse(Path("never_written.csv.part").exists())
+
+    def _download_dir(self):
+        directory = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, directory)
+        return directory
+
+    def test_get_file_resume_appends_range(self):
+        out = self._download_dir() / "results.csv"
+        Path(str(out) + ".part").write_bytes(b"email,st")
+        self.requests_mock.get.return_value = MockResponse(
+            content=b"atus\na@example.com,valid\n",
+            headers={"Content-Type": "text/csv", "Content-Range": "bytes 8-32/33"},
+            status_code=206,
+        )
+
+        self.zero_bounce_client.get_file("file-id", str(out), resume=True, verify=True)
+        self.assertEqual(out.read_bytes(), b"email,status\na@example.com,valid\n")
+        self.assertEqual(self.requests_mock.get.call_args.kwargs["headers"], {
+            "Accept-Encoding": "identity",
+            "Range": "bytes=8-",
+        })
+
+    def test_get_file_resume_restarts_when_range_ignored(self):
+        out = self._download_dir() / "results.csv"
+        Path(str(out) + ".part").write_bytes(b"stale")
+        self.requests_mock.get.return_value = MockResponse(
+            content=b"email,status\n", headers={"Content-Type": "text/csv"}
+        )
+
+        self.zero_bounce_client.get_file("file-id", str(out), resume=True)
+        self.assertEqual(out.read_bytes(), b"email,status\n")
+
+    def test_get_file_resume_retries_without_range_on_416(self):
+        out = self._download_dir() / "results.csv"
+        Path(str(out) + ".part").write_bytes(b"too long already")
+        self.requests_mock.get.side_effect = [
+            MockResponse(content=b"", headers={"Content-Type": "text/plain"}, status_code=416),
+            MockResponse(content=b"email,status\n", headers={"Content-Type": "text/csv"}),
+        ]
+
+        self.zero_bounce_client.scoring_get_file("file-id", str(out), resume=True)
+        self.assertEqual(out.read_bytes(), b"email,status\n")
+        self.assertNotIn("Range", self.requests_mock.get.call_args.kwargs["headers"])
+
+    def test_get_file_unexpected_partial_response(self):
+        out = self._download_dir() / "results.csv"
+        self.requests_mock.get.return_value = MockResponse(
+            content=b"atus\n", headers={"Content-Type": "text/csv", "Content-Range": "bytes 8-12/13"}, status_code=206
+        )
+
+        # no Range was sent, without resume or without a part file: nothing to restart
+        for resume in (False, True):
+            with self.assertRaises(ZBApiException) as cm:
+                self.zero_bounce_client.get_file("file-id", str(out), resume=resume)
+            self.assertEqual(str(cm.exception), "Unexpected partial getfile response. Status code 206")
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+        self.assertFalse(out.exists())
+
+    def test_get_file_resume_keeps_part_on_failure(self):
+        out = self._download_dir() / "results.csv"
+
+        class BrokenResponse(MockResponse):
+            def iter_content(self, chunk_size=1, decode_unicode=False):
+                yield b"email,status\n"
+                raise ConnectionError("connection reset")
+
+        self.requests_mock.get.return_value = BrokenResponse(
+            content=b"", headers={"Content-Type": "text/csv"}
+        )
+        with self.assertRaises(ConnectionError):
+            self.zero_bounce_client.get_file("file-id", str(out), resume=True)
+        self.assertFalse(out.exists())
+        self.assertEqual(Path(str(out) + ".part").read_bytes(), b"email,status\n")
+
+    def test_get_file_verify_detects_short_body(self):
+        out = self._download_dir() / "results.csv"
+        self.requests_mock.get.return_value = MockResponse(
+            content=b"email,status\n",
+            headers={"Content-Type": "text/csv", "Content-Length": "100"},
+        )
+
+        with self.assertRaises(ZBApiException) as cm:
+            self.zero_bounce_client.get_file("file-id", str(out), verify=True)
+        self.assertEqual(str(cm.exception), "Incomplete getfile download: received 13 of 100 bytes")
+        self.assertFalse(out.exists())
+
+    def test_iter_file_results_yields_typed_rows(self):
+        self.requests_mock.get.return_value = MockResponse(
+            content=b'\xef\xbb\xbf"Name","Email Address","ZB Status","ZB Sub Status","ZB Free Email","ZB MX Found","ZB Did You Mean"\r\n'
+                    b'"Zero","valid@example.com","valid","","False","true",""\r\n'
+                    b'"Multi\r\nLine","invalid@example.com","invalid","mailbox_not_found","true","false",""\r\n'
+                    b'"Bounce","catchall@example.com","catch-all","","",""',
+            headers={"Content-Type": "application/octet-stream"},
+        )
+        self.zero_bounce_client.DOWNLOAD_CHUNK_SIZE = 7
+
+        rows = list(self.zero_bounce_client.iter_file_results("file-id"))
+        self.assertEqual([r.email_address for r in rows], [
+            "valid@example.com", "invalid@example.com", "catchall@example.com",
+        ])
+        self.assertEqual(rows[0].status, ZBValidateStatus.valid)
+        self.assertEqual(rows[0].sub_status, ZBValidateSubStatus.none)
+        self.assertIs(rows[0].free_email, False)
+        self.assertIs(rows[0].mx_found, True)
+        self.assertEqual(rows[1].sub_status, ZBValidateSubStatus.mailbox_not_found)
+        self.assertEqual(rows[1].columns["Name"], "Multi\r\nLine")
+        self.assertEqual(rows[2].status, ZBValidateStatus.catch_all)
+        self.assertIsNone(rows[2].free_email)
+        self.assertTrue(self.requests_mock.get.call_args.kwargs["stream"])
+
+    def test_iter_file_results_email_column(self):
+        self.requests_mock.get.return_value = MockResponse(
+            content=b"id,mail,ZB Status\n1,a@example.com,do_not_mail\n",
+            headers={"Content-Type": "text/csv"},
+        )
+
+        rows = list(self.zero_bounce_client.iter_file_results("file-id", email_address_column=2))
+        self.assertEqual(rows[0].email_address, "a@example.com")
+        self.assertEqual(rows[0].status, ZBValidateStatus.do_not_mail)
+
+    def test_iter_file_results_splits_records_on_newlines_only(self):
+        self.requests_mock.get.return_value = MockResponse(
+            content=b"name,Email Address,ZB Status\r\n"
+                    b"Tab\x0bbed \xe2\x80\xa8name\x1c,a@example.com,valid\r\n"
+                    b"Form\x0cfeed\xc2\x85,b@example.com,invalid\n",
+            headers={"Content-Type": "text/csv"},
+        )
+        self.zero_bounce_client.DOWNLOAD_CHUNK_SIZE = 5
+
+        rows = list(self.zero_bounce_client.iter_file_results("file-id"))
+        self.assertEqual([r.email_address for r in rows], ["a@example.com", "b@example.com"])
+        self.assertEqual([r.status for r in rows], [ZBValidateStatus.valid, ZBValidateStatus.invalid])
+        self.assertEqual(rows[0].columns["name"], "Tab\x0bbed \u2028name\x1c")
+
+    def test_iter_file_results_raises_json_error(self):
+        self.requests_mock.get.return_value = MockResponse({
+            "success": False,
+            "message": "File cannot be found.",
+        })
+
+        with self.assertRaises(ZBApiException) as cm:
+            list(self.zero_bounce_client.iter_file_results("file-id"))
+        self.assertEqual(str(cm.exception), "File cannot be found.")
+
     def test_get_file_with_options_query_params(self):
         self.requests_mock.get.return_value = MockResponse(
             json_data=None,
@@ -630,6 +2031,89 @@ class ZeroBounceTestCase(BaseTestCase):
         self.assertIsInstance(response.confidence, ZBConfidence)
         self.assertEqual(response.confidence, ZBConfidence.high)
 
+    def test_domain_format_cache_answers_find_email_format_locally(self):
+        self.requests_mock.get.return_value = MockResponse({
+            "domain": "acmestores.com",
+            "company_name": "Acme Corp",
+            "format": "first.last",
+            "confidence": "high",
+            "did_you_mean": "",
+            "failure_reason": "",
+            "other_domain_formats": [
+                {"format": "flast", "confidence": "low"},
+                {"format": "first", "confidence": "high"},
+            ],
+        })
+        cache = ZBDomainFormatCache()
+        client = ZeroBounce("dummy_key", domain_format_cache=cache)
+
+        response = client.find_email_format(first_name="José", last_name="O'Brien", company_name="Acme  Corp")
+        self.assertEqual(self.requests_mock.get.call_count, 1)
+        self.assertNotIn("first_name", self.requests_mock.get.call_args.kwargs["params"])
+        self.assertEqual(response.email, "jose.obrien@acmestores.com")
+        self.assertEqual(response.email_confidence, ZBConfidence.high)
+        self.assertTrue(response.decided_locally)
+
+        # no last name: the best other format that can be built is used
+        response = client.find_email_format(first_name="Jane", domain="AcmeStores.com")
+        self.assertEqual(response.email, "jane@acmestores.com")
+        self.assertEqual(client.find_domain(company_name="acme corp").format, "first.last")
+        self.assertEqual(self.requests_mock.get.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses, cache.local_answers), (2, 1, 2))
+
+    def test_domain_format_cache_falls_back_below_min_confidence(self):
+        domain_response = MockResponse({
+            "domain": "example.com",
+            "format": "first.last",
+            "confidence": "medium",
+            "other_domain_formats": [],
+        })
+        email_response = MockResponse({"email": "john.doe@example.com", "email_confidence": "medium", "domain": "example.com"})
+        self.requests_mock.get.side_effect = [domain_response, email_response, email_response]
+        client = ZeroBounce("dummy_key", domain_format_cache=ZBDomainFormatCache())
+
+        for _ in range(2):
+            response = client.find_email_format(first_name="John", last_name="Doe", domain="example.com")
+            self.assertFalse(response.decided_locally)
+        self.assertEqual(self.requests_mock.get.call_count, 3)
+        self.assertEqual(self.requests_mock.get.call_args.kwargs["params"]["first_name"], "John")
+
+        lenient = ZBDomainFormatCache(min_confidence=ZBConfidence.medium)
+        self.requests_mock.get.side_effect = [domain_response, email_response]
+        client = ZeroBounce("dummy_key", domain_format_cache=lenient)
+        self.assertEqual(client.find_email_format(first_name="John", last_name="Doe", domain="example.com").email, "john.doe@example.com")
+        self.assertEqual(client.find_email_format(first_name="John", domain="example.com").decided_locally, False)
+
+    def test_domain_format_cache_prefetch_failure_falls_back(self):
+        self.requests_mock.get.side_effect = [
+            MockResponse({"message": "Service unavailable for domain search"}),
+            MockResponse({"email": "john.doe@example.com", "email_confidence": "high", "domain": "example.com"}),
+            requests.exceptions.ConnectionError("reset"),
+            MockResponse({"email": "jane.doe@example.com", "email_confidence": "high", "domain": "example.com"}),
+        ]
+        client = ZeroBounce("dummy_key", domain_format_cache=ZBDomainFormatCache())
+
+        response = client.find_email_format(first_name="John", last_name="Doe", domain="example.com")
+        self.assertEqual(response.email, "john.doe@example.com")
+        self.assertFalse(response.decided_locally)
+        self.assertEqual(self.requests_mock.get.call_args.kwargs["params"]["first_name"], "John")
+        response = client.find_email_format(first_name="Jane", last_name="Doe", domain="example.com")
+        self.assertEqual(response.email, "jane.doe@example.com")
+        self.assertEqual(self.requests_mock.get.call_count, 4)
+
+    def test_domain_format_cache_expires_failures_sooner(self):
+        cache = ZBDomainFormatCache(failure_ttl=timedelta(0))
+        self.requests_mock.get.return_value = MockResponse({
+            "domain": "example.com", "format": "unknown", "confidence": "undetermined", "failure_reason": "No format",
+        })
+        client = ZeroBounce("dummy_key", domain_format_cache=cache)
+        client.find_domain(domain="example.com")
+        client.find_domain(domain="example.com")
+        self.assertEqual(self.requests_mock.get.call_count, 2)
+        self.assertEqual(len(cache), 0)
+        with self.assertRaises(ZBClientException):
+            ZBDomainFormatCache(min_confidence=ZBConfidence.unknown)
+
     def test_gets_pass_timeout(self):
         self.requests_mock.get.return_value = MockResponse({'a': 'b'})
 
@@ -644,4 +2128,454 @@ class ZeroBounceTestCase(BaseTestCase):
         client = ZeroBounce("dummy_key", timeout=timedelta(milliseconds=123))
         response = client._post("https://example.com", ZBResponse)
         self.assertEqual(response.a, 'b')
-        self.requests_mock.post.assert_called_with('https://example.com', data=None, json=None, files=None, timeout=0.123)
+        self.requests_mock.post.assert_called_with(
+            'https://example.com', data=None, json=None, files=None, headers=None, timeout=0.123
+        )
+
+
+class AsyncZeroBounceTestCase(IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.requests = []
+        self.responses = []
+
+        def handler(request):
+            self.requests.append(request)
+            response = self.responses.pop(0)
+            return response(request) if callable(response) else response
+
+        async def async_handler(request):
+            response = handler(request)
+            return await response if asyncio.iscoroutine(response) else response
+
+        self.transport = httpx.MockTransport(async_handler)
+        self.zero_bounce_client = AsyncZeroBounce("dummy_key", transport=self.transport)
+
+    async def asyncTearDown(self):
+        await self.zero_bounce_client.aclose()
+
+    async def test_validate_valid(self):
+        self.responses.append(httpx.Response(200, json={
+            "address": "invalid@example.com",
+            "status": "invalid",
+            "sub_status": "mailbox_not_found",
+            "processed_at": "2023-03-28 12:30:18.990",
+        }))
+
+        response = await self.zero_bounce_client.validate("invalid@example.com")
+        self.assertEqual(response.status, ZBValidateStatus.invalid)
+        self.assertEqual(response.sub_status, ZBValidateSubStatus.mailbox_not_found)
+        self.assertEqual(response.processed_at, datetime(2023, 3, 28, 12, 30, 18, 990000))
+        url = self.requests[0].url
+        self.assertEqual(str(url.copy_with(query=None)), "https://api.zerobounce.net/v2/validate")
+        self.assertEqual(dict(url.params), {"email": "invalid@example.com", "api_key": "dummy_key"})
+
+    async def test_response_contains_error(self):
+        self.responses.append(httpx.Response(200, json={
+            "error": "Invalid API key or your account ran out of credits",
+        }))
+
+        with self.assertRaises(ZBApiException) as cm:
+            await self.zero_bounce_client.get_credits()
+        self.assertEqual(str(cm.exception), "Invalid API key or your account ran out of credits")
+
+    async def test_validate_batch_valid(self):
+        self.responses.append(httpx.Response(200, json={
+            "email_batch": [{"address": "valid@example.com", "status": "valid", "sub_status": ""}],
+            "errors": [],
+        }))
+
+        response = await self.zero_bounce_client.validate_batch([ZBValidateBatchElement("valid@example.com")])
+        self.assertEqual(response.email_batch[0].status, ZBValidateStatus.valid)
+        self.assertEqual(json.loads(self.requests[0].content), {
+            "api_key": "dummy_key",
+            "email_batch": [{"email_address": "valid@example.com"}],
+        })
+
+    async def test_validate_batch_compact(self):
+        self.responses.append(httpx.Response(200, json={
+            "email_batch": [{"address": "valid@example.com", "status": "valid", "sub_status": ""}],
+            "errors": [],
+        }))
+
+        response = await self.zero_bounce_client.validate_batch(
+            [ZBValidateBatchElement("valid@example.com")], compact=True
+        )
+        self.assertIsInstance(response.email_batch[0], ZBCompactValidateBatchEmail)
+        self.assertEqual(response.email_batch[0].status, ZBValidateStatus.valid)
+
+    async def test_validate_lazy(self):
+        self.responses.append(httpx.Response(200, json={"address": "valid@example.com", "status": "valid"}))
+
+        response = await self.zero_bounce_client.validate("valid@example.com", lazy=True)
+        self.assertIsInstance(response, ZBLazyValidateResponse)
+        self.assertEqual(response.status, ZBValidateStatus.valid)
+
+    async def test_validate_batch_with_pre_filter(self):
+        self.responses.append(httpx.Response(200, json={
+            "email_batch": [{"address": "valid@example.com", "status": "valid", "sub_status": ""}],
+            "errors": [],
+        }))
+        client = AsyncZeroBounce("dummy_key", transport=self.transport, pre_filter=ZBPreFilter())
+        self.addAsyncCleanup(client.aclose)
+
+        response = await client.validate_batch(
+            [ZBValidateBatchElement("valid@example.com"), ZBValidateBatchElement("@example.com")]
+        )
+        self.assertEqual(json.loads(self.requests[0].content)["email_batch"], [{"email_address": "valid@example.com"}])
+        self.assertEqual([r.decided_locally for r in response.email_batch], [False, True])
+        self.assertTrue((await client.validate("nope")).decided_locally)
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_pre_filter_lookups_do_not_block_the_loop(self):
+        def slow_resolver(domain):
+            time.sleep(0.3)
+            return [], None
+
+        pre_filter = ZBPreFilter(mx_screen=ZBMxPreScreen(slow_resolver))
+        client = AsyncZeroBounce("dummy_key", transport=self.transport, pre_filter=pre_filter)
+        self.addAsyncCleanup(client.aclose)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        ticking = asyncio.ensure_future(ticker())
+        started = time.monotonic()
+        results = await asyncio.gather(
+            client.validate("a@one.example"),
+            client.validate("b@two.example"),
+            client.validate_batch([ZBValidateBatchElement("c@three.example")]),
+        )
+        elapsed = time.monotonic() - started
+        ticking.cancel()
+
+        self.assertTrue(results[0].decided_locally)
+        self.assertTrue(results[2].email_batch[0].decided_locally)
+        self.assertLess(elapsed, 0.6)  # the lookups overlap instead of running one after the other
+        self.assertGreaterEqual(ticks, 5)
+        self.assertEqual(self.requests, [])
+
+    async def test_concurrent_validates_share_client(self):
+        self.responses.extend(
+            httpx.Response(200, json={"address": f"user{i}@example.com", "status": "valid"})
+            for i in range(50)
+        )
+
+        responses = await asyncio.gather(*(
+            self.zero_bounce_client.validate(f"user{i}@example.com") for i in range(50)
+        ))
+        self.assertEqual(len(responses), 50)
+        self.assertTrue(all(r.status == ZBValidateStatus.valid for r in responses))
+
+    async def test_validate_many_keeps_order(self):
+        def answer(request):
+            emails = [e["email_address"] for e in json.loads(request.content)["email_batch"]]
+            return httpx.Response(200, json={
+                "email_batch": [{"address": e, "status": "valid"} for e in reversed(emails)],
+                "errors": [],
+            })
+        self.responses.extend(answer for _ in range(3))
+
+        emails = [f"user{i}@example.com" for i in range(201)]
+        results = [r async for r in self.zero_bounce_client.validate_many(emails, concurrency=3)]
+        self.assertEqual([r.address for r in results], emails)
+
+    async def test_validate_many_sends_duplicates_once(self):
+        def answer(request):
+            emails = [e["email_address"] for e in json.loads(request.content)["email_batch"]]
+            return httpx.Response(200, json={
+                "email_batch": [{"address": e, "status": "valid"} for e in emails],
+                "errors": [],
+            })
+        self.responses.append(answer)
+
+        emails = ["a@example.com", "b@example.com", "A@EXAMPLE.com ", "a@example.com"]
+        results = [
+            r async for r in self.zero_bounce_client.validate_many(emails, deduplicator=ZBDeduplicator())
+        ]
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(len(json.loads(self.requests[0].content)["email_batch"]), 3)
+        self.assertEqual([r.address for r in results], ["a@example.com", "b@example.com", "A@EXAMPLE.com ", "a@example.com"])
+        self.assertIs(results[3], results[0])
+
+    async def test_find_email_format_uses_domain_format_cache(self):
+        self.responses.append(httpx.Response(200, json={
+            "domain": "example.com",
+            "format": "flast",
+            "confidence": "high",
+            "other_domain_formats": [],
+        }))
+        async with AsyncZeroBounce(
+            "dummy_key", transport=self.transport, domain_format_cache=ZBDomainFormatCache()
+        ) as client:
+            emails = [
+                (await client.find_email_format(first_name=first, last_name="Doe", domain="example.com")).email
+                for first in ("John", "Mary")
+            ]
+        self.assertEqual(emails, ["jdoe@example.com", "mdoe@example.com"])
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_find_email_format_prefetch_failure_falls_back(self):
+        self.responses.extend([
+            httpx.Response(200, json={"message": "Service unavailable for domain search"}),
+            httpx.Response(200, json={"email": "john.doe@example.com", "email_confidence": "high", "domain": "example.com"}),
+        ])
+        async with AsyncZeroBounce(
+            "dummy_key", transport=self.transport, domain_format_cache=ZBDomainFormatCache()
+        ) as client:
+            response = await client.find_email_format(first_name="John", last_name="Doe", domain="example.com")
+        self.assertEqual(response.email, "john.doe@example.com")
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_validate_coalesces_concurrent_calls(self):
+        release = asyncio.Event()
+
+        async def answer(request):
+            await release.wait()
+            return httpx.Response(200, json={"address": "same@example.com", "status": "invalid"})
+        self.responses.append(answer)
+
+        calls = [asyncio.ensure_future(self.zero_bounce_client.validate("same@example.com")) for _ in range(20)]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*calls)
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(r.status == ZBValidateStatus.invalid for r in results))
+
+    async def test_send_file_uses_bulk_url(self):
+        self.responses.append(httpx.Response(200, json={
+            "success": True,
+            "message": "File Accepted",
+            "file_name": "emails.csv",
+            "file_id": "5e87c21f-45b2-4803-8daf-307f29fa7340",
+        }))
+
+        response = await self.zero_bounce_client.send_file_stream(
+            io.BytesIO(b"a@b.com\n"), "emails.csv", 1, allow_phase_2=True
+        )
+        self.assertTrue(response.success)
+        self.assertEqual(response.file_id, "5e87c21f-45b2-4803-8daf-307f29fa7340")
+        self.assertEqual(str(self.requests[0].url), "https://bulkapi.zerobounce.net/v2/sendfile")
+        self.assertIn(b'name="allow_phase_2"\r\n\r\ntrue', self.requests[0].content)
+
+    async def test_send_file_stream_reports_progress(self):
+        self.responses.append(httpx.Response(200, json={
+            "success": True,
+            "message": "File Accepted",
+            "file_name": "emails.csv",
+            "file_id": "5e87c21f-45b2-4803-8daf-307f29fa7340",
+        }))
+        content = b"a@example.com\n" * 10000
+        progress = []
+
+        await self.zero_bounce_client.send_file_stream(
+            io.BytesIO(content), "emails.csv", 1, progress_callback=lambda sent, total: progress.append((sent, total))
+        )
+        request = self.requests[0]
+        self.assertEqual(int(request.headers["Content-Length"]), len(request.content))
+        self.assertIn(content, request.content)
+        self.assertEqual(progress[-1], (len(request.content), len(request.content)))
+
+    async def test_send_and_get_file_sharded(self):
+        for index in range(2):
+            self.responses.append(httpx.Response(200, json={"success": True, "file_id": f"id-{index}"}))
+        response = await self.zero_bounce_client.scoring_send_file_sharded(
+            io.BytesIO(b"a@example.com\nb@example.com\n"), 1, shards=2, file_name="big.csv"
+        )
+        self.assertEqual(sorted(response.file_ids), ["id-0", "id-1"])
+        self.assertTrue(all(r.url.path == "/v2/scoring/sendfile" for r in self.requests))
+
+        self.responses.append(httpx.Response(200, content=b"email,score\na@example.com,10\n"))
+        self.responses.append(httpx.Response(200, content=b"email,score\nb@example.com,9\n"))
+        out = Path(tempfile.mkdtemp()) / "merged.csv"
+        self.addCleanup(shutil.rmtree, out.parent)
+        await self.zero_bounce_client.scoring_get_file_sharded(["id-0", "id-1"], str(out), concurrency=1)
+        self.assertEqual(out.read_bytes(), b"email,score\na@example.com,10\nb@example.com,9\n")
+
+    async def test_sharding_and_merging_do_not_block_the_loop(self):
+        iter_csv_records = _zb_csv_shards.iter_csv_records
+
+        def slow_iter_csv_records(stream, *args):
+            time.sleep(0.2)
+            return iter_csv_records(stream, *args)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        for index in range(2):
+            self.responses.append(httpx.Response(200, json={"success": True, "file_id": f"id-{index}"}))
+        self.responses.append(httpx.Response(200, content=b"email\na@example.com\n"))
+        self.responses.append(httpx.Response(200, content=b"email\nb@example.com\n"))
+        out = Path(tempfile.mkdtemp()) / "merged.csv"
+        self.addCleanup(shutil.rmtree, out.parent)
+
+        ticking = asyncio.ensure_future(ticker())
+        with mock.patch.object(_zb_csv_shards, "iter_csv_records", slow_iter_csv_records):
+            await self.zero_bounce_client.send_file_sharded(
+                io.BytesIO(b"email\na@example.com\nb@example.com\n"), 1, shards=2, has_header_row=True
+            )
+            await self.zero_bounce_client.get_file_sharded(["id-0", "id-1"], str(out))
+        ticking.cancel()
+
+        self.assertEqual(out.read_bytes(), b"email\na@example.com\nb@example.com\n")
+        self.assertGreaterEqual(ticks, 10)  # three 0.2 s copies ran beside the ticker
+
+    async def test_file_status_many(self):
+        for file_id in ("f1", "f2"):
+            self.responses.append(httpx.Response(200, json={"success": True, "file_id": file_id}))
+
+        statuses = await self.zero_bounce_client.file_status_many(["f1", "f2"], concurrency=1)
+        self.assertEqual({file_id: status.file_id for file_id, status in statuses.items()}, {"f1": "f1", "f2": "f2"})
+        self.assertEqual(self.requests[0].url.path, "/v2/filestatus")
+
+    async def test_rate_limiter_shared_with_tasks(self):
+        limiter = ZBRateLimiter(validate=100, burst=timedelta(0))
+        client = AsyncZeroBounce("dummy_key", transport=self.transport, rate_limiter=limiter)
+        self.addAsyncCleanup(client.aclose)
+        for index in range(4):
+            self.responses.append(httpx.Response(200, json={"address": f"u{index}@example.com", "status": "valid"}))
+
+        started = time.monotonic()
+        await asyncio.gather(*(client.validate(f"u{index}@example.com") for index in range(4)))
+        self.assertGreaterEqual(time.monotonic() - started, 0.025)
+        self.assertEqual(limiter.queue_depth(), 0)
+
+    async def test_retry_transport_error(self):
+        policy = ZBRetryPolicy(backoff=timedelta(milliseconds=1))
+        client = AsyncZeroBounce("dummy_key", transport=self.transport, retry_policy=policy)
+        self.addAsyncCleanup(client.aclose)
+
+        def reset(request):
+            raise httpx.ConnectError("connection reset", request=request)
+
+        self.responses.extend([reset, httpx.Response(502), httpx.Response(200, json={"Credits": "7"})])
+        self.assertEqual((await client.get_credits()).credits, "7")
+        self.assertEqual(len(self.requests), 3)
+        self.assertEqual(policy.retry_count, 2)
+
+    async def test_failover_to_healthy_region(self):
+        failover = ZBRegionFailover(hedge_validate=True, hedge_after=timedelta(milliseconds=10))
+        client = AsyncZeroBounce("dummy_key", transport=self.transport, failover=failover)
+        self.addAsyncCleanup(client.aclose)
+
+        async def slow(request):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={"address": "valid@example.com", "status": "unknown"})
+
+        self.responses.extend([httpx.Response(502), httpx.Response(200, json={"Credits": "5"})])
+        self.assertEqual((await client.get_credits()).credits, "5")
+        self.assertEqual([r.url.host for r in self.requests], ["api-us.zerobounce.net", "api-eu.zerobounce.net"])
+        self.assertEqual(failover.failovers, 1)
+
+        self.responses.extend([slow, httpx.Response(200, json={"address": "valid@example.com", "status": "valid"})])
+        self.assertEqual((await client.validate("valid@example.com")).status, ZBValidateStatus.valid)
+        self.assertEqual(failover.hedges, 1)
+
+    async def test_hedged_validate_fast_failure_fails_over(self):
+        limiter = ZBRateLimiter(validate=1000)
+        failover = ZBRegionFailover(failure_threshold=1, hedge_validate=True, hedge_after=timedelta(seconds=5))
+        client = AsyncZeroBounce("dummy_key", transport=self.transport, failover=failover, rate_limiter=limiter)
+        self.addAsyncCleanup(client.aclose)
+        self.responses.extend([
+            httpx.Response(503), httpx.Response(200, json={"address": "valid@example.com", "status": "valid"}),
+        ])
+
+        with mock.patch.object(limiter, "acquire_async", wraps=limiter.acquire_async) as acquire:
+            self.assertEqual((await client.validate("valid@example.com")).status, ZBValidateStatus.valid)
+        self.assertEqual([r.url.host for r in self.requests], ["api-us.zerobounce.net", "api-eu.zerobounce.net"])
+        self.assertEqual((failover.failovers, failover.hedges), (1, 0))
+        self.assertEqual(failover.state(failover.regions[0]), ZBRegionFailover.OPEN)
+        self.assertEqual(acquire.await_count, 2)
+
+    async def test_get_file_json_error(self):
+        self.responses.append(httpx.Response(200, json={
+            "success": False,
+            "message": "File cannot be found.",
+        }))
+
+        with self.assertRaises(ZBApiException) as cm:
+            await self.zero_bounce_client.scoring_get_file("invalid_file_id", "any_download_path")
+        self.assertEqual(str(cm.exception), "File cannot be found.")
+        self.assertEqual(self.requests[0].url.path, "/v2/scoring/getfile")
+
+    async def test_get_file_streams_to_disk(self):
+        body = b"email,status\n" + b"a@example.com,valid\n" * 5000
+        self.responses.append(httpx.Response(200, content=body, headers={"Content-Type": "text/csv"}))
+        out = Path(tempfile.mkdtemp()) / "results.csv"
+        self.addCleanup(shutil.rmtree, out.parent)
+
+        response = await self.zero_bounce_client.get_file("file-id", str(out))
+        self.assertEqual(response.local_file_path, str(out))
+        self.assertEqual(out.read_bytes(), body)
+
+    async def test_get_file_resume_appends_range(self):
+        out = Path(tempfile.mkdtemp()) / "results.csv"
+        self.addCleanup(shutil.rmtree, out.parent)
+        Path(str(out) + ".part").write_bytes(b"email,")
+        self.responses.append(httpx.Response(
+            206, content=b"status\n", headers={"Content-Type": "text/csv", "Content-Range": "bytes 6-12/13"}
+        ))
+
+        await self.zero_bounce_client.get_file("file-id", str(out), resume=True, verify=True)
+        self.assertEqual(out.read_bytes(), b"email,status\n")
+        self.assertEqual(self.requests[0].headers["Range"], "bytes=6-")
+
+    async def test_get_file_unexpected_partial_response(self):
+        out = Path(tempfile.mkdtemp()) / "results.csv"
+        self.addCleanup(shutil.rmtree, out.parent)
+        for _ in range(2):
+            self.responses.append(httpx.Response(
+                206, content=b"atus\n", headers={"Content-Type": "text/csv", "Content-Range": "bytes 8-12/13"}
+            ))
+
+        for resume in (False, True):
+            with self.assertRaises(ZBApiException) as cm:
+                await self.zero_bounce_client.get_file("file-id", str(out), resume=resume)
+            self.assertEqual(str(cm.exception), "Unexpected partial getfile response. Status code 206")
+        self.assertEqual(len(self.requests), 2)
+        self.assertNotIn("Range", self.requests[1].headers)
+        self.assertFalse(out.exists())
+
+    async def test_get_file_retries_transient_status(self):
+        policy = ZBRetryPolicy(backoff=timedelta(milliseconds=1))
+        client = AsyncZeroBounce("dummy_key", transport=self.transport, retry_policy=policy)
+        self.addAsyncCleanup(client.aclose)
+        out = Path(tempfile.mkdtemp()) / "results.csv"
+        self.addCleanup(shutil.rmtree, out.parent)
+        body = b"Email Address,ZB Status\na@example.com,valid\n"
+        self.responses.extend([
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            httpx.Response(200, content=body, headers={"Content-Type": "text/csv"}),
+            httpx.Response(503),
+            httpx.Response(200, content=body, headers={"Content-Type": "text/csv"}),
+        ])
+
+        await client.get_file("file-id", str(out))
+        self.assertEqual(out.read_bytes(), body)
+        rows = [row async for row in client.iter_file_results("file-id")]
+        self.assertEqual([row.email_address for row in rows], ["a@example.com"])
+        self.assertEqual(len(self.requests), 4)
+        self.assertEqual(policy.retry_count, 2)
+
+    async def test_iter_file_results(self):
+        self.responses.append(httpx.Response(
+            200, content=b"Email Address,ZB Status\na@example.com,invalid\n", headers={"Content-Type": "text/csv"}
+        ))
+
+        rows = [row async for row in self.zero_bounce_client.iter_file_results("file-id")]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0].email_address, "a@example.com")
+        self.assertEqual(rows[0].status, ZBValidateStatus.invalid)
+
+    async def test_find_domain_params_validated(self):
+        with self.assertRaises(ZBClientException):
+            await self.zero_bounce_client.find_domain()